@@ -0,0 +1,46 @@
+"""Add composite (session_id, event_type) index on events.
+
+Revision ID: a3b5c7d9e1f2
+Revises: f2a4c6e8b0d1
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3b5c7d9e1f2"
+down_revision = "f2a4c6e8b0d1"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_event_session_type"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    indexes = {idx["name"] for idx in inspector.get_indexes("events")}
+    if INDEX_NAME in indexes:
+        return
+    if conn.dialect.name == "postgresql":
+        # Build without locking writes to the append-only events table.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX_NAME,
+                "events",
+                ["session_id", "event_type"],
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index(INDEX_NAME, "events", ["session_id", "event_type"])
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    indexes = {idx["name"] for idx in inspector.get_indexes("events")}
+    if INDEX_NAME in indexes:
+        op.drop_index(INDEX_NAME, table_name="events")
@@ -0,0 +1,41 @@
+"""Add partial index for root message threads per session.
+
+Revision ID: b4c6d8e0f2a3
+Revises: a3b5c7d9e1f2
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b4c6d8e0f2a3"
+down_revision = "a3b5c7d9e1f2"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_thread_root_by_session"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    indexes = {idx["name"] for idx in inspector.get_indexes("message_threads")}
+    if INDEX_NAME not in indexes:
+        op.create_index(
+            INDEX_NAME,
+            "message_threads",
+            ["session_id", "created_at"],
+            postgresql_where=sa.text("parent_thread_id IS NULL"),
+            sqlite_where=sa.text("parent_thread_id IS NULL"),
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    indexes = {idx["name"] for idx in inspector.get_indexes("message_threads")}
+    if INDEX_NAME in indexes:
+        op.drop_index(INDEX_NAME, table_name="message_threads")
@@ -0,0 +1,40 @@
+"""Add (user_id, created_at) indexes to template drafts and proposals.
+
+Revision ID: c6e8a0b2d4f6
+Revises: b4c6d8e0f2a3
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c6e8a0b2d4f6"
+down_revision = "b4c6d8e0f2a3"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_template_drafts_user_created", "template_drafts"),
+    ("ix_template_proposals_user_created", "template_proposals"),
+)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    for index_name, table_name in INDEXES:
+        indexes = {idx["name"] for idx in inspector.get_indexes(table_name)}
+        if index_name not in indexes:
+            op.create_index(index_name, table_name, ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    for index_name, table_name in INDEXES:
+        indexes = {idx["name"] for idx in inspector.get_indexes(table_name)}
+        if index_name in indexes:
+            op.drop_index(index_name, table_name=table_name)
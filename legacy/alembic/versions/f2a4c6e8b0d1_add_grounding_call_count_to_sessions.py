@@ -0,0 +1,43 @@
+"""Add grounding_call_count to sessions.
+
+Revision ID: f2a4c6e8b0d1
+Revises: d7e8f9a0b1c2
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f2a4c6e8b0d1"
+down_revision = "d7e8f9a0b1c2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = {col["name"] for col in inspector.get_columns("sessions")}
+    if "grounding_call_count" not in columns:
+        op.add_column(
+            "sessions",
+            sa.Column("grounding_call_count", sa.Integer(), nullable=False, server_default="0"),
+        )
+        # Backfill from the event log so existing sessions keep their budget.
+        op.execute(
+            "UPDATE sessions SET grounding_call_count = ("
+            "SELECT COUNT(*) FROM events "
+            "WHERE events.session_id = sessions.id "
+            "AND events.event_type = 'web_grounding_called')"
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = {col["name"] for col in inspector.get_columns("sessions")}
+    if "grounding_call_count" in columns:
+        op.drop_column("sessions", "grounding_call_count")
@@ -16,6 +16,10 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from ..core.config import get_settings
 from ..core.db import init_db_schema
+from ..core.services.llm_utils import warm_instructor_client
+from ..core.services.strategy_packs import list_strategy_summaries
+from ..core.services.web_grounding import close_http_client
+from .middleware import GzipRequestMiddleware
 from .routers import admin as admin_router
 from .routers import facts as facts_router
 from .routers import knowledge_edges as knowledge_edges_router
@@ -43,7 +47,13 @@ async def lifespan(app: FastAPI):  # pragma: no cover
     if settings.env in {"dev", "test"}:
         logger.info("Initialising database schema…")
         await init_db_schema()
+    # Load and validate the strategy pack once so request paths hit warm caches.
+    list_strategy_summaries(enabled_only=True)
+    # Build the instructor client now so the first structured call skips the import.
+    if not warm_instructor_client():
+        logger.info("instructor is not installed; structured LLM calls will parse plain JSON.")
     yield
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
@@ -58,6 +68,8 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # The UI gzips large JSON bodies (e.g. intake submissions)
+    app.add_middleware(GzipRequestMiddleware)
     # Register routers
     app.include_router(sessions_router.router)
     app.include_router(kg_router.router)
@@ -0,0 +1,74 @@
+"""
+ASGI middleware for the API.
+
+``GzipRequestMiddleware`` inflates request bodies that clients send with
+``Content-Encoding: gzip`` so routers always see plain JSON. Starlette's
+``GZipMiddleware`` only compresses responses, hence this small
+counterpart for requests.
+"""
+from __future__ import annotations
+
+import zlib
+from typing import List
+
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Upper bound on an inflated request body; protects against decompression bombs.
+MAX_INFLATED_REQUEST_BYTES = 10 * 1024 * 1024
+
+
+class GzipRequestMiddleware:
+    """Decompress gzip-encoded request bodies before they reach the routers."""
+
+    def __init__(self, app: ASGIApp, max_size: int = MAX_INFLATED_REQUEST_BYTES) -> None:
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _is_gzip_encoded(scope):
+            await self.app(scope, receive, send)
+            return
+        chunks: List[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = inflater.decompress(b"".join(chunks), self.max_size + 1)
+        except zlib.error:
+            response = PlainTextResponse("Invalid gzip request body", status_code=400)
+            await response(scope, receive, send)
+            return
+        if len(body) > self.max_size or inflater.unconsumed_tail:
+            response = PlainTextResponse("Request body too large", status_code=413)
+            await response(scope, receive, send)
+            return
+        headers = [
+            (key, value)
+            for key, value in scope["headers"]
+            if key not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        delivered = False
+
+        async def inflated_receive() -> Message:
+            nonlocal delivered
+            if not delivered:
+                delivered = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(dict(scope, headers=headers), inflated_receive, send)
+
+
+def _is_gzip_encoded(scope: Scope) -> bool:
+    for key, value in scope["headers"]:
+        if key == b"content-encoding":
+            return value.strip().lower() == b"gzip"
+    return False
@@ -5,7 +5,9 @@ Provides endpoints for reviewing template proposals.
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
 
 from ..dependencies import CurrentUser, DatabaseSession
 from ...core.schemas import TemplateProposalOut, TemplateReviewRequest
@@ -19,9 +21,17 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 async def list_template_proposals(
     db: DatabaseSession,
     user: CurrentUser,
+    limit: int = Query(
+        templates_service.PROPOSAL_PAGE_SIZE, ge=1, le=500, description="Maximum rows to return."
+    ),
+    before_id: Optional[int] = Query(
+        None, description="Return proposals older than this proposal id."
+    ),
 ) -> list[TemplateProposalOut]:
-    """List all template proposals (admin)."""
-    proposals = await templates_service.list_all_template_proposals(db)
+    """List template proposals newest first, one keyset page at a time (admin)."""
+    proposals = await templates_service.list_all_template_proposals(
+        db, limit=limit, before_id=before_id
+    )
     return [TemplateProposalOut.model_validate(proposal) for proposal in proposals]
 
 
@@ -40,4 +50,4 @@ async def review_template_proposal(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     return TemplateProposalOut.model_validate(proposal)
-
+
@@ -24,9 +24,14 @@ async def list_facts(
     user: CurrentUser,
     session_id: Optional[int] = Query(None, description="Optional session filter."),
     scope: Optional[KnowledgeScope] = Query(None, description="Optional scope filter."),
+    subject_entity_id: Optional[list[int]] = Query(
+        None, description="Optional subject entity filter; repeat to match several."
+    ),
 ) -> list[FactOut]:
     """List facts for the current user."""
-    facts = await kg_service.list_facts(db, user.id, session_id=session_id, scope=scope)
+    facts = await kg_service.list_facts(
+        db, user.id, session_id=session_id, scope=scope, subject_entity_ids=subject_entity_id
+    )
     return [FactOut.model_validate(fact) for fact in facts]
 
 
@@ -5,7 +5,9 @@ Provides CRUD endpoints for relationships in the knowledge graph.
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
 
 from ..dependencies import CurrentUser, DatabaseSession
 from ...core.schemas import RelationshipCreate, RelationshipOut, RelationshipUpdate
@@ -19,9 +21,12 @@ router = APIRouter(prefix="/relationships", tags=["relationships"])
 async def list_relationships(
     db: DatabaseSession,
     user: CurrentUser,
+    entity_id: Optional[list[int]] = Query(
+        None, description="Only relationships with one of these as source or destination."
+    ),
 ) -> list[RelationshipOut]:
     """List relationships for the current user."""
-    relationships = await kg_service.list_relationships(db, user.id)
+    relationships = await kg_service.list_relationships(db, user.id, entity_ids=entity_id)
     return [RelationshipOut.model_validate(rel) for rel in relationships]
 
 
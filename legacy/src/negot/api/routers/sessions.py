@@ -7,10 +7,13 @@ contract outline.
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Path
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Path, Query
 from fastapi.responses import StreamingResponse
 
 from ..dependencies import CurrentUser, DatabaseSession
+from ...core.models import EventType
 from ...core.services import sessions as sessions_service
 from ...core.schemas import (
     CaseSnapshotOut,
@@ -38,6 +41,7 @@ from ...core.schemas import (
     StrategyExecutionOut,
     StrategyExecutionRequest,
     StrategySelectionOut,
+    StrategyStateOut,
 )
 
 
@@ -138,9 +142,21 @@ async def list_session_events(
     db: DatabaseSession,
     user: CurrentUser,
     session_id: int = Path(..., description="Identifier of the session."),
+    after_id: Optional[int] = Query(None, description="Return events after this event id."),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum events to return."),
+    event_type: Optional[EventType] = Query(None, description="Only return events of this type."),
+    order: Literal["asc", "desc"] = Query("asc", description="Sort by event id."),
 ) -> list[SessionEventOut]:
     """List events for debugging and orchestration tracing."""
-    events = await sessions_service.list_session_events(db, user, session_id)
+    events = await sessions_service.list_session_events(
+        db,
+        user,
+        session_id,
+        after_id=after_id,
+        limit=limit,
+        event_type=event_type,
+        newest_first=order == "desc",
+    )
     return [SessionEventOut.model_validate(event) for event in events]
 
 
@@ -262,6 +278,23 @@ async def get_latest_execution(
     return StrategyExecutionOut.model_validate(execution)
 
 
+@router.get("/{session_id}/strategy/state", response_model=StrategyStateOut)
+async def get_strategy_state(
+    db: DatabaseSession,
+    user: CurrentUser,
+    session_id: int = Path(..., description="Identifier of the session."),
+) -> StrategyStateOut:
+    """Get the case snapshot, latest strategy selection and latest execution together."""
+    snapshot, selection, execution = await sessions_service.get_strategy_state(
+        db, user, session_id
+    )
+    return StrategyStateOut(
+        case_snapshot=CaseSnapshotOut.model_validate(snapshot),
+        strategy_selection=StrategySelectionOut.model_validate(selection) if selection else None,
+        latest_execution=StrategyExecutionOut.model_validate(execution) if execution else None,
+    )
+
+
 @router.post("/{session_id}/end", response_model=EndSessionResponse)
 async def end_session(
     db: DatabaseSession,
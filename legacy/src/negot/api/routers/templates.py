@@ -7,10 +7,17 @@ hard‑coded in this MVP but would typically be stored in a database.
 """
 from __future__ import annotations
 
-from fastapi import APIRouter
+from typing import Optional
+
+from fastapi import APIRouter, Query
 
 from ..dependencies import CurrentUser, DatabaseSession
-from ...core.schemas import TemplateDraftOut, TemplateProposalCreate, TemplateProposalOut
+from ...core.schemas import (
+    TemplateDraftOut,
+    TemplateProposalCreate,
+    TemplateProposalOut,
+    TemplateStateOut,
+)
 from ...core.services import templates as templates_service
 
 router = APIRouter(prefix="/templates", tags=["templates"])
@@ -26,9 +33,11 @@ async def get_templates() -> list[dict[str, str]]:
 async def list_drafts(
     db: DatabaseSession,
     user: CurrentUser,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum rows to return."),
+    offset: int = Query(0, ge=0, description="Number of rows to skip."),
 ) -> list[TemplateDraftOut]:
     """List template drafts for the current user."""
-    drafts = await templates_service.list_template_drafts(db, user.id)
+    drafts = await templates_service.list_template_drafts(db, user.id, limit=limit, offset=offset)
     return [TemplateDraftOut.model_validate(draft) for draft in drafts]
 
 
@@ -36,12 +45,33 @@ async def list_drafts(
 async def list_proposals(
     db: DatabaseSession,
     user: CurrentUser,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum rows to return."),
+    offset: int = Query(0, ge=0, description="Number of rows to skip."),
 ) -> list[TemplateProposalOut]:
     """List template proposals for the current user."""
-    proposals = await templates_service.list_template_proposals(db, user.id)
+    proposals = await templates_service.list_template_proposals(
+        db, user.id, limit=limit, offset=offset
+    )
     return [TemplateProposalOut.model_validate(proposal) for proposal in proposals]
 
 
+@router.get("/state", response_model=TemplateStateOut)
+async def get_template_state(
+    db: DatabaseSession,
+    user: CurrentUser,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum rows to return."),
+    offset: int = Query(0, ge=0, description="Number of rows to skip."),
+) -> TemplateStateOut:
+    """Return the current user's drafts and proposals together."""
+    drafts, proposals = await templates_service.list_user_template_state(
+        db, user.id, limit=limit, offset=offset
+    )
+    return TemplateStateOut(
+        drafts=[TemplateDraftOut.model_validate(draft) for draft in drafts],
+        proposals=[TemplateProposalOut.model_validate(proposal) for proposal in proposals],
+    )
+
+
 @router.post("/proposals", response_model=TemplateProposalOut)
 async def submit_proposal(
     req: TemplateProposalCreate,
@@ -45,6 +45,11 @@ class Settings(BaseSettings):
     litellm_model: Optional[str] = Field(None, validation_alias="LITELLM_MODEL", description="Default model name for LLM calls.")
     litellm_api_key: Optional[str] = Field(None, validation_alias="LITELLM_API_KEY", description="API key for the LLM provider.")
     litellm_base_url: Optional[str] = Field(None, validation_alias="LITELLM_BASE_URL", description="Optional base URL override for LLM provider.")
+    litellm_supports_tools: bool = Field(
+        True,
+        validation_alias="LITELLM_SUPPORTS_TOOLS",
+        description="Whether the model supports function calling; when false, structured-output attempts are skipped.",
+    )
 
     # Tavily (web grounding)
     tavily_api_key: Optional[str] = Field(None, validation_alias="TAVILY_API_KEY", description="API key for Tavily search.")
@@ -58,11 +63,21 @@ class Settings(BaseSettings):
         validation_alias="TAVILY_MAX_RESULTS",
         description="Maximum number of search results to retrieve per query.",
     )
+    tavily_max_concurrency: int = Field(
+        3,
+        validation_alias="TAVILY_MAX_CONCURRENCY",
+        description="Maximum number of Tavily queries in flight at once.",
+    )
     tavily_cache_ttl_hours: int = Field(
         48,
         validation_alias="TAVILY_CACHE_TTL_HOURS",
         description="Number of hours to cache Tavily query results.",
     )
+    tavily_synthesis_max_results: int = Field(
+        6,
+        validation_alias="TAVILY_SYNTHESIS_MAX_RESULTS",
+        description="Maximum number of ranked search results passed to grounding synthesis.",
+    )
 
     # Optional observability settings for Langfuse
     langfuse_public_key: Optional[str] = Field(None, validation_alias="LANGFUSE_PUBLIC_KEY")
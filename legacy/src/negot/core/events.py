@@ -15,6 +15,25 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .models import Event, EventType
 
 
+def build_event_row(
+    event_type: EventType,
+    user_id: int,
+    session_id: Optional[int] = None,
+    payload: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """Return the column values for an event record.
+
+    Useful when several events are written with a single bulk ``insert(Event)``
+    instead of one :func:`emit_event` call each.
+    """
+    return {
+        "user_id": user_id,
+        "session_id": session_id,
+        "event_type": event_type,
+        "payload": payload or {},
+    }
+
+
 async def emit_event(
     session: AsyncSession,
     event_type: EventType,
@@ -31,12 +50,7 @@ async def emit_event(
     :param payload: Arbitrary JSON-serialisable dictionary with event details.
     :return: The created Event instance.
     """
-    event = Event(
-        user_id=user_id,
-        session_id=session_id,
-        event_type=event_type,
-        payload=payload or {},
-    )
+    event = Event(**build_event_row(event_type, user_id, session_id=session_id, payload=payload))
     session.add(event)
     # Let the caller handle commit/rollback
     return event
\ No newline at end of file
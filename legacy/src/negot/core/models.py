@@ -25,10 +25,12 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -164,6 +166,7 @@ class Session(Base):
     active_thread_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("message_threads.id"), nullable=True
     )
+    grounding_call_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     # Relationship
     user: Mapped[User] = relationship("User", back_populates="sessions")
@@ -186,6 +189,7 @@ class Session(Base):
         "Entity",
         secondary="session_entities",
         back_populates="sessions",
+        viewonly=True,
     )
     facts: Mapped[list["Fact"]] = relationship("Fact", back_populates="session")
     case_snapshot: Mapped[Optional["CaseSnapshot"]] = relationship(
@@ -222,6 +226,16 @@ class MessageThread(Base):
     branch_label: Mapped[Optional[str]] = mapped_column(String(length=120), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index(
+            "ix_thread_root_by_session",
+            "session_id",
+            "created_at",
+            postgresql_where=text("parent_thread_id IS NULL"),
+            sqlite_where=text("parent_thread_id IS NULL"),
+        ),
+    )
+
     session: Mapped[Session] = relationship(
         "Session", back_populates="threads", foreign_keys=[session_id]
     )
@@ -322,6 +336,7 @@ class Entity(Base):
         "Session",
         secondary="session_entities",
         back_populates="attached_entities",
+        viewonly=True,
     )
     facts: Mapped[list["Fact"]] = relationship("Fact", back_populates="subject")
 
@@ -400,6 +415,8 @@ class Event(Base):
     payload: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (Index("ix_event_session_type", "session_id", "event_type"),)
+
 
 class TemplateDraft(Base):
     """User-local template draft generated for an unknown topic."""
@@ -413,6 +430,8 @@ class TemplateDraft(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (Index("ix_template_drafts_user_created", "user_id", "created_at"),)
+
 
 class TemplateProposal(Base):
     """Template proposal submitted for admin review."""
@@ -428,3 +447,7 @@ class TemplateProposal(Base):
     reviewer_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     reviewed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (Index("ix_template_proposals_user_created", "user_id", "created_at"),)
+
+    draft: Mapped[Optional[TemplateDraft]] = relationship("TemplateDraft")
@@ -257,6 +257,14 @@ class StrategyExecutionOut(BaseModel):
     created_at: datetime
 
 
+class StrategyStateOut(BaseModel):
+    """Case snapshot plus the latest strategy selection and execution for a session."""
+
+    case_snapshot: CaseSnapshotOut
+    strategy_selection: Optional[StrategySelectionOut] = None
+    latest_execution: Optional[StrategyExecutionOut] = None
+
+
 class SessionUpdateRequest(BaseModel):
     """Request for updating session metadata."""
 
@@ -425,6 +433,13 @@ class TemplateProposalOut(BaseModel):
     created_at: datetime
 
 
+class TemplateStateOut(BaseModel):
+    """Response model combining a user's template drafts and proposals."""
+
+    drafts: List[TemplateDraftOut] = Field(default_factory=list)
+    proposals: List[TemplateProposalOut] = Field(default_factory=list)
+
+
 class TemplateReviewRequest(BaseModel):
     """Admin review decision for template proposals."""
 
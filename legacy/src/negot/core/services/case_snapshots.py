@@ -3,9 +3,9 @@ Case snapshot creation and update utilities.
 """
 from __future__ import annotations
 
+import copy
 import json
 import logging
-from datetime import datetime
 from typing import Dict, List, Optional
 
 import jsonpatch
@@ -15,7 +15,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import get_settings
 from ..models import CaseSnapshot, Session
-from .llm_utils import acompletion_with_retry, extract_completion_text, extract_json_object
+from ..utils.timeutils import utc_now_iso
+from .llm_utils import (
+    acompletion_with_retry,
+    extract_completion_text,
+    extract_json_object,
+    litellm_base_kwargs,
+)
 from .strategy_packs import validate_case_snapshot
 
 logger = logging.getLogger(__name__)
@@ -51,9 +57,6 @@ TEMPLATE_DOMAIN_MAP = {
 }
 
 
-def _now_iso() -> str:
-    return datetime.utcnow().isoformat()
-
 
 def _case_id(session_id: int) -> str:
     return f"CASE_{session_id}"
@@ -78,7 +81,7 @@ def build_initial_case_snapshot(session: Session, channel: Optional[str]) -> dic
     channel_value = (channel or "DM").upper()
     return {
         "case_id": _case_id(session.id),
-        "updated_at": _now_iso(),
+        "updated_at": utc_now_iso(),
         "domain": domain,
         "channel": channel_value,
         "stage": "INTAKE",
@@ -111,7 +114,7 @@ def append_timeline_event(payload: dict, event_type: str, summary: str, raw_text
     event_id = f"EVENT_{len(recent) + 1}"
     event = {
         "event_id": event_id,
-        "ts": _now_iso(),
+        "ts": utc_now_iso(),
         "type": event_type,
         "summary": summary.strip()[:200] if summary else "Message",
     }
@@ -124,14 +127,14 @@ def append_timeline_event(payload: dict, event_type: str, summary: str, raw_text
 
 
 def apply_case_patches(payload: dict, patches: List[dict]) -> dict:
-    if not patches:
-        return payload
-    try:
-        patch = jsonpatch.JsonPatch(patches)
-        return patch.apply(payload, in_place=False)
-    except (jsonpatch.JsonPatchException, jsonpatch.JsonPointerException) as exc:
-        logger.warning("Failed to apply case patches: %s", exc)
-        return payload
+    # Always hand back a copy: callers edit the result before assigning it to the JSON
+    # column, and an in-place edit of the loaded payload would not be flushed.
+    if patches:
+        try:
+            return jsonpatch.JsonPatch(patches).apply(payload, in_place=False)
+        except (jsonpatch.JsonPatchException, jsonpatch.JsonPointerException) as exc:
+            logger.warning("Failed to apply case patches: %s", exc)
+    return copy.deepcopy(payload)
 
 
 async def _extract_case_patches(payload: dict, evidence: dict) -> List[dict]:
@@ -139,17 +142,13 @@ async def _extract_case_patches(payload: dict, evidence: dict) -> List[dict]:
     if not settings.litellm_model:
         raise RuntimeError("LiteLLM model is not configured; cannot update case snapshot.")
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": CASE_PATCH_SYSTEM_PROMPT},
             {"role": "user", "content": json.dumps({"case_snapshot": payload, "evidence": evidence}, default=str)},
         ],
         "temperature": 0.2,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
     response = await acompletion_with_retry(**completion_kwargs)
     content = extract_completion_text(response)
     if not content:
@@ -206,7 +205,7 @@ async def update_case_snapshot_from_intake(
         "answers": answers,
         "summary": summary,
     }
-    updated_payload["updated_at"] = _now_iso()
+    updated_payload["updated_at"] = utc_now_iso()
     try:
         validate_case_snapshot(updated_payload)
     except Exception as exc:  # noqa: BLE001
@@ -217,7 +216,7 @@ async def update_case_snapshot_from_intake(
             "answers": answers,
             "summary": summary,
         }
-        fallback_payload["updated_at"] = _now_iso()
+        fallback_payload["updated_at"] = utc_now_iso()
         updated_payload = fallback_payload
     snapshot.payload = updated_payload
     await db.flush()
@@ -245,7 +244,7 @@ async def update_case_snapshot_from_message(
     )
     if updated_payload.get("stage") == "INTAKE":
         updated_payload["stage"] = "BARGAINING"
-    updated_payload["updated_at"] = _now_iso()
+    updated_payload["updated_at"] = utc_now_iso()
     try:
         validate_case_snapshot(updated_payload)
     except Exception as exc:  # noqa: BLE001
@@ -3,35 +3,14 @@ Evaluate boolean conditions used by strategy prerequisites and gates.
 """
 from __future__ import annotations
 
+from functools import lru_cache
+import operator
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import orjson
 
-def _get_path_value(data: Dict[str, Any], path: str) -> tuple[bool, Any]:
-    if not path:
-        return False, None
-    if path.startswith("/"):
-        path = path[1:]
-    if not path:
-        return True, data
-    current: Any = data
-    for raw_part in path.split("/"):
-        part = raw_part.replace("~1", "/").replace("~0", "~")
-        if isinstance(current, dict):
-            if part not in current:
-                return False, None
-            current = current[part]
-        elif isinstance(current, list):
-            try:
-                index = int(part)
-            except ValueError:
-                return False, None
-            if index < 0 or index >= len(current):
-                return False, None
-            current = current[index]
-        else:
-            return False, None
-    return True, current
+Condition = Callable[[Dict[str, Any]], bool]
 
 
 def _check_min_confidence(value: Any, min_confidence: Optional[float]) -> bool:
@@ -45,63 +24,147 @@ def _check_min_confidence(value: Any, min_confidence: Optional[float]) -> bool:
     return False
 
 
-def _eval_predicate(predicate: Dict[str, Any], context: Dict[str, Any]) -> bool:
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "EQ": operator.eq,
+    "NEQ": operator.ne,
+    "GT": operator.gt,
+    "GTE": operator.ge,
+    "LT": operator.lt,
+    "LTE": operator.le,
+}
+
+
+def _never(context: Dict[str, Any]) -> bool:
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> Callable[[Dict[str, Any]], Tuple[bool, Any]]:
+    if not path:
+        return lambda data: (False, None)
+    if path.startswith("/"):
+        path = path[1:]
+    if not path:
+        return lambda data: (True, data)
+    parts = tuple(part.replace("~1", "/").replace("~0", "~") for part in path.split("/"))
+
+    def lookup(data: Dict[str, Any]) -> Tuple[bool, Any]:
+        current: Any = data
+        for part in parts:
+            if isinstance(current, dict):
+                if part not in current:
+                    return False, None
+                current = current[part]
+            elif isinstance(current, list):
+                try:
+                    index = int(part)
+                except ValueError:
+                    return False, None
+                if index < 0 or index >= len(current):
+                    return False, None
+                current = current[index]
+            else:
+                return False, None
+        return True, current
+
+    return lookup
+
+
+def _get_path_value(data: Dict[str, Any], path: str) -> Tuple[bool, Any]:
+    """Resolve a JSON-pointer style ``path`` in ``data`` as ``(found, value)``."""
+    return _compile_path(path)(data)
+
+
+def _compile_test(predicate: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
     op = predicate.get("op")
-    path = predicate.get("path", "")
-    exists, value = _get_path_value(context, path)
-    if op == "EXISTS":
-        return exists and value is not None
-    if not exists:
-        return False
-    if not _check_min_confidence(value, predicate.get("min_confidence")):
-        return False
     expected = predicate.get("value")
-    values = predicate.get("values") or []
-    if op == "EQ":
-        return value == expected
-    if op == "NEQ":
-        return value != expected
-    if op == "GT":
-        return value > expected
-    if op == "GTE":
-        return value >= expected
-    if op == "LT":
-        return value < expected
-    if op == "LTE":
-        return value <= expected
+    if op in _COMPARISONS:
+        compare = _COMPARISONS[op]
+        return lambda value: compare(value, expected)
     if op == "IN":
-        return value in values
+        values = predicate.get("values") or []
+        return lambda value: value in values
     if op == "CONTAINS":
-        if isinstance(value, str) and isinstance(expected, str):
-            return expected in value
-        if isinstance(value, list):
-            return expected in value
-        return False
+
+        def contains(value: Any) -> bool:
+            if isinstance(value, str) and isinstance(expected, str):
+                return expected in value
+            if isinstance(value, list):
+                return expected in value
+            return False
+
+        return contains
     if op == "MATCHES":
         regex = predicate.get("regex")
         if not regex:
-            return False
+            return None
         try:
-            return re.search(regex, str(value)) is not None
+            pattern = re.compile(regex)
         except re.error:
+            return None
+        return lambda value: pattern.search(str(value)) is not None
+    return None
+
+
+def _compile_predicate(predicate: Dict[str, Any]) -> Condition:
+    lookup = _compile_path(predicate.get("path", ""))
+    if predicate.get("op") == "EXISTS":
+
+        def exists(context: Dict[str, Any]) -> bool:
+            found, value = lookup(context)
+            return found and value is not None
+
+        return exists
+    test = _compile_test(predicate)
+    if test is None:
+        return _never
+    min_confidence = predicate.get("min_confidence")
+
+    def check(context: Dict[str, Any]) -> bool:
+        found, value = lookup(context)
+        if not found or not _check_min_confidence(value, min_confidence):
             return False
-    return False
+        return test(value)
 
+    return check
 
-def evaluate_condition(condition: Dict[str, Any], context: Dict[str, Any]) -> bool:
+
+def compile_condition(condition: Dict[str, Any]) -> Condition:
+    """Compile a condition dict into a callable that evaluates it against a context.
+
+    Unknown condition types, malformed nodes and unsupported operators compile to
+    a callable that always returns False.
+    """
     condition_type = condition.get("type")
     if condition_type == "ALL":
-        return all(evaluate_condition(item, context) for item in condition.get("all", []))
+        items = tuple(compile_condition(item) for item in condition.get("all", []))
+        return lambda context: all(item(context) for item in items)
     if condition_type == "ANY":
-        return any(evaluate_condition(item, context) for item in condition.get("any", []))
+        items = tuple(compile_condition(item) for item in condition.get("any", []))
+        return lambda context: any(item(context) for item in items)
     if condition_type == "NOT":
         nested = condition.get("not")
         if not isinstance(nested, dict):
-            return False
-        return not evaluate_condition(nested, context)
+            return _never
+        inner = compile_condition(nested)
+        return lambda context: not inner(context)
     if condition_type == "PREDICATE":
         predicate = condition.get("predicate")
         if not isinstance(predicate, dict):
-            return False
-        return _eval_predicate(predicate, context)
-    return False
+            return _never
+        return _compile_predicate(predicate)
+    return _never
+
+
+def evaluate_condition(condition: Dict[str, Any], context: Dict[str, Any]) -> bool:
+    return compile_condition(condition)(context)
+
+
+@lru_cache(maxsize=512)
+def _compile_encoded(encoded: bytes) -> Tuple[Condition, ...]:
+    return tuple(compile_condition(item) for item in orjson.loads(encoded))
+
+
+def compile_conditions(conditions: List[Dict[str, Any]]) -> Tuple[Condition, ...]:
+    """Return compiled callables for a list of conditions, cached by content."""
+    return _compile_encoded(orjson.dumps(conditions, option=orjson.OPT_SORT_KEYS))
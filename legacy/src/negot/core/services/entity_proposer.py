@@ -10,7 +10,13 @@ from typing import Any, Dict, List, Optional, Sequence
 from pydantic import BaseModel, Field
 
 from ..config import get_settings
-from .llm_utils import acompletion_with_retry, extract_completion_text, extract_json_object
+from .llm_utils import (
+    acompletion_with_retry,
+    extract_completion_text,
+    extract_json_object,
+    instructor_client,
+    litellm_base_kwargs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,25 +54,22 @@ async def propose_entities(
         "entities": list(entities),
     }
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": ENTITY_PROPOSER_PROMPT},
             {"role": "user", "content": json.dumps(payload, default=str)},
         ],
         "temperature": 0.0,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
-
-        client = from_litellm(acompletion_with_retry)
-        response = await client(response_model=EntityProposal, **completion_kwargs)
-        proposal = response
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Entity proposer failed. Error: %s", exc)
+    proposal: Optional[EntityProposal] = None
+    if settings.litellm_supports_tools:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            proposal = await client(response_model=EntityProposal, **completion_kwargs)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Entity proposer failed. Error: %s", exc)
+            proposal = None
+    if proposal is None:
         response = await acompletion_with_retry(**completion_kwargs)
         content = extract_completion_text(response)
         if not content:
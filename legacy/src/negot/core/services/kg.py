@@ -11,7 +11,7 @@ import json
 from typing import Iterable, List, Optional
 
 from pydantic import BaseModel, Field
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import get_settings
@@ -30,7 +30,12 @@ from ..models import (
     Session,
     SessionEntity,
 )
-from .llm_utils import acompletion_with_retry, extract_completion_text
+from .llm_utils import (
+    acompletion_with_retry,
+    extract_completion_text,
+    instructor_client,
+    litellm_base_kwargs,
+)
 
 
 async def list_entities(db: AsyncSession, user_id: int) -> List[Entity]:
@@ -224,24 +229,21 @@ async def compute_visible_facts(
         'Output JSON only: {"visible_fact_ids": [..], "rationale": "..."}'
     )
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": json.dumps(payload)},
         ],
         "temperature": 0.0,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
-
-        client = from_litellm(acompletion_with_retry)
-        response = await client(response_model=VisibleFactsSelection, **completion_kwargs)
-        selection = response
-    except Exception:
+    selection: Optional[VisibleFactsSelection] = None
+    if settings.litellm_supports_tools:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            selection = await client(response_model=VisibleFactsSelection, **completion_kwargs)
+        except Exception:
+            selection = None
+    if selection is None:
         response = await acompletion_with_retry(**completion_kwargs)
         content = extract_completion_text(response)
         if not content:
@@ -292,14 +294,20 @@ async def commit_facts(
 
 
 async def list_facts(
-    db: AsyncSession, user_id: int, session_id: Optional[int] = None, scope: Optional[KnowledgeScope] = None
+    db: AsyncSession,
+    user_id: int,
+    session_id: Optional[int] = None,
+    scope: Optional[KnowledgeScope] = None,
+    subject_entity_ids: Optional[List[int]] = None,
 ) -> List[Fact]:
-    """Return facts for a user, optionally filtered by session or scope."""
+    """Return facts for a user, optionally filtered by session, scope or subject entities."""
     query = select(Fact).where(Fact.user_id == user_id)
     if session_id is not None:
         query = query.where(Fact.session_id == session_id)
     if scope is not None:
         query = query.where(Fact.scope == scope)
+    if subject_entity_ids:
+        query = query.where(Fact.subject_entity_id.in_(subject_entity_ids))
     result = await db.execute(query)
     return result.scalars().all()
 
@@ -399,9 +407,19 @@ async def delete_fact(db: AsyncSession, fact: Fact) -> None:
     )
 
 
-async def list_relationships(db: AsyncSession, user_id: int) -> List[Relationship]:
-    """Return all relationships owned by a user."""
-    result = await db.execute(select(Relationship).where(Relationship.user_id == user_id))
+async def list_relationships(
+    db: AsyncSession, user_id: int, entity_ids: Optional[List[int]] = None
+) -> List[Relationship]:
+    """Return relationships owned by a user, optionally only those touching ``entity_ids``."""
+    query = select(Relationship).where(Relationship.user_id == user_id)
+    if entity_ids:
+        query = query.where(
+            or_(
+                Relationship.src_entity_id.in_(entity_ids),
+                Relationship.dst_entity_id.in_(entity_ids),
+            )
+        )
+    result = await db.execute(query)
     return result.scalars().all()
 
 
@@ -3,13 +3,99 @@ Shared helpers for LiteLLM calls and response parsing.
 """
 from __future__ import annotations
 
+import hashlib
 import json
-from typing import Any, Optional
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
 
-from litellm import acompletion
+import orjson
+from litellm import BadRequestError, acompletion
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from ..config import Settings, get_settings
+
+try:
+    from instructor.core import InstructorRetryException
+except ImportError:  # instructor < 1.10 or not installed
+    try:
+        from instructor.exceptions import InstructorRetryException
+    except ImportError:
+        InstructorRetryException = ValueError  # type: ignore[assignment,misc]
+
 LLM_RETRY_ATTEMPTS = 3
+LLM_RESPONSE_CACHE_TTL = timedelta(hours=24)
+# Failures of the structured-output path that a plain JSON completion can recover
+# from, including providers rejecting the tool-calling request itself. Transport
+# errors are not listed: acompletion_with_retry already retried them.
+STRUCTURED_OUTPUT_ERRORS: tuple[type[BaseException], ...] = (
+    ImportError,
+    TypeError,
+    ValueError,
+    InstructorRetryException,
+    BadRequestError,
+)
+
+_base_kwargs_cache: Optional[Tuple[Settings, Dict[str, Any]]] = None
+
+_V = TypeVar("_V")
+
+
+class ResponseCache(Generic[_V]):
+    """Bounded LRU of memoized responses that expire after a TTL.
+
+    Expiry uses the monotonic clock. Once ``maxsize`` entries are held, the least
+    recently used one is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: timedelta = LLM_RESPONSE_CACHE_TTL) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl.total_seconds()
+        self._entries: OrderedDict[str, Tuple[float, _V]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[_V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: _V, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def litellm_base_kwargs() -> Dict[str, Any]:
+    """Return model and credential kwargs for LiteLLM calls.
+
+    The dict is built once per settings instance; callers get a copy they can extend.
+    """
+    global _base_kwargs_cache
+    settings = get_settings()
+    cached = _base_kwargs_cache
+    if cached is None or cached[0] is not settings:
+        kwargs: Dict[str, Any] = {"model": settings.litellm_model}
+        if settings.litellm_api_key:
+            kwargs["api_key"] = settings.litellm_api_key
+        if settings.litellm_base_url:
+            kwargs["base_url"] = settings.litellm_base_url
+        cached = _base_kwargs_cache = (settings, kwargs)
+    return dict(cached[1])
 
 
 @retry(
@@ -22,6 +108,31 @@ async def acompletion_with_retry(**kwargs: Any) -> Any:
     return await acompletion(**kwargs)
 
 
+@lru_cache(maxsize=None)
+def instructor_client(completion: Callable[..., Any]) -> Any:
+    """Return a cached instructor client wrapping ``completion``.
+
+    Keyed by the completion callable so each wrapper is built once per process.
+    Raises ``ImportError`` when instructor is not installed.
+    """
+    from instructor import from_litellm
+
+    return from_litellm(completion)
+
+
+def warm_instructor_client() -> bool:
+    """Build the shared instructor client ahead of the first request.
+
+    Returns False when instructor is not installed; callers fall back to plain
+    JSON completions in that case anyway.
+    """
+    try:
+        instructor_client(acompletion_with_retry)
+    except ImportError:
+        return False
+    return True
+
+
 def extract_completion_text(response: Any) -> Optional[str]:
     """Extract the text content from a LiteLLM completion response."""
     try:
@@ -34,11 +145,31 @@ def extract_completion_text(response: Any) -> Optional[str]:
         return None
 
 
+def extract_stream_delta(chunk: Any) -> Optional[str]:
+    """Extract the text delta from a LiteLLM streaming chunk."""
+    try:
+        return chunk["choices"][0]["delta"].get("content")
+    except Exception:
+        pass
+    try:
+        return chunk.choices[0].delta.content
+    except Exception:
+        pass
+    try:
+        return chunk["choices"][0].get("text")
+    except Exception:
+        pass
+    try:
+        return chunk.choices[0].text
+    except Exception:
+        return None
+
+
 def extract_json_object(content: str) -> Optional[dict]:
     """Best-effort extraction of a JSON object from model output."""
     try:
-        return json.loads(content)
-    except Exception:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
         pass
     start = content.find("{")
     end = content.rfind("}")
@@ -46,6 +177,30 @@ def extract_json_object(content: str) -> Optional[dict]:
         return None
     snippet = content[start : end + 1]
     try:
-        return json.loads(snippet)
-    except Exception:
+        return orjson.loads(snippet)
+    except orjson.JSONDecodeError:
         return None
+
+
+def response_cache_key(namespace: str, payload: Any) -> str:
+    """Build a stable cache key for memoizing an LLM response to ``payload``."""
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return f"{namespace}:{hashlib.sha1(encoded.encode('utf-8')).hexdigest()}"
+
+
+def supports_cache_control(model: Optional[str]) -> bool:
+    """Return True for providers that need explicit ``cache_control`` prompt markers."""
+    if not model:
+        return False
+    lowered = model.lower()
+    return lowered.startswith("anthropic/") or "claude" in lowered
+
+
+def cached_system_message(model: Optional[str], content: str) -> Dict[str, Any]:
+    """Build a system message, marked as a cacheable prefix where the provider needs it."""
+    if not supports_cache_control(model):
+        return {"role": "system", "content": content}
+    return {
+        "role": "system",
+        "content": [{"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}],
+    }
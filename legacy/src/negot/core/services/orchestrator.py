@@ -16,8 +16,13 @@ from pydantic import BaseModel, Field
 from ..config import get_settings
 from .llm_utils import (
     acompletion_with_retry,
+    cached_system_message,
     extract_completion_text,
     extract_json_object,
+    extract_stream_delta,
+    instructor_client,
+    litellm_base_kwargs,
+    supports_cache_control,
 )
 
 try:
@@ -55,6 +60,7 @@ class OrchestrationState(TypedDict, total=False):
     history: List[Dict[str, str]]
     topic_text: Optional[str]
     template_id: Optional[str]
+    intake_summary: Optional[str]
     strategy_context: Optional[Dict[str, Any]]
     include_coach: bool
     stream_roleplay: bool
@@ -168,25 +174,20 @@ async def extract_candidate_facts(message: str, subject_entity_ids: List[int]) -
         "subject_entity_ids": subject_entity_ids,
     }
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": json.dumps(user_payload, default=str)},
         ],
         "temperature": 0.0,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
-
-        client = from_litellm(acompletion_with_retry)
-        response = await client(response_model=FactExtractionResult, **completion_kwargs)
-        return [fact.model_dump() for fact in response.facts]
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Instructor extraction failed. Error: %s", exc)
+    if settings.litellm_supports_tools:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            response = await client(response_model=FactExtractionResult, **completion_kwargs)
+            return [fact.model_dump() for fact in response.facts]
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Instructor extraction failed. Error: %s", exc)
     response = await acompletion_with_retry(**completion_kwargs)
     content = extract_completion_text(response)
     if not content:
@@ -214,14 +215,10 @@ async def _generate_roleplay_from_prompt(
         raise RuntimeError("LiteLLM model is not configured; cannot generate roleplay.")
     try:
         completion_kwargs = {
-            "model": settings.litellm_model,
-            "messages": messages,
+            **litellm_base_kwargs(),
+            "messages": _with_prompt_cache(settings.litellm_model, messages),
             "temperature": 0.7,
         }
-        if settings.litellm_api_key:
-            completion_kwargs["api_key"] = settings.litellm_api_key
-        if settings.litellm_base_url:
-            completion_kwargs["base_url"] = settings.litellm_base_url
         response = await acompletion_with_retry(**completion_kwargs)
     except Exception as exc:  # noqa: BLE001
         logger.warning("LLM roleplay response failed. Error: %s", exc)
@@ -304,22 +301,18 @@ async def generate_roleplay_stream(
     )
     try:
         completion_kwargs = {
-            "model": settings.litellm_model,
-            "messages": messages,
+            **litellm_base_kwargs(),
+            "messages": _with_prompt_cache(settings.litellm_model, messages),
             "temperature": 0.7,
             "stream": True,
         }
-        if settings.litellm_api_key:
-            completion_kwargs["api_key"] = settings.litellm_api_key
-        if settings.litellm_base_url:
-            completion_kwargs["base_url"] = settings.litellm_base_url
         stream = await acompletion_with_retry(**completion_kwargs)
     except Exception as exc:  # noqa: BLE001
         logger.warning("LLM roleplay streaming failed. Error: %s", exc)
         raise
     collected: List[str] = []
     async for chunk in stream:
-        delta = _extract_stream_delta(chunk)
+        delta = extract_stream_delta(chunk)
         if delta:
             collected.append(delta)
             yield delta
@@ -334,6 +327,27 @@ async def generate_roleplay_stream(
     )
 
 
+def _with_prompt_cache(model: str, messages: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """Mark the leading system blocks as cacheable for providers that need explicit markers.
+
+    OpenAI-style providers cache stable prefixes automatically, so messages are
+    returned unchanged for them. The visible facts block changes between turns
+    and is never marked.
+    """
+    if not supports_cache_control(model):
+        return messages
+    cached: List[Dict[str, Any]] = []
+    for idx, message in enumerate(messages):
+        content = message.get("content")
+        is_cacheable = (
+            message.get("role") == "system"
+            and isinstance(content, str)
+            and (idx == 0 or content.startswith("Grounding notes:"))
+        )
+        cached.append(cached_system_message(model, content) if is_cacheable else message)
+    return cached
+
+
 def build_roleplay_messages(
     user_message: str,
     visible_facts: List[Dict[str, Any]],
@@ -345,6 +359,7 @@ def build_roleplay_messages(
     strategy_context: Optional[Dict[str, Any]] = None,
     counterparty_stance: Optional[str] = None,
     counterparty_constraints: Optional[List[str]] = None,
+    intake_summary: Optional[str] = None,
 ) -> List[Dict[str, str]]:
     system_lines = [
         "You are the counterparty in a negotiation roleplay.",
@@ -357,6 +372,8 @@ def build_roleplay_messages(
         system_lines.append(f"Session topic: {topic_text}")
     if template_id:
         system_lines.append(f"Template: {template_id}")
+    if intake_summary:
+        system_lines.append(f"User intake summary (context only, do not quote):\n{intake_summary}")
     if strategy_context:
         name = strategy_context.get("name") or strategy_context.get("strategy_id")
         summary = strategy_context.get("summary")
@@ -382,14 +399,16 @@ def build_roleplay_messages(
         constraints = [item for item in counterparty_constraints if item]
         if constraints:
             system_lines.append("Counterparty constraints:\n" + "\n".join(f"- {item}" for item in constraints))
-    if visible_facts:
-        fact_lines = [f"- {fact.get('key')}: {fact.get('value')}" for fact in visible_facts]
-        system_lines.append("Visible facts:\n" + "\n".join(fact_lines))
+    # Stable blocks first, per-turn blocks last, so providers can reuse the prompt prefix.
+    messages: List[Dict[str, str]] = [{"role": "system", "content": "\n".join(system_lines)}]
     if grounding_pack and grounding_pack.get("key_points"):
         grounding_lines = [f"- {item.get('text')}" for item in grounding_pack.get("key_points", [])]
         if grounding_lines:
-            system_lines.append("Grounding notes:\n" + "\n".join(grounding_lines))
-    messages: List[Dict[str, str]] = [{"role": "system", "content": "\n".join(system_lines)}]
+            messages.append({"role": "system", "content": "Grounding notes:\n" + "\n".join(grounding_lines)})
+    if visible_facts:
+        ordered_facts = sorted(visible_facts, key=lambda fact: fact.get("id") or 0)
+        fact_lines = [f"- {fact.get('key')}: {fact.get('value')}" for fact in ordered_facts]
+        messages.append({"role": "system", "content": "Visible facts:\n" + "\n".join(fact_lines)})
     if history:
         for item in history:
             role = item.get("role")
@@ -417,6 +436,7 @@ def _build_prompt_node(state: OrchestrationState) -> Dict[str, Any]:
         state.get("strategy_context"),
         state.get("counterparty_stance"),
         state.get("counterparty_constraints"),
+        state.get("intake_summary"),
     )
     return {"prompt_messages": messages}
 
@@ -437,6 +457,7 @@ async def _roleplay_node(state: OrchestrationState) -> Dict[str, Any]:
             state.get("strategy_context"),
             state.get("counterparty_stance"),
             state.get("counterparty_constraints"),
+            state.get("intake_summary"),
         )
     response = await _generate_roleplay_from_prompt(
         messages,
@@ -498,6 +519,7 @@ async def run_orchestration(
     counterparty_constraints: Optional[List[str]] = None,
     include_coach: bool = False,
     stream_roleplay: bool = True,
+    intake_summary: Optional[str] = None,
 ) -> OrchestrationState:
     state: OrchestrationState = {
         "user_message": user_message,
@@ -507,6 +529,7 @@ async def run_orchestration(
         "history": history or [],
         "topic_text": topic_text,
         "template_id": template_id,
+        "intake_summary": intake_summary,
         "strategy_context": strategy_context,
         "counterparty_stance": counterparty_stance,
         "counterparty_constraints": counterparty_constraints or [],
@@ -517,25 +540,6 @@ async def run_orchestration(
     return await graph.ainvoke(state)
 
 
-def _extract_stream_delta(chunk: Any) -> Optional[str]:
-    try:
-        return chunk["choices"][0]["delta"].get("content")
-    except Exception:
-        pass
-    try:
-        return chunk.choices[0].delta.content
-    except Exception:
-        pass
-    try:
-        return chunk["choices"][0].get("text")
-    except Exception:
-        pass
-    try:
-        return chunk.choices[0].text
-    except Exception:
-        return None
-
-
 async def generate_coach_response(
     user_message: str,
     visible_facts: List[Dict[str, Any]],
@@ -556,27 +560,22 @@ async def generate_coach_response(
         "strategy_context": strategy_context or {},
     }
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": COACH_SYSTEM_PROMPT},
             {"role": "user", "content": json.dumps(payload)},
         ],
         "temperature": 0.3,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
-
-        client = from_litellm(acompletion_with_retry)
-        response = await client(response_model=CoachPanel, **completion_kwargs)
-        return response.model_dump()
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Coach generation failed. Error: %s", exc)
-        response = await acompletion_with_retry(**completion_kwargs)
-        content = extract_completion_text(response)
-        if not content:
-            raise RuntimeError("LiteLLM returned an empty coach response.")
-        return CoachPanel.model_validate_json(content).model_dump()
+    if settings.litellm_supports_tools:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            response = await client(response_model=CoachPanel, **completion_kwargs)
+            return response.model_dump()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Coach generation failed. Error: %s", exc)
+    response = await acompletion_with_retry(**completion_kwargs)
+    content = extract_completion_text(response)
+    if not content:
+        raise RuntimeError("LiteLLM returned an empty coach response.")
+    return CoachPanel.model_validate_json(content).model_dump()
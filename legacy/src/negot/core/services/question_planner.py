@@ -12,7 +12,13 @@ from typing import Any, Dict, List, Optional, Sequence
 from pydantic import BaseModel, Field, field_validator
 
 from ..config import get_settings
-from .llm_utils import acompletion_with_retry, extract_completion_text, extract_json_object
+from .llm_utils import (
+    acompletion_with_retry,
+    extract_completion_text,
+    extract_json_object,
+    instructor_client,
+    litellm_base_kwargs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -117,25 +123,20 @@ async def generate_intake_questions(
         {"role": "user", "content": json.dumps(payload, default=str)},
     ]
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": messages,
         "temperature": 0.2,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
-
-        client = from_litellm(acompletion_with_retry)
-        response = await client(
-            response_model=IntakeQuestionPlan,
-            **completion_kwargs,
-        )
-        return response.questions
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Instructor intake planning failed; falling back. Error: %s", exc)
+    if settings.litellm_supports_tools:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            response = await client(
+                response_model=IntakeQuestionPlan,
+                **completion_kwargs,
+            )
+            return response.questions
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Instructor intake planning failed; falling back. Error: %s", exc)
     response = await acompletion_with_retry(**completion_kwargs)
     content = extract_completion_text(response)
     if not content:
@@ -11,7 +11,12 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from ..config import get_settings
-from .llm_utils import acompletion_with_retry, extract_completion_text, extract_json_object
+from .llm_utils import (
+    acompletion_with_retry,
+    extract_completion_text,
+    extract_json_object,
+    litellm_base_kwargs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -76,17 +81,13 @@ async def _too_similar(
         ],
     }
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": SIMILARITY_SYSTEM_PROMPT},
             {"role": "user", "content": json.dumps(payload, default=str)},
         ],
         "temperature": 0.1,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
     try:
         response = await acompletion_with_retry(**completion_kwargs)
         content = extract_completion_text(response)
@@ -193,17 +194,13 @@ async def generate_route_branch(
         "existing_routes": existing_routes,
     }
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": ROUTE_SYSTEM_PROMPT},
             {"role": "user", "content": json.dumps(payload, default=str)},
         ],
         "temperature": 0.4,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
 
     def _parse(content: str) -> RouteBranchResult:
         try:
@@ -8,24 +8,28 @@ per‑turn workflow described in ``docs/legacy/ARCHITECTURE.md``.
 """
 from __future__ import annotations
 
+import asyncio
 import enum
+import io
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import attrgetter
 from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import orjson
 from pydantic import BaseModel, Field
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, desc, func, select, update
+from sqlalchemy import and_, delete, desc, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from ..config import get_settings
-from ..events import emit_event
+from ..events import build_event_row, emit_event
 from ..models import (
     Entity,
+    Event,
     EventType,
     CaseSnapshot,
     Message,
@@ -55,9 +59,9 @@ from ..schemas import (
     SessionUpdateRequest,
     EntityOut,
 )
+from ..utils.timeutils import utc_now_iso
 from .case_snapshots import (
     apply_case_patches,
-    get_case_snapshot,
     get_or_create_case_snapshot,
     update_case_snapshot_from_intake,
     update_case_snapshot_from_message,
@@ -81,10 +85,37 @@ from .strategy_packs import validate_case_snapshot
 from .route_generator import generate_route_branch
 from .entity_proposer import propose_entities
 from .templates import create_template_proposal_for_other, select_template
-from .web_grounding import need_search, plan_queries, run_search, synthesize
-from .llm_utils import acompletion_with_retry, extract_completion_text
+from .web_grounding import decide_and_plan, plan_queries, run_search, synthesize
+from .llm_utils import (
+    STRUCTURED_OUTPUT_ERRORS,
+    ResponseCache,
+    acompletion_with_retry,
+    cached_system_message,
+    extract_completion_text,
+    instructor_client,
+    litellm_base_kwargs,
+    response_cache_key,
+)
 
 ROLEPLAY_HISTORY_LIMIT = 12
+# Streamed tokens are coalesced into one SSE frame until either limit is reached.
+STREAM_FLUSH_CHARS = 48
+STREAM_FLUSH_SECONDS = 0.02
+# Topics at most this long are used as the session title without an LLM call.
+SHORT_TITLE_MAX_CHARS = 60
+# Rows fetched per round-trip when streaming a session transcript for the recap.
+RECAP_FETCH_BATCH = 500
+# Roles that make up the negotiation dialogue itself (as opposed to coaching turns).
+DIALOGUE_ROLES = frozenset((MessageRole.user, MessageRole.counterparty))
+_branch_fields = attrgetter(
+    "id", "parent_message_id", "variant", "rationale", "action_label", "branch_label", "created_at"
+)
+SESSION_RECAP_PROMPT = (
+    "You are the Session Recap agent. Produce a concise descriptive recap of the session. "
+    "If premium=true, also produce an after_action_report with coaching insights. "
+    "If premium=false, do not include advice or coaching language. "
+    'Output JSON only: {"recap":"...","after_action_report":"..."}'
+)
 DEFAULT_INTAKE_QUESTIONS = [
     "What outcome are you aiming for?",
     "What constraints or limits have they stated?",
@@ -93,12 +124,29 @@ DEFAULT_INTAKE_QUESTIONS = [
 
 logger = logging.getLogger(__name__)
 
+SESSION_TITLE_CACHE_MAX_ENTRIES = 512
+_TITLE_CACHE: ResponseCache[str] = ResponseCache(SESSION_TITLE_CACHE_MAX_ENTRIES)
+
 
 class SessionRecapResult(BaseModel):
     recap: str = Field(..., description="Descriptive recap of the session.")
     after_action_report: Optional[str] = Field(None, description="Premium coaching summary.")
 
 
+def _utcnow() -> datetime:
+    """Return the current UTC time as a naive datetime, matching the DB columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _looks_like_title(text: str) -> bool:
+    """Return True when the topic is short and clean enough to use as-is."""
+    if not text or len(text) > SHORT_TITLE_MAX_CHARS:
+        return False
+    if "\n" in text or "://" in text:
+        return False
+    return not any(ch in text for ch in "{}<>")
+
+
 async def _generate_session_title(
     topic_text: Optional[str],
     template_id: Optional[str],
@@ -106,9 +154,12 @@ async def _generate_session_title(
 ) -> str:
     if not topic_text:
         return "Negotiation Session"
+    stripped = topic_text.strip()
+    if _looks_like_title(stripped):
+        return stripped
     settings = get_settings()
     if not settings.litellm_model:
-        return topic_text.strip()[:80]
+        return stripped[:80]
     system_prompt = (
         "You are a naming assistant for negotiation sessions. "
         "Generate a short, specific title (3-6 words, max 60 characters). "
@@ -119,30 +170,33 @@ async def _generate_session_title(
         "template_id": template_id,
         "channel": channel,
     }
+    cache_key = response_cache_key("session_title", [settings.litellm_model, payload])
+    cached_title = _TITLE_CACHE.get(cache_key)
+    if cached_title is not None:
+        return cached_title
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": json.dumps(payload, default=str)},
         ],
         "temperature": 0.3,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
     try:
         response = await acompletion_with_retry(**completion_kwargs)
         content = extract_completion_text(response)
         if not content:
-            return topic_text.strip()[:80]
+            return stripped[:80]
         title = content.strip().strip('"').strip("'")
         if len(title) > 80:
             title = title[:80]
-        return title or topic_text.strip()[:80]
+        if not title:
+            return stripped[:80]
+        _TITLE_CACHE.put(cache_key, title)
+        return title
     except Exception as exc:  # noqa: BLE001
         logger.warning("Session title generation failed: %s", exc)
-        return topic_text.strip()[:80]
+        return stripped[:80]
 
 
 async def create_session(
@@ -160,10 +214,9 @@ async def create_session(
         topic_text=req.topic_text,
         counterparty_style=req.counterparty_style,
     )
-    db.add(session)
-    await db.flush()
-    thread = MessageThread(session_id=session.id)
-    db.add(thread)
+    thread = MessageThread(session=session)
+    db.add_all([session, thread])
+    # One flush assigns both primary keys; the unit of work orders the inserts.
     await db.flush()
     session.active_thread_id = thread.id
     # Attach pre-existing entities if provided
@@ -208,19 +261,20 @@ async def create_session(
     )
     if not intake_questions:
         intake_questions = DEFAULT_INTAKE_QUESTIONS.copy()
-    updated_payload = dict(case_snapshot.payload)
+    # Only top-level keys change, so a shallow copy suffices and only the
+    # fields we touched need re-validating against the schema.
+    updated_payload = case_snapshot.payload.copy()
     updated_payload["intake"] = {
         "questions": intake_questions,
         "answers": {},
         "summary": None,
     }
-    updated_payload["updated_at"] = datetime.utcnow().isoformat()
+    updated_payload["updated_at"] = utc_now_iso()
     try:
-        validate_case_snapshot(updated_payload)
+        validate_case_snapshot(updated_payload, only=("intake", "updated_at"))
         case_snapshot.payload = updated_payload
     except Exception as exc:  # noqa: BLE001
         logger.warning("Case snapshot validation failed after intake questions: %s", exc)
-    await db.flush()
     if not intake_questions:
         try:
             await run_strategy_selection(
@@ -262,6 +316,24 @@ async def _get_session_or_404(db: AsyncSession, session_id: int, user_id: int) -
     return session
 
 
+async def _get_session_with_snapshot_or_404(
+    db: AsyncSession, session_id: int, user_id: int
+) -> Tuple[Session, CaseSnapshot]:
+    """Load a session together with its case snapshot in a single round-trip."""
+    result = await db.execute(
+        select(Session)
+        .options(joinedload(Session.case_snapshot))
+        .where(Session.id == session_id, Session.user_id == user_id)
+    )
+    session = result.scalar_one_or_none()
+    if session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+    snapshot = session.case_snapshot
+    if snapshot is None:
+        snapshot = await get_or_create_case_snapshot(db, session, None)
+    return session, snapshot
+
+
 async def _fetch_attached_entity_ids(db: AsyncSession, session_id: int) -> List[int]:
     result = await db.execute(
         select(SessionEntity.entity_id).where(SessionEntity.session_id == session_id)
@@ -270,10 +342,21 @@ async def _fetch_attached_entity_ids(db: AsyncSession, session_id: int) -> List[
 
 
 async def _ensure_active_thread(db: AsyncSession, session: Session) -> MessageThread:
-    """Ensure the session has an active root thread and return it."""
+    """Ensure the session has an active root thread and return it.
+
+    The resolved thread is remembered in ``db.info`` so repeated calls within
+    the same request (one DB session per request) skip the lookup.
+    """
+    resolved: Dict[Tuple[int, int], MessageThread] = db.info.setdefault(
+        "active_threads", {}
+    )
     if session.active_thread_id:
+        cached = resolved.get((session.id, session.active_thread_id))
+        if cached is not None:
+            return cached
         thread = await db.get(MessageThread, session.active_thread_id)
         if thread:
+            resolved[(session.id, thread.id)] = thread
             return thread
     thread = MessageThread(session_id=session.id)
     db.add(thread)
@@ -284,7 +367,7 @@ async def _ensure_active_thread(db: AsyncSession, session: Session) -> MessageTh
         .where(Message.session_id == session.id, Message.thread_id.is_(None))
         .values(thread_id=thread.id)
     )
-    await db.flush()
+    resolved[(session.id, thread.id)] = thread
     return thread
 
 
@@ -295,7 +378,7 @@ async def _get_root_thread_id(db: AsyncSession, session: Session) -> int:
         .order_by(MessageThread.created_at)
         .limit(1)
     )
-    root_id = result.scalar_one_or_none()
+    root_id = result.scalar()
     if root_id is None:
         root_id = (await _ensure_active_thread(db, session)).id
     return int(root_id)
@@ -308,6 +391,7 @@ async def _get_thread_path_messages(
     roles: Optional[List[MessageRole]] = None,
     limit: Optional[int] = None,
     exclude_message_id: Optional[int] = None,
+    max_message_id: Optional[int] = None,
 ) -> List[Message]:
     messages: List[Message] = []
     chain: List[MessageThread] = []
@@ -333,6 +417,8 @@ async def _get_thread_path_messages(
             query = query.where(Message.role.in_(roles))
         if exclude_message_id is not None:
             query = query.where(Message.id != exclude_message_id)
+        if max_message_id is not None:
+            query = query.where(Message.id <= max_message_id)
         query = query.order_by(Message.created_at)
         result = await db.execute(query)
         messages.extend(result.scalars().all())
@@ -369,21 +455,28 @@ def _json_default(value: object) -> str:
     return str(value)
 
 
-def _json_dumps(payload: object) -> str:
+def _json_dumps(payload: object) -> bytes:
     try:
-        return orjson.dumps(payload, default=_json_default).decode("utf-8")
+        return orjson.dumps(payload, default=_json_default)
     except orjson.JSONEncodeError:
-        return json.dumps(payload, default=_json_default)
+        return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
+_SSE_TOKEN_PREFIX = b"event: token\ndata: "
 
 
-def _sse_event(event: str, data: str) -> str:
-    return f"event: {event}\ndata: {data}\n\n"
+def _sse_event(event: str, data: bytes) -> bytes:
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + data + b"\n\n"
 
 
-def _sse_json(event: str, payload: object) -> str:
+def _sse_json(event: str, payload: object) -> bytes:
     return _sse_event(event, _json_dumps(payload))
 
 
+def _sse_token(token: str) -> bytes:
+    return _SSE_TOKEN_PREFIX + _json_dumps(token) + b"\n\n"
+
+
 def _empty_grounding_pack() -> Dict[str, Any]:
     return {
         "key_points": [],
@@ -394,19 +487,9 @@ def _empty_grounding_pack() -> Dict[str, Any]:
     }
 
 
-async def _can_run_search(
-    db: AsyncSession, user: User, session_id: int, trigger: Optional[str]
-) -> bool:
-    from ..models import Event
-
+def _can_run_search(user: User, session: Session, trigger: Optional[str]) -> bool:
     max_searches = 4 if user.tier == UserTier.premium else 2
-    search_count = await db.scalar(
-        select(func.count()).where(
-            Event.session_id == session_id,
-            Event.event_type == EventType.web_grounding_called,
-        )
-    )
-    search_count = int(search_count or 0)
+    search_count = session.grounding_call_count or 0
     if search_count >= max_searches:
         return False
     if trigger != "user_requested" and search_count >= 1:
@@ -434,7 +517,10 @@ async def _run_grounding_pipeline(
         if return_empty_pack_when_skipped:
             return _empty_grounding_pack(), [], 0
         return None, [], 0
-    decision = await need_search({"topic_text": topic_text, "template_id": template_id})
+    decision, plan = await decide_and_plan(
+        {"topic_text": topic_text, "template_id": template_id},
+        user_requested=force_user_request,
+    )
     if force_user_request:
         decision["need_search"] = True
         decision.setdefault("reason_codes", []).append("USER_REQUESTED")
@@ -450,14 +536,16 @@ async def _run_grounding_pipeline(
             session_id=session.id,
             payload=decision,
         )
-    if not await _can_run_search(db, user, session.id, trigger):
+    if not _can_run_search(user, session, trigger):
         if add_budget_reason:
             decision["need_search"] = False
             decision["reason_codes"] = decision.get("reason_codes", []) + ["BUDGET_EXCEEDED"]
         if return_empty_pack_when_skipped:
             return _empty_grounding_pack(), [], 0
         return None, [], 0
-    queries = (await plan_queries({"topic_text": topic_text}, decision)).get("queries", [])
+    if plan is None:
+        plan = await plan_queries({"topic_text": topic_text}, decision)
+    queries = plan.get("queries", [])
     decision_max = decision.get("max_queries")
     if isinstance(decision_max, int):
         queries = queries[:decision_max]
@@ -471,6 +559,7 @@ async def _run_grounding_pipeline(
         payload={"queries": queries},
     )
     results = await run_search(queries)
+    session.grounding_call_count = (session.grounding_call_count or 0) + 1
     await emit_event(
         db,
         EventType.web_grounding_called,
@@ -478,7 +567,7 @@ async def _run_grounding_pipeline(
         session_id=session.id,
         payload={"num_queries": len(queries)},
     )
-    grounding_pack = await synthesize(results, {})
+    grounding_pack = await synthesize(results, {"topic_text": topic_text})
     if not emit_decision_before_search:
         await emit_event(
             db,
@@ -533,12 +622,8 @@ async def get_session_detail(db: AsyncSession, user: User, session_id: int) -> S
     thread = await _ensure_active_thread(db, session)
     root_thread_id = await _get_root_thread_id(db, session)
     path_messages = await _get_thread_path_messages(db, session, thread, roles=None)
-    attached_entities = []
-    if session.attached_entities:
-        unique = {}
-        for ent in session.attached_entities:
-            unique[ent.id] = ent
-        attached_entities = [EntityOut.model_validate(ent) for ent in unique.values()]
+    # session_entities is keyed on (session_id, entity_id), so the selectin load is already unique.
+    attached_entities = [EntityOut.model_validate(ent) for ent in session.attached_entities]
     detail = SessionDetail(
         id=session.id,
         template_id=session.template_id,
@@ -612,15 +697,16 @@ async def stream_message(
     user: User,
     session_id: int,
     req: PostMessageRequest,
-) -> AsyncIterator[str]:
+) -> AsyncIterator[bytes]:
     """Stream a roleplay response as SSE events."""
     try:
-        session = await _get_session_or_404(db, session_id, user.id)
+        session, case_snapshot = await _get_session_with_snapshot_or_404(
+            db, session_id, user.id
+        )
         if session.ended_at is not None:
             yield _sse_json("error", {"detail": "Session has ended"})
             return
         active_thread = await _ensure_active_thread(db, session)
-        case_snapshot = await get_or_create_case_snapshot(db, session, None)
         role = MessageRole.user if req.channel == "roleplay" else MessageRole.coach
         user_message = Message(
             session_id=session.id,
@@ -642,6 +728,8 @@ async def stream_message(
             session_id=session.id,
             payload={"content": req.content},
         )
+        # Clients that predate POST /sessions/{id}/intake inline the summary into the
+        # first message; the bundled UI submits it once through that endpoint instead.
         intake_submitted = req.content.strip().startswith("Intake summary:")
         if intake_submitted:
             case_snapshot = await update_case_snapshot_from_intake(
@@ -660,41 +748,75 @@ async def stream_message(
                 role="user",
             )
         entity_ids = await _fetch_attached_entity_ids(db, session.id)
-        candidate_facts = await extract_candidate_facts(req.content, entity_ids)
-        extracted_fact_models = []
-        for cand in candidate_facts:
-            fact = Fact(
-                user_id=user.id,
-                session_id=session.id,
-                subject_entity_id=cand.get("subject_entity_id"),
-                key=cand.get("key"),
-                value=cand.get("value"),
-                scope=KnowledgeScope.session_scope,
-                confidence=1.0,
-                source_type="model_extracted",
-                source_ref=f"message:{user_message.id}",
-            )
-            db.add(fact)
-            await db.flush()
-            extracted_fact_models.append(fact)
+        # The intake summary is submitted once and kept on the snapshot; every turn
+        # reads it from there instead of the client resending it.
+        intake_summary = None
+        if not intake_submitted:
+            intake_summary = (case_snapshot.payload.get("intake") or {}).get("summary") or None
         grounding_topic = " ".join(
-            part for part in [session.topic_text or "", req.content or ""] if part
+            part for part in [session.topic_text, intake_summary, req.content] if part
         )
-        grounding_pack, _grounding_sources, _grounding_budget = await _run_grounding_pipeline(
-            db=db,
-            user=user,
-            session=session,
-            topic_text=grounding_topic,
-            template_id=session.template_id,
-            enable_web_grounding=bool(req.enable_web_grounding),
-            trigger=req.web_grounding_trigger,
-            force_user_request=False,
-            max_queries=None,
-            emit_decision_before_search=False,
-            emit_shown_to_user=False,
-            add_budget_reason=True,
-            return_empty_pack_when_skipped=False,
+        # Fact extraction and grounding are independent network calls; the grounding
+        # pipeline only stages events on the DB session, so both can run at once.
+        extraction_task = asyncio.create_task(extract_candidate_facts(req.content, entity_ids))
+        grounding_task = asyncio.create_task(
+            _run_grounding_pipeline(
+                db=db,
+                user=user,
+                session=session,
+                topic_text=grounding_topic,
+                template_id=session.template_id,
+                enable_web_grounding=bool(req.enable_web_grounding),
+                trigger=req.web_grounding_trigger,
+                force_user_request=False,
+                max_queries=None,
+                emit_decision_before_search=False,
+                emit_shown_to_user=False,
+                add_budget_reason=True,
+                return_empty_pack_when_skipped=False,
+            )
         )
+        try:
+            candidate_facts, (grounding_pack, _grounding_sources, _grounding_budget) = (
+                await asyncio.gather(extraction_task, grounding_task)
+            )
+        except BaseException:
+            extraction_task.cancel()
+            grounding_task.cancel()
+            raise
+        extracted_facts: List[Dict[str, Any]] = []
+        if candidate_facts:
+            source_ref = f"message:{user_message.id}"
+            fact_rows = [
+                {
+                    "user_id": user.id,
+                    "session_id": session.id,
+                    "subject_entity_id": cand.get("subject_entity_id"),
+                    "key": cand.get("key"),
+                    "value": cand.get("value"),
+                    "scope": KnowledgeScope.session_scope,
+                    "confidence": 1.0,
+                    "source_type": "model_extracted",
+                    "source_ref": source_ref,
+                }
+                for cand in candidate_facts
+            ]
+            fact_ids = (
+                await db.scalars(
+                    insert(Fact).returning(Fact.id, sort_by_parameter_order=True), fact_rows
+                )
+            ).all()
+            extracted_facts = [
+                {
+                    "id": fact_id,
+                    "subject_entity_id": row["subject_entity_id"],
+                    "key": row["key"],
+                    "value": row["value"],
+                    "scope": KnowledgeScope.session_scope.value,
+                    "source_ref": source_ref,
+                }
+                for fact_id, row in zip(fact_ids, fact_rows)
+            ]
         visible_facts = await compute_visible_facts(db, session)
         strategy_selection = await get_latest_strategy_selection(db, session.id)
         if intake_submitted and strategy_selection is None:
@@ -729,7 +851,7 @@ async def stream_message(
                 "grounding_used": bool(grounding_pack),
             },
         )
-        counterparty_chunks: List[str] = []
+        counterparty_buffer = io.StringIO()
         coach_panel = None
         if req.channel == "roleplay":
             orchestration = await run_orchestration(
@@ -745,6 +867,7 @@ async def stream_message(
                 counterparty_constraints,
                 include_coach=user.tier == UserTier.premium,
                 stream_roleplay=True,
+                intake_summary=intake_summary,
             )
             prompt_messages = orchestration.get("prompt_messages") or []
             coach_panel = orchestration.get("coach_panel")
@@ -769,6 +892,10 @@ async def stream_message(
                 session_id=session.id,
                 payload={"channel": req.channel},
             )
+            loop = asyncio.get_running_loop()
+            pending: List[str] = []
+            pending_chars = 0
+            last_flush = loop.time()
             async for token in generate_roleplay_stream(
                 req.content,
                 visible_facts,
@@ -780,10 +907,20 @@ async def stream_message(
                 counterparty_stance=counterparty_stance,
                 counterparty_constraints=counterparty_constraints,
             ):
-                if token:
-                    counterparty_chunks.append(token)
-                    yield _sse_json("token", token)
-            counterparty_message = "".join(counterparty_chunks).strip()
+                if not token:
+                    continue
+                counterparty_buffer.write(token)
+                pending.append(token)
+                pending_chars += len(token)
+                now = loop.time()
+                if pending_chars >= STREAM_FLUSH_CHARS or now - last_flush >= STREAM_FLUSH_SECONDS:
+                    yield _sse_token("".join(pending))
+                    pending.clear()
+                    pending_chars = 0
+                    last_flush = now
+            if pending:
+                yield _sse_token("".join(pending))
+            counterparty_message = counterparty_buffer.getvalue().strip()
             reply = Message(
                 session_id=session.id,
                 thread_id=active_thread.id,
@@ -814,17 +951,6 @@ async def stream_message(
             )
         else:
             counterparty_message = None
-        extracted_facts = [
-            {
-                "id": f.id,
-                "subject_entity_id": f.subject_entity_id,
-                "key": f.key,
-                "value": f.value,
-                "scope": f.scope.value if hasattr(f.scope, "value") else f.scope,
-                "source_ref": f.source_ref,
-            }
-            for f in extracted_fact_models
-        ]
         strategy_selection_payload = None
         if strategy_selection:
             strategy_selection_payload = dict(strategy_selection.selection_payload)
@@ -847,51 +973,58 @@ async def stream_message(
 
 async def end_session(db: AsyncSession, user: User, session_id: int) -> EndSessionResponse:
     """Mark a session as ended and provide a recap."""
+    settings = get_settings()
+    model = settings.litellm_model
+    base_kwargs = litellm_base_kwargs()
     session = await _get_session_or_404(db, session_id, user.id)
     if session.ended_at is not None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Session already ended")
-    session.ended_at = datetime.utcnow()
-    result = await db.execute(
-        select(Message).where(Message.session_id == session_id).order_by(Message.created_at)
+    if not model:
+        raise RuntimeError("LiteLLM model is not configured; cannot generate session recap.")
+    session.ended_at = _utcnow()
+    result = await db.stream(
+        select(Message.role, Message.content)
+        .where(Message.session_id == session_id)
+        .order_by(Message.created_at)
+        .execution_options(yield_per=RECAP_FETCH_BATCH)
     )
-    messages = result.scalars().all()
+    transcript: List[dict] = []
+    async for partition in result.partitions():
+        transcript.extend(
+            {"role": role.value if hasattr(role, "value") else str(role), "content": content}
+            for role, content in partition
+        )
+    # Short, stable fields first and the growing transcript last, so repeated
+    # recaps share the longest possible prompt prefix.
     payload = {
-        "topic_text": session.topic_text,
-        "template_id": session.template_id,
-        "messages": [
-            {"role": msg.role.value if hasattr(msg.role, "value") else str(msg.role), "content": msg.content}
-            for msg in messages
-        ],
         "premium": user.tier == UserTier.premium,
+        "template_id": session.template_id,
+        "topic_text": session.topic_text,
+        "messages": transcript,
     }
-    system_prompt = (
-        "You are the Session Recap agent. Produce a concise descriptive recap of the session. "
-        "If premium=true, also produce an after_action_report with coaching insights. "
-        "If premium=false, do not include advice or coaching language. "
-        'Output JSON only: {"recap":"...","after_action_report":"..."}'
-    )
-    settings = get_settings()
-    if not settings.litellm_model:
-        raise RuntimeError("LiteLLM model is not configured; cannot generate session recap.")
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **base_kwargs,
         "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": json.dumps(payload)},
+            cached_system_message(model, SESSION_RECAP_PROMPT),
+            {"role": "user", "content": _json_dumps(payload).decode("utf-8")},
         ],
         "temperature": 0.2,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
-
-        client = from_litellm(acompletion_with_retry)
-        response = await client(response_model=SessionRecapResult, **completion_kwargs)
-        recap_result = response
-    except Exception:
+    recap_result: Optional[SessionRecapResult] = None
+    if settings.litellm_supports_tools:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            recap_result = await client(response_model=SessionRecapResult, **completion_kwargs)
+        except STRUCTURED_OUTPUT_ERRORS as exc:
+            logger.warning("Structured session recap failed; parsing JSON instead. Error: %s", exc)
+            # Reuse the completion instructor already received before asking again.
+            content = extract_completion_text(getattr(exc, "last_completion", None))
+            if content:
+                try:
+                    recap_result = SessionRecapResult.model_validate_json(content)
+                except ValueError:
+                    recap_result = None
+    if recap_result is None:
         response = await acompletion_with_retry(**completion_kwargs)
         content = extract_completion_text(response)
         if not content:
@@ -914,26 +1047,31 @@ async def commit_memory_review(
     committed = await commit_facts(
         db, session, [d.model_dump() for d in req.decisions], user_id=user.id
     )
-    # Build response
-    updated_facts = [
-        {
-            "id": f.id,
-            "subject_entity_id": f.subject_entity_id,
-            "key": f.key,
-            "value": f.value,
-            "scope": f.scope,
-        }
-        for f in committed
-    ]
-    # Emit events per fact
+    # Build the response and collect one event per fact in a single pass
+    updated_facts: List[dict] = []
+    event_rows: List[dict] = []
     for f in committed:
-        await emit_event(
-            db,
-            EventType.fact_confirmed if f.scope == KnowledgeScope.global_scope else EventType.fact_suggested,
-            user.id,
-            session_id=session.id,
-            payload={"fact_id": f.id, "scope": f.scope.value},
+        updated_facts.append(
+            {
+                "id": f.id,
+                "subject_entity_id": f.subject_entity_id,
+                "key": f.key,
+                "value": f.value,
+                "scope": f.scope,
+            }
+        )
+        event_rows.append(
+            build_event_row(
+                EventType.fact_confirmed
+                if f.scope == KnowledgeScope.global_scope
+                else EventType.fact_suggested,
+                user.id,
+                session_id=session.id,
+                payload={"fact_id": f.id, "scope": f.scope.value},
+            )
         )
+    if event_rows:
+        await db.execute(insert(Event), event_rows)
     return MemoryReviewResponse(updated_facts=updated_facts)
 
 
@@ -950,17 +1088,62 @@ async def list_session_facts(db: AsyncSession, user: User, session_id: int) -> L
     return result.scalars().all()
 
 
-async def list_session_events(db: AsyncSession, user: User, session_id: int) -> List:
-    """Return ordered events for a session."""
+async def list_session_events(
+    db: AsyncSession,
+    user: User,
+    session_id: int,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    event_type: Optional[EventType] = None,
+    newest_first: bool = False,
+) -> List:
+    """Return events for a session in insertion order.
+
+    ``after_id``/``limit`` page through long histories by keyset on the
+    primary key, so each page is a bounded index range scan. ``event_type``
+    narrows the scan through the (session_id, event_type) index, and
+    ``newest_first`` with ``limit=1`` fetches the latest event of a kind.
+    """
     await _get_session_or_404(db, session_id, user.id)
-    from ..models import Event
-
-    result = await db.execute(
-        select(Event).where(Event.session_id == session_id).order_by(Event.created_at)
-    )
+    query = select(Event).where(Event.session_id == session_id)
+    if event_type is not None:
+        query = query.where(Event.event_type == event_type)
+    if after_id is not None:
+        query = query.where(Event.id > after_id)
+    query = query.order_by(desc(Event.id) if newest_first else Event.id)
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
     return result.scalars().all()
 
 
+def _branch_dict(
+    thread: MessageThread, counterparty_response: Optional[str], active_thread_id: Optional[int]
+) -> dict:
+    """Serialize a branch thread and its counterparty response for the routes API."""
+    (
+        thread_id,
+        parent_id,
+        variant,
+        rationale,
+        action_label,
+        branch_label,
+        created_at,
+    ) = _branch_fields(thread)
+    return {
+        "branch_id": str(thread_id),
+        "thread_id": thread_id,
+        "parent_message_id": int(parent_id),
+        "variant": variant or "LIKELY",
+        "counterparty_response": counterparty_response or "",
+        "rationale": rationale or "",
+        "action_label": action_label or "",
+        "branch_label": branch_label or "",
+        "created_at": created_at.isoformat(),
+        "is_active": thread_id == active_thread_id,
+    }
+
+
 async def list_route_branches(
     db: AsyncSession,
     user: User,
@@ -970,59 +1153,58 @@ async def list_route_branches(
     """List stored route branches for the session."""
     session = await _get_session_or_404(db, session_id, user.id)
     await _ensure_active_thread(db, session)
-    query = select(MessageThread).where(
-        MessageThread.session_id == session.id, MessageThread.parent_message_id.is_not(None)
+    # Rank each thread's counterparty messages so the join keeps only the first one.
+    first_reply = (
+        select(
+            Message.thread_id,
+            Message.content,
+            func.row_number()
+            .over(partition_by=Message.thread_id, order_by=(Message.created_at, Message.id))
+            .label("rn"),
+        )
+        .where(Message.session_id == session.id, Message.role == MessageRole.counterparty)
+        .subquery()
     )
-    if parent_message_id is not None:
-        query = query.where(MessageThread.parent_message_id == parent_message_id)
-    result = await db.execute(query.order_by(MessageThread.created_at))
-    threads = result.scalars().all()
-    if not threads:
-        return []
-    thread_ids = [thread.id for thread in threads]
-    message_result = await db.execute(
-        select(Message)
+    query = (
+        select(MessageThread, first_reply.c.content)
+        .outerjoin(
+            first_reply,
+            and_(first_reply.c.thread_id == MessageThread.id, first_reply.c.rn == 1),
+        )
         .where(
-            Message.thread_id.in_(thread_ids),
-            Message.role == MessageRole.counterparty,
+            MessageThread.session_id == session.id,
+            MessageThread.parent_message_id.is_not(None),
         )
-        .order_by(Message.created_at)
     )
-    messages = message_result.scalars().all()
-    first_message_by_thread: Dict[int, Message] = {}
-    for msg in messages:
-        if msg.thread_id not in first_message_by_thread:
-            first_message_by_thread[msg.thread_id] = msg
-    branches: List[dict] = []
-    for thread in threads:
-        counterparty_message = first_message_by_thread.get(thread.id)
-        branches.append(
-            {
-                "branch_id": str(thread.id),
-                "thread_id": thread.id,
-                "parent_message_id": int(thread.parent_message_id),
-                "variant": thread.variant or "LIKELY",
-                "counterparty_response": counterparty_message.content if counterparty_message else "",
-                "rationale": thread.rationale or "",
-                "action_label": thread.action_label or "",
-                "branch_label": thread.branch_label or "",
-                "created_at": thread.created_at.isoformat(),
-                "is_active": thread.id == session.active_thread_id,
-            }
-        )
-    return branches
+    if parent_message_id is not None:
+        query = query.where(MessageThread.parent_message_id == parent_message_id)
+    result = await db.execute(query.order_by(MessageThread.created_at))
+    active_thread_id = session.active_thread_id
+    return [
+        _branch_dict(thread, counterparty_response, active_thread_id)
+        for thread, counterparty_response in result.all()
+    ]
 
 
 async def activate_thread(
     db: AsyncSession, user: User, session_id: int, thread_id: int
 ) -> SessionDetail:
     """Activate a thread (branch) as the current mainline path."""
-    session = await _get_session_or_404(db, session_id, user.id)
-    thread = await db.get(MessageThread, thread_id)
-    if thread is None or thread.session_id != session.id:
+    thread_exists = (
+        select(MessageThread.id)
+        .where(MessageThread.id == thread_id, MessageThread.session_id == session_id)
+        .exists()
+    )
+    result = await db.execute(
+        update(Session)
+        .where(Session.id == session_id, Session.user_id == user.id, thread_exists)
+        .values(active_thread_id=thread_id)
+        .returning(Session.id)
+    )
+    if result.scalar_one_or_none() is None:
+        # Nothing updated: report a missing session before a missing thread.
+        await _get_session_or_404(db, session_id, user.id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Thread not found")
-    session.active_thread_id = thread.id
-    await db.flush()
     return await get_session_detail(db, user, session_id)
 
 
@@ -1043,37 +1225,22 @@ async def update_branch(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot edit mainline thread.")
     if branch_label is not None:
         thread.branch_label = branch_label.strip() or None
-    if counterparty_response is not None:
-        msg_result = await db.execute(
-            select(Message)
-            .where(
-                Message.thread_id == thread.id,
-                Message.role == MessageRole.counterparty,
-            )
-            .order_by(Message.created_at)
-            .limit(1)
+    msg_result = await db.execute(
+        select(Message)
+        .where(
+            Message.thread_id == thread.id,
+            Message.role == MessageRole.counterparty,
         )
-        msg = msg_result.scalar_one_or_none()
+        .order_by(Message.created_at)
+        .limit(1)
+    )
+    msg = msg_result.scalar_one_or_none()
+    if counterparty_response is not None:
         if msg is None:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Branch response not found.")
         msg.content = counterparty_response.strip()
     await db.flush()
-    branch_list = await list_route_branches(db, user, session_id, parent_message_id=thread.parent_message_id)
-    for branch in branch_list:
-        if str(branch.get("thread_id")) == str(thread.id):
-            return branch
-    return {
-        "branch_id": str(thread.id),
-        "thread_id": thread.id,
-        "parent_message_id": int(thread.parent_message_id),
-        "variant": thread.variant or "LIKELY",
-        "counterparty_response": counterparty_response or "",
-        "rationale": thread.rationale or "",
-        "action_label": thread.action_label or "",
-        "branch_label": thread.branch_label or "",
-        "created_at": thread.created_at.isoformat(),
-        "is_active": thread.id == session.active_thread_id,
-    }
+    return _branch_dict(thread, msg.content if msg else None, session.active_thread_id)
 
 
 async def copy_branch(
@@ -1109,28 +1276,16 @@ async def copy_branch(
         action_label=source.action_label,
         branch_label=branch_label or source.branch_label or source.action_label,
     )
-    db.add(new_thread)
-    await db.flush()
     new_msg = Message(
         session_id=session.id,
-        thread_id=new_thread.id,
+        thread=new_thread,
         role=MessageRole.counterparty,
         content=(counterparty_response or msg.content).strip(),
     )
-    db.add(new_msg)
+    # One flush inserts the thread first and fills in the message's thread_id.
+    db.add_all([new_thread, new_msg])
     await db.flush()
-    return {
-        "branch_id": str(new_thread.id),
-        "thread_id": new_thread.id,
-        "parent_message_id": int(new_thread.parent_message_id),
-        "variant": new_thread.variant or "LIKELY",
-        "counterparty_response": new_msg.content,
-        "rationale": new_thread.rationale or "",
-        "action_label": new_thread.action_label or "",
-        "branch_label": new_thread.branch_label or "",
-        "created_at": new_thread.created_at.isoformat(),
-        "is_active": new_thread.id == session.active_thread_id,
-    }
+    return _branch_dict(new_thread, new_msg.content, session.active_thread_id)
 
 
 async def delete_branch(
@@ -1146,8 +1301,17 @@ async def delete_branch(
     if session.active_thread_id == thread.id:
         root_id = await _get_root_thread_id(db, session)
         session.active_thread_id = root_id
-    await db.delete(thread)
+    db.info.get("active_threads", {}).pop((session.id, thread.id), None)
     await db.flush()
+    # Bulk statements instead of db.delete(), which would load and delete each
+    # message and re-parent each child thread one row at a time.
+    await db.execute(delete(Message).where(Message.thread_id == thread.id))
+    await db.execute(
+        update(MessageThread)
+        .where(MessageThread.parent_thread_id == thread.id)
+        .values(parent_thread_id=None)
+    )
+    await db.execute(delete(MessageThread).where(MessageThread.id == thread.id))
 
 
 async def generate_route(
@@ -1159,33 +1323,41 @@ async def generate_route(
     parent_message_id: Optional[int] = None,
 ) -> dict:
     """Generate a new route branch anchored to the latest user message."""
-    session = await _get_session_or_404(db, session_id, user.id)
-    snapshot = await get_or_create_case_snapshot(db, session, None)
+    session, snapshot = await _get_session_with_snapshot_or_404(db, session_id, user.id)
     active_thread = await _ensure_active_thread(db, session)
     # parent_message_id = latest user message (unless explicitly provided)
-    path_messages = await _get_thread_path_messages(
-        db,
-        session,
-        active_thread,
-        roles=[MessageRole.user, MessageRole.counterparty],
-        limit=None,
-    )
+    parent_message: Optional[Message] = None
     if parent_message_id is None:
-        for msg in reversed(path_messages):
-            if msg.role == MessageRole.user:
-                parent_message_id = msg.id
-                break
-    if not parent_message_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No user message found to anchor the route.",
+        result = await db.execute(
+            select(Message)
+            .where(
+                Message.session_id == session.id,
+                Message.thread_id == active_thread.id,
+                Message.role == MessageRole.user,
+            )
+            .order_by(desc(Message.created_at))
+            .limit(1)
         )
-    parent_message = None
-    for msg in path_messages:
-        if msg.id == parent_message_id:
-            parent_message = msg
-            break
-    if parent_message is None or parent_message.role != MessageRole.user:
+        parent_message = result.scalar_one_or_none()
+        if parent_message is None:
+            # The active branch has no user turn yet; fall back to its ancestors.
+            user_messages = await _get_thread_path_messages(
+                db, session, active_thread, roles=[MessageRole.user]
+            )
+            parent_message = user_messages[-1] if user_messages else None
+        if parent_message is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No user message found to anchor the route.",
+            )
+        parent_message_id = parent_message.id
+    else:
+        parent_message = await db.get(Message, parent_message_id)
+    if (
+        parent_message is None
+        or parent_message.session_id != session.id
+        or parent_message.role != MessageRole.user
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid parent message for route generation.",
@@ -1196,15 +1368,24 @@ async def generate_route(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Parent message is missing a thread assignment.",
         )
-    history_messages: List[Message] = []
-    for msg in path_messages:
-        history_messages.append(msg)
-        if msg.id == parent_message_id:
-            break
+    # The path is chronological, so bounding by id stops it at the parent message.
+    history_messages = await _get_thread_path_messages(
+        db,
+        session,
+        active_thread,
+        roles=[MessageRole.user, MessageRole.counterparty],
+        max_message_id=parent_message.id,
+    )
+    if not history_messages or history_messages[-1].id != parent_message.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid parent message for route generation.",
+        )
+    user_role = MessageRole.user
     history = [
-        {"role": "user" if msg.role == MessageRole.user else "assistant", "content": msg.content}
+        {"role": "user" if msg.role is user_role else "assistant", "content": msg.content}
         for msg in history_messages
-        if msg.role in [MessageRole.user, MessageRole.counterparty]
+        if msg.role in DIALOGUE_ROLES
     ]
     strategy_selection = await get_latest_strategy_selection(db, session.id)
     strategy_context = None
@@ -1230,15 +1411,13 @@ async def generate_route(
         action_label=result.action_label,
         branch_label=result.action_label,
     )
-    db.add(branch_thread)
-    await db.flush()
     branch_message = Message(
         session_id=session.id,
-        thread_id=branch_thread.id,
+        thread=branch_thread,
         role=MessageRole.counterparty,
         content=result.counterparty_response,
     )
-    db.add(branch_message)
+    db.add_all([branch_thread, branch_message])
     await db.flush()
     branch = {
         "branch_id": str(branch_thread.id),
@@ -1258,10 +1437,7 @@ async def get_case_snapshot_detail(
     db: AsyncSession, user: User, session_id: int
 ) -> CaseSnapshot:
     """Return the current case snapshot for the session."""
-    session = await _get_session_or_404(db, session_id, user.id)
-    snapshot = await get_case_snapshot(db, session.id)
-    if snapshot is None:
-        snapshot = await get_or_create_case_snapshot(db, session, None)
+    _, snapshot = await _get_session_with_snapshot_or_404(db, session_id, user.id)
     return snapshot
 
 
@@ -1269,10 +1445,9 @@ async def update_case_snapshot(
     db: AsyncSession, user: User, session_id: int, patches: List[dict]
 ) -> CaseSnapshot:
     """Apply JSON patch updates to the case snapshot."""
-    session = await _get_session_or_404(db, session_id, user.id)
-    snapshot = await get_or_create_case_snapshot(db, session, None)
+    _, snapshot = await _get_session_with_snapshot_or_404(db, session_id, user.id)
     updated_payload = apply_case_patches(snapshot.payload, patches)
-    updated_payload["updated_at"] = datetime.utcnow().isoformat()
+    updated_payload["updated_at"] = utc_now_iso()
     try:
         validate_case_snapshot(updated_payload)
     except Exception as exc:  # noqa: BLE001
@@ -1321,6 +1496,42 @@ async def get_latest_strategy_execution(
     return await fetch_latest_strategy_execution(db, session.id)
 
 
+async def get_strategy_state(
+    db: AsyncSession, user: User, session_id: int
+) -> tuple[CaseSnapshot, Optional[StrategySelection], Optional[StrategyExecution]]:
+    """Return the case snapshot, latest selection and latest execution in one query."""
+    latest_selection_id = (
+        select(StrategySelection.id)
+        .where(StrategySelection.session_id == Session.id)
+        .order_by(desc(StrategySelection.created_at))
+        .limit(1)
+        .correlate(Session)
+        .scalar_subquery()
+    )
+    latest_execution_id = (
+        select(StrategyExecution.id)
+        .where(StrategyExecution.session_id == Session.id)
+        .order_by(desc(StrategyExecution.created_at))
+        .limit(1)
+        .correlate(Session)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(Session, CaseSnapshot, StrategySelection, StrategyExecution)
+        .outerjoin(CaseSnapshot, CaseSnapshot.session_id == Session.id)
+        .outerjoin(StrategySelection, StrategySelection.id == latest_selection_id)
+        .outerjoin(StrategyExecution, StrategyExecution.id == latest_execution_id)
+        .where(Session.id == session_id, Session.user_id == user.id)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+    session, snapshot, selection, execution = row
+    if snapshot is None:
+        snapshot = await get_or_create_case_snapshot(db, session, None)
+    return snapshot, selection, execution
+
+
 async def run_strategy_selection_for_session(
     db: AsyncSession,
     user: User,
@@ -1344,8 +1555,7 @@ async def execute_strategy(
     inputs: Dict[str, Any],
 ) -> StrategyExecution:
     """Execute a strategy for the session and persist artifacts."""
-    session = await _get_session_or_404(db, session_id, user.id)
-    snapshot = await get_or_create_case_snapshot(db, session, None)
+    session, snapshot = await _get_session_with_snapshot_or_404(db, session_id, user.id)
     selection = await get_latest_strategy_selection(db, session.id)
     chosen_strategy_id = strategy_id or (selection.selected_strategy_id if selection else None)
     if not chosen_strategy_id:
@@ -1365,7 +1575,7 @@ async def execute_strategy(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     if execution.case_patches:
         updated_payload = apply_case_patches(snapshot.payload, execution.case_patches)
-        updated_payload["updated_at"] = datetime.utcnow().isoformat()
+        updated_payload["updated_at"] = utc_now_iso()
         try:
             validate_case_snapshot(updated_payload)
             snapshot.payload = updated_payload
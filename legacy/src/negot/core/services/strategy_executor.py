@@ -6,19 +6,27 @@ from __future__ import annotations
 import json
 import logging
 import hashlib
-from datetime import datetime
-from typing import Dict, List
+from typing import List, Optional, Tuple
 
+import orjson
 from pydantic import BaseModel, Field
 
 from ..config import get_settings
-from .llm_utils import acompletion_with_retry, extract_completion_text, extract_json_object
-from .conditions import evaluate_condition
+from ..utils.timeutils import utc_now_iso
+from .llm_utils import (
+    acompletion_with_retry,
+    cached_system_message,
+    extract_completion_text,
+    extract_json_object,
+    instructor_client,
+    litellm_base_kwargs,
+)
+from .conditions import compile_conditions
 
 logger = logging.getLogger(__name__)
 
 STRATEGY_EXECUTION_PROMPT = """You are the Strategy Execution agent.
-You receive a compacted CaseSnapshot, StrategyTemplate, and inputs (IDs removed, only salient fields included).
+You receive the rubrics and StrategyTemplate, then a compacted CaseSnapshot and inputs (IDs removed, only salient fields included).
 Produce execution outputs using this compact context.
 Return JSON only matching this schema:
 {"request":{"case_snapshot":{...},"strategy":{...},"inputs":{...}},
@@ -50,9 +58,6 @@ class StrategyExecutionIO(BaseModel):
     response: StrategyExecutionResponse
 
 
-def _now_iso() -> str:
-    return datetime.utcnow().isoformat()
-
 
 def _truncate_text(value: object, max_len: int = 500) -> str:
     text = "" if value is None else str(value)
@@ -66,6 +71,10 @@ def _hash_payload(payload: dict) -> str:
     return hashlib.sha256(raw).hexdigest()
 
 
+def _dumps_text(payload: object) -> str:
+    return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
 def _compact_event(event: dict) -> dict:
     if not isinstance(event, dict):
         return {"summary": _truncate_text(event)}
@@ -231,12 +240,16 @@ def _build_failure_response(
     detail: str,
     model_request: dict | None = None,
     model_output_raw: str | None = None,
+    now: str | None = None,
 ) -> StrategyExecutionResponse:
+    now = now or utc_now_iso()
+    strategy_id = strategy["strategy_id"]
+    revision = strategy.get("revision", 1)
     artifact = {
-        "artifact_id": f"ARTIFACT_{strategy['strategy_id']}_ERROR",
+        "artifact_id": f"ARTIFACT_{strategy_id}_ERROR",
         "type": "CHECKLIST",
         "title": "Execution failed",
-        "created_at": _now_iso(),
+        "created_at": now,
         "content": {
             "items": [
                 {
@@ -250,8 +263,8 @@ def _build_failure_response(
         },
         "metadata": {
             "case_id": case_id,
-            "strategy_id": strategy["strategy_id"],
-            "strategy_revision": strategy.get("revision", 1),
+            "strategy_id": strategy_id,
+            "strategy_revision": revision,
             "inputs_used": inputs,
         },
     }
@@ -275,10 +288,10 @@ def _build_failure_response(
             }
         ],
         trace={
-            "strategy_id": strategy["strategy_id"],
-            "strategy_revision": strategy.get("revision", 1),
+            "strategy_id": strategy_id,
+            "strategy_revision": revision,
             "inputs_used": inputs,
-            "generated_at": _now_iso(),
+            "generated_at": now,
             "blocked": True,
             "error": reason,
             "error_detail": detail[:500],
@@ -307,29 +320,26 @@ def _coerce_execution_payload(
 
 
 def _failed_prereqs(strategy: dict, case_snapshot: dict) -> List[dict]:
-    failed = []
-    for prereq in strategy.get("applicability", {}).get("prerequisites", []):
-        condition = prereq.get("condition") or {}
-        if not evaluate_condition(condition, case_snapshot):
-            failed.append(prereq)
-    return failed
+    prereqs = strategy.get("applicability", {}).get("prerequisites", [])
+    checks = compile_conditions([prereq.get("condition") or {} for prereq in prereqs])
+    return [prereq for prereq, check in zip(prereqs, checks) if not check(case_snapshot)]
 
 
 def _normalize_artifacts(
-    artifacts: List[dict], strategy: dict, inputs: dict, case_id: str
+    artifacts: List[dict], strategy: dict, inputs: dict, case_id: str, now: str
 ) -> List[dict]:
+    strategy_id = strategy["strategy_id"]
+    default_metadata = {
+        "case_id": case_id,
+        "strategy_id": strategy_id,
+        "strategy_revision": strategy.get("revision", 1),
+        "inputs_used": inputs,
+    }
     normalized = []
     for idx, artifact in enumerate(artifacts, start=1):
-        artifact_id = artifact.get("artifact_id") or f"ARTIFACT_{strategy['strategy_id']}_{idx}"
-        created_at = artifact.get("created_at") or _now_iso()
-        metadata = artifact.get("metadata") or {}
-        metadata.setdefault("case_id", case_id)
-        metadata.setdefault("strategy_id", strategy["strategy_id"])
-        metadata.setdefault("strategy_revision", strategy.get("revision", 1))
-        metadata.setdefault("inputs_used", inputs)
-        artifact["artifact_id"] = artifact_id
-        artifact["created_at"] = created_at
-        artifact["metadata"] = metadata
+        artifact["artifact_id"] = artifact.get("artifact_id") or f"ARTIFACT_{strategy_id}_{idx}"
+        artifact["created_at"] = artifact.get("created_at") or now
+        artifact["metadata"] = {**default_metadata, **(artifact.get("metadata") or {})}
         normalized.append(artifact)
     return normalized
 
@@ -341,21 +351,23 @@ def _apply_auto_gates(
     judge_outputs: List[dict],
 ) -> List[dict]:
     auto_gates = strategy.get("evaluation", {}).get("auto_gates") or []
-    if not auto_gates or not artifacts:
+    if not auto_gates:
+        return judge_outputs
+    drafts = [artifact for artifact in artifacts if artifact.get("type") == "MESSAGE_DRAFT"]
+    if not drafts:
         return judge_outputs
+    checks = compile_conditions([gate.get("condition") or {} for gate in auto_gates])
     flags = []
-    for artifact in artifacts:
-        if artifact.get("type") != "MESSAGE_DRAFT":
-            continue
+    # One shallow copy shared by every draft; only execution_context changes per artifact.
+    context = dict(case_snapshot)
+    for artifact in drafts:
         draft_text = ""
         content = artifact.get("content") or {}
         if isinstance(content, dict):
             draft_text = content.get("text") or ""
-        context = dict(case_snapshot)
         context["execution_context"] = {"draft_text": draft_text}
-        for gate in auto_gates:
-            condition = gate.get("condition") or {}
-            if evaluate_condition(condition, context):
+        for gate, check in zip(auto_gates, checks):
+            if check(context):
                 flags.append(
                     {
                         "flag_id": gate.get("gate_id", "AUTO_GATE"),
@@ -382,57 +394,54 @@ def _apply_auto_gates(
     return judge_outputs
 
 
-async def execute_strategy(
-    *,
-    case_snapshot: dict,
-    strategy: dict,
-    inputs: dict,
-    rubrics: List[dict],
+def _blocked_response(
+    strategy: dict, inputs: dict, case_id: str, failed_prereqs: List[dict], now: str
 ) -> StrategyExecutionResponse:
-    settings = get_settings()
-    if not settings.litellm_model:
-        raise RuntimeError("LiteLLM model is not configured; cannot execute strategy.")
-
-    case_id = case_snapshot.get("case_id", "CASE_UNKNOWN")
-    failed_prereqs = _failed_prereqs(strategy, case_snapshot)
-    if failed_prereqs:
-        remediation = [
-            {
-                "id": prereq.get("id"),
-                "description": prereq.get("description"),
-                "remediation": prereq.get("remediation"),
-                "severity": prereq.get("severity"),
-            }
-            for prereq in failed_prereqs
-        ]
-        artifacts = [
-            {
-                "artifact_id": f"ARTIFACT_{strategy['strategy_id']}_BLOCKED",
-                "type": "CHECKLIST",
-                "title": "Prerequisites required before execution",
-                "created_at": _now_iso(),
-                "content": {"items": remediation},
-                "metadata": {
-                    "case_id": case_id,
-                    "strategy_id": strategy["strategy_id"],
-                    "strategy_revision": strategy.get("revision", 1),
-                    "inputs_used": inputs,
-                },
-            }
-        ]
-        return StrategyExecutionResponse(
-            artifacts=artifacts,
-            case_patches=[],
-            judge_outputs=[],
-            trace={
-                "strategy_id": strategy["strategy_id"],
-                "strategy_revision": strategy.get("revision", 1),
+    strategy_id = strategy["strategy_id"]
+    revision = strategy.get("revision", 1)
+    remediation = [
+        {
+            "id": prereq.get("id"),
+            "description": prereq.get("description"),
+            "remediation": prereq.get("remediation"),
+            "severity": prereq.get("severity"),
+        }
+        for prereq in failed_prereqs
+    ]
+    artifacts = [
+        {
+            "artifact_id": f"ARTIFACT_{strategy_id}_BLOCKED",
+            "type": "CHECKLIST",
+            "title": "Prerequisites required before execution",
+            "created_at": now,
+            "content": {"items": remediation},
+            "metadata": {
+                "case_id": case_id,
+                "strategy_id": strategy_id,
+                "strategy_revision": revision,
                 "inputs_used": inputs,
-                "generated_at": _now_iso(),
-                "blocked": True,
             },
-        )
+        }
+    ]
+    return StrategyExecutionResponse(
+        artifacts=artifacts,
+        case_patches=[],
+        judge_outputs=[],
+        trace={
+            "strategy_id": strategy_id,
+            "strategy_revision": revision,
+            "inputs_used": inputs,
+            "generated_at": now,
+            "blocked": True,
+        },
+    )
+
 
+def _build_completion_request(
+    case_snapshot: dict, strategy: dict, inputs: dict, rubrics: List[dict]
+) -> Tuple[dict, dict]:
+    """Return the LiteLLM kwargs and the trace copy of the model request."""
+    settings = get_settings()
     full_input_payload = {
         "case_snapshot": case_snapshot,
         "strategy": strategy,
@@ -444,12 +453,24 @@ async def execute_strategy(
         "strategy": _compact_strategy(strategy, inputs),
         "rubrics": _compact_rubrics(rubrics),
     }
-    compact_payload_text = json.dumps(compact_payload, default=str)
+    # Order blocks from most to least stable so provider prefix caches cover as
+    # much as possible: prompt, rubrics and strategy steps are cacheable system
+    # blocks; the case snapshot and input values change per run and go last.
+    strategy_brief = dict(compact_payload["strategy"])
+    inputs_brief = strategy_brief.pop("inputs")
+    rubrics_text = _dumps_text({"rubrics": compact_payload["rubrics"]})
+    strategy_text = _dumps_text({"strategy": strategy_brief})
+    context_text = _dumps_text(
+        {"case_snapshot": compact_payload["case_snapshot"], "inputs": inputs_brief}
+    )
+    compact_payload_text = rubrics_text + strategy_text + context_text
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
-            {"role": "system", "content": STRATEGY_EXECUTION_PROMPT},
-            {"role": "user", "content": compact_payload_text},
+            cached_system_message(settings.litellm_model, STRATEGY_EXECUTION_PROMPT),
+            cached_system_message(settings.litellm_model, rubrics_text),
+            cached_system_message(settings.litellm_model, strategy_text),
+            {"role": "user", "content": context_text},
         ],
         "temperature": 0.3,
     }
@@ -461,50 +482,64 @@ async def execute_strategy(
         "full_input_hash": _hash_payload(full_input_payload),
         "compact_chars": len(compact_payload_text),
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    execution = None
-    try:
-        from instructor import from_litellm
+    return completion_kwargs, model_request_payload
 
-        client = from_litellm(acompletion_with_retry)
-        execution = await client(response_model=StrategyExecutionIO, **completion_kwargs)
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Instructor parsing failed for strategy execution: %s", exc)
-        response = await acompletion_with_retry(**completion_kwargs)
-        content = extract_completion_text(response)
-        if not content:
-            raise RuntimeError("LiteLLM returned an empty strategy execution output.")
+
+def _parse_execution_output(
+    content: Optional[str],
+    *,
+    case_snapshot: dict,
+    strategy: dict,
+    inputs: dict,
+    case_id: str,
+    model_request_payload: dict,
+    now: str,
+) -> StrategyExecutionIO | StrategyExecutionResponse:
+    """Parse raw model output, returning a failure response when it cannot be salvaged."""
+    if not content:
+        raise RuntimeError("LiteLLM returned an empty strategy execution output.")
+    try:
+        return StrategyExecutionIO.model_validate_json(content)
+    except Exception as parse_exc:  # noqa: BLE001
+        logger.warning("Failed to parse strategy execution output. Error: %s", parse_exc)
+        extracted = extract_json_object(content)
+        if extracted is None:
+            return _build_failure_response(
+                strategy=strategy,
+                inputs=inputs,
+                case_id=case_id,
+                reason="Strategy execution output was not valid JSON.",
+                detail=f"{parse_exc}. raw_output_preview={content[:400]}",
+                model_request=model_request_payload,
+                model_output_raw=content,
+                now=now,
+            )
+        payload = _coerce_execution_payload(extracted, case_snapshot, strategy, inputs)
         try:
-            execution = StrategyExecutionIO.model_validate_json(content)
-        except Exception as parse_exc:  # noqa: BLE001
-            logger.warning("Failed to parse strategy execution output. Error: %s", parse_exc)
-            extracted = extract_json_object(content)
-            if extracted is None:
-                return _build_failure_response(
-                    strategy=strategy,
-                    inputs=inputs,
-                    case_id=case_id,
-                    reason="Strategy execution output was not valid JSON.",
-                    detail=f"{parse_exc}. raw_output_preview={content[:400]}",
-                    model_request=model_request_payload,
-                    model_output_raw=content,
-                )
-            payload = _coerce_execution_payload(extracted, case_snapshot, strategy, inputs)
-            try:
-                execution = StrategyExecutionIO.model_validate(payload)
-            except Exception as inner_exc:  # noqa: BLE001
-                return _build_failure_response(
-                    strategy=strategy,
-                    inputs=inputs,
-                    case_id=case_id,
-                    reason="Strategy execution output did not match the expected schema.",
-                    detail=str(inner_exc),
-                    model_request=model_request_payload,
-                    model_output_raw=content,
-                )
+            return StrategyExecutionIO.model_validate(payload)
+        except Exception as inner_exc:  # noqa: BLE001
+            return _build_failure_response(
+                strategy=strategy,
+                inputs=inputs,
+                case_id=case_id,
+                reason="Strategy execution output did not match the expected schema.",
+                detail=str(inner_exc),
+                model_request=model_request_payload,
+                model_output_raw=content,
+                now=now,
+            )
+
+
+def _finalize_execution(
+    execution: Optional[StrategyExecutionIO],
+    *,
+    case_snapshot: dict,
+    strategy: dict,
+    inputs: dict,
+    case_id: str,
+    model_request_payload: dict,
+    now: str,
+) -> StrategyExecutionResponse:
     if execution is None:
         return _build_failure_response(
             strategy=strategy,
@@ -513,10 +548,11 @@ async def execute_strategy(
             reason="Strategy execution did not return a response.",
             detail="No response parsed from model output.",
             model_request=model_request_payload,
+            now=now,
         )
-    if not isinstance(execution, StrategyExecutionIO):
-        execution = StrategyExecutionIO.model_validate(execution)
-    artifacts = _normalize_artifacts(execution.response.artifacts, strategy, inputs, case_id)
+    artifacts = _normalize_artifacts(
+        execution.response.artifacts, strategy, inputs, case_id, now
+    )
     judge_outputs = _apply_auto_gates(strategy, case_snapshot, artifacts, execution.response.judge_outputs)
     trace = execution.response.trace or {}
     trace.setdefault("model_request", model_request_payload)
@@ -527,10 +563,57 @@ async def execute_strategy(
     trace.setdefault("strategy_id", strategy["strategy_id"])
     trace.setdefault("strategy_revision", strategy.get("revision", 1))
     trace.setdefault("inputs_used", inputs)
-    trace.setdefault("generated_at", _now_iso())
-    return StrategyExecutionResponse(
-        artifacts=artifacts,
-        case_patches=execution.response.case_patches,
-        judge_outputs=judge_outputs,
-        trace=trace,
+    trace.setdefault("generated_at", now)
+    # The response was validated when it was parsed; copy it without re-validating.
+    return execution.response.model_copy(
+        update={"artifacts": artifacts, "judge_outputs": judge_outputs, "trace": trace}
     )
+
+
+async def execute_strategy(
+    *,
+    case_snapshot: dict,
+    strategy: dict,
+    inputs: dict,
+    rubrics: List[dict],
+) -> StrategyExecutionResponse:
+    settings = get_settings()
+    if not settings.litellm_model:
+        raise RuntimeError("LiteLLM model is not configured; cannot execute strategy.")
+
+    # One timestamp per run keeps artifacts and trace consistent with each other.
+    now = utc_now_iso()
+    case_id = case_snapshot.get("case_id", "CASE_UNKNOWN")
+    failed_prereqs = _failed_prereqs(strategy, case_snapshot)
+    if failed_prereqs:
+        return _blocked_response(strategy, inputs, case_id, failed_prereqs, now)
+
+    completion_kwargs, model_request_payload = _build_completion_request(
+        case_snapshot, strategy, inputs, rubrics
+    )
+    run_context = {
+        "case_snapshot": case_snapshot,
+        "strategy": strategy,
+        "inputs": inputs,
+        "case_id": case_id,
+        "model_request_payload": model_request_payload,
+        "now": now,
+    }
+    execution = None
+    # Models without function calling always fail the instructor attempt, so go
+    # straight to the plain JSON completion for them.
+    use_plain_completion = not settings.litellm_supports_tools
+    if not use_plain_completion:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            execution = await client(response_model=StrategyExecutionIO, **completion_kwargs)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Instructor parsing failed for strategy execution: %s", exc)
+            use_plain_completion = True
+    if use_plain_completion:
+        response = await acompletion_with_retry(**completion_kwargs)
+        parsed = _parse_execution_output(extract_completion_text(response), **run_context)
+        if isinstance(parsed, StrategyExecutionResponse):
+            return parsed
+        execution = parsed
+    return _finalize_execution(execution, **run_context)
@@ -6,14 +6,17 @@ from __future__ import annotations
 import json
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+import orjson
 from jsonschema import Draft202012Validator, RefResolver
 
 PACK_SCHEMA_NAME = "strategy_pack.schema.json"
 STRATEGY_SCHEMA_NAME = "strategy_template.schema.json"
 RUBRIC_SCHEMA_NAME = "rubric.schema.json"
 CASE_SNAPSHOT_SCHEMA_NAME = "case_snapshot.schema.json"
+# Stands in for ``updated_at`` when validating the rest of a snapshot from cache.
+_SNAPSHOT_STAMP_PLACEHOLDER = "1970-01-01T00:00:00"
 
 
 def _repo_root() -> Path:
@@ -36,13 +39,28 @@ def _schema_store() -> Dict[str, dict]:
     return store
 
 
-def _validate(instance: dict, schema_name: str) -> None:
-    store = _schema_store()
-    schema = store.get(schema_name)
+def _get_schema(schema_name: str) -> dict:
+    schema = _schema_store().get(schema_name)
     if not schema:
         raise ValueError(f"Schema not found: {schema_name}")
-    resolver = RefResolver.from_schema(schema, store=store)
-    Draft202012Validator(schema, resolver=resolver).validate(instance)
+    return schema
+
+
+@lru_cache(maxsize=None)
+def _validator(schema_name: str, property_name: Optional[str] = None) -> Draft202012Validator:
+    """Build (once) a validator for a schema, or for one of its top-level properties."""
+    schema = _get_schema(schema_name)
+    resolver = RefResolver.from_schema(schema, store=_schema_store())
+    if property_name is None:
+        return Draft202012Validator(schema, resolver=resolver)
+    subschema = schema.get("properties", {}).get(property_name)
+    if subschema is None:
+        raise ValueError(f"Unknown property for {schema_name}: {property_name}")
+    return Draft202012Validator(subschema, resolver=resolver)
+
+
+def _validate(instance: dict, schema_name: str) -> None:
+    _validator(schema_name).validate(instance)
 
 
 @lru_cache(maxsize=1)
@@ -94,6 +112,7 @@ def list_strategies(enabled_only: bool = True) -> List[dict]:
     return strategies
 
 
+@lru_cache(maxsize=None)
 def list_strategy_summaries(enabled_only: bool = True) -> List[dict]:
     summaries = []
     for strategy in list_strategies(enabled_only=enabled_only):
@@ -112,6 +131,7 @@ def list_strategy_summaries(enabled_only: bool = True) -> List[dict]:
     return summaries
 
 
+@lru_cache(maxsize=None)
 def get_strategy_summary(strategy_id: str) -> dict:
     strategy = load_strategy(strategy_id)
     return {
@@ -134,5 +154,42 @@ def pack_info() -> Dict[str, Optional[str]]:
     }
 
 
-def validate_case_snapshot(payload: dict) -> None:
-    _validate(payload, CASE_SNAPSHOT_SCHEMA_NAME)
+def _validate_properties(instance: dict, schema_name: str, properties: Sequence[str]) -> None:
+    required = _get_schema(schema_name).get("required", [])
+    for name in properties:
+        validator = _validator(schema_name, name)
+        if name not in instance:
+            if name in required:
+                raise ValueError(f"Missing required property: {name}")
+            continue
+        validator.validate(instance[name])
+
+
+@lru_cache(maxsize=256)
+def _validate_case_snapshot_body(encoded: bytes) -> None:
+    body = orjson.loads(encoded)
+    body["updated_at"] = _SNAPSHOT_STAMP_PLACEHOLDER
+    _validate(body, CASE_SNAPSHOT_SCHEMA_NAME)
+
+
+def validate_case_snapshot(payload: dict, only: Optional[Sequence[str]] = None) -> None:
+    """Validate a case snapshot payload.
+
+    When ``only`` is given, just those top-level properties are checked. Use it
+    when the rest of the payload came from an already-validated snapshot.
+
+    Full validations are memoized by content. ``updated_at`` changes on every
+    save, so it is checked on its own and left out of the cache key; only
+    successful validations are cached.
+    """
+    if only:
+        _validate_properties(payload, CASE_SNAPSHOT_SCHEMA_NAME, only)
+        return
+    _validate_properties(payload, CASE_SNAPSHOT_SCHEMA_NAME, ("updated_at",))
+    body = {key: value for key, value in payload.items() if key != "updated_at"}
+    try:
+        encoded = orjson.dumps(body, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        _validate(payload, CASE_SNAPSHOT_SCHEMA_NAME)
+        return
+    _validate_case_snapshot_body(encoded)
@@ -10,8 +10,13 @@ from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from ..config import get_settings
-from .llm_utils import acompletion_with_retry, extract_completion_text, extract_json_object
-from .conditions import evaluate_condition
+from .llm_utils import (
+    acompletion_with_retry,
+    extract_completion_text,
+    extract_json_object,
+    litellm_base_kwargs,
+)
+from .conditions import compile_conditions
 
 logger = logging.getLogger(__name__)
 
@@ -52,12 +57,13 @@ class StrategySelectionIO(BaseModel):
 
 
 def _failed_prereq_ids(strategy: dict, case_snapshot: dict) -> List[str]:
-    failed = []
-    for prereq in strategy.get("applicability", {}).get("prerequisites", []):
-        condition = prereq.get("condition") or {}
-        if not evaluate_condition(condition, case_snapshot):
-            failed.append(prereq.get("id"))
-    return [item for item in failed if item]
+    prereqs = strategy.get("applicability", {}).get("prerequisites", [])
+    checks = compile_conditions([prereq.get("condition") or {} for prereq in prereqs])
+    return [
+        prereq.get("id")
+        for prereq, check in zip(prereqs, checks)
+        if prereq.get("id") and not check(case_snapshot)
+    ]
 
 
 def _matches_context(strategy: dict, case_snapshot: dict) -> bool:
@@ -93,17 +99,13 @@ async def select_strategies(
         "strategy_metadata": strategy_metadata,
     }
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": STRATEGY_SELECTION_PROMPT},
             {"role": "user", "content": json.dumps(user_payload, default=str)},
         ],
         "temperature": 0.2,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
     response = await acompletion_with_retry(**completion_kwargs)
     content = extract_completion_text(response)
     if not content:
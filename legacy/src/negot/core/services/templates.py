@@ -9,17 +9,26 @@ description and returns the list of official templates defined in
 from __future__ import annotations
 
 from datetime import datetime
-import json
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import get_settings
-from ..events import emit_event
-from ..models import EventType, TemplateDraft, TemplateProposal, TemplateProposalStatus
-from .llm_utils import acompletion_with_retry, extract_completion_text
+from ..events import build_event_row, emit_event
+from ..models import Event, EventType, TemplateDraft, TemplateProposal, TemplateProposalStatus
+from ..utils.timeutils import utc_now_iso
+from .llm_utils import (
+    ResponseCache,
+    acompletion_with_retry,
+    cached_system_message,
+    extract_completion_text,
+    instructor_client,
+    litellm_base_kwargs,
+    response_cache_key,
+)
 
 
 class TemplateSelection(BaseModel):
@@ -34,41 +43,81 @@ If none fit, return template_id = "other".
 Output JSON only: {"template_id": "...", "confidence": 0.0-1.0, "rationale": "..."}.
 """
 
+_OFFICIAL_TEMPLATES: Tuple[Dict[str, str], ...] = (
+    {"id": "roommate_conflict", "name": "Roommate conflict"},
+    {"id": "relationship_disagreement", "name": "Relationship disagreement"},
+    {"id": "dating_expectations", "name": "Dating expectations"},
+    {"id": "friendship_conflict", "name": "Friendship conflict"},
+    {"id": "money_with_friends", "name": "Money with friends"},
+    {"id": "family_parental_disagreement", "name": "Family / parental disagreement"},
+    {"id": "workplace_boundary", "name": "Workplace boundary / manager conflict"},
+    {"id": "salary_offer", "name": "Salary offer / compensation negotiation"},
+    {"id": "rent_renewal", "name": "Rent / lease renewal"},
+    {"id": "refund_complaint", "name": "Refund / complaint dispute"},
+    {"id": "other", "name": "Other"},
+)
+_VALID_TEMPLATE_IDS = frozenset(template["id"] for template in _OFFICIAL_TEMPLATES)
+# The template list never changes, so it is encoded once and leads the user
+# message to keep an identical prefix across selection calls.
+_TEMPLATES_PAYLOAD_PREFIX = '{"templates":' + orjson.dumps(_OFFICIAL_TEMPLATES).decode("utf-8")
+
+
+# Admin proposal listings return at most this many rows per page by default.
+PROPOSAL_PAGE_SIZE = 50
+
+SELECTION_CACHE_MAX_ENTRIES = 4096
+# Template ids keyed by model + normalized topic.
+_SELECTION_CACHE: ResponseCache[str] = ResponseCache(SELECTION_CACHE_MAX_ENTRIES)
+
+
+def _normalize_topic(topic_text: str) -> str:
+    return " ".join(topic_text.casefold().split())
+
 
 async def select_template(topic_text: str) -> str:
-    """Select a template ID using an LLM classifier."""
+    """Select a template ID using an LLM classifier.
+
+    Topics that only differ in case or whitespace share a cached classification.
+    """
     settings = get_settings()
     if not settings.litellm_model:
         raise RuntimeError("LiteLLM model is not configured; cannot select template.")
-    templates = list_official_templates()
-    payload = {"topic_text": topic_text, "templates": templates}
+    cache_key = response_cache_key(
+        "template_selection", [settings.litellm_model, _normalize_topic(topic_text)]
+    )
+    cached_template_id = _SELECTION_CACHE.get(cache_key)
+    if cached_template_id is not None:
+        return cached_template_id
+    user_content = (
+        _TEMPLATES_PAYLOAD_PREFIX
+        + ',"topic_text":'
+        + orjson.dumps(topic_text).decode("utf-8")
+        + "}"
+    )
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
-            {"role": "system", "content": TEMPLATE_SELECTION_PROMPT},
-            {"role": "user", "content": json.dumps(payload)},
+            cached_system_message(settings.litellm_model, TEMPLATE_SELECTION_PROMPT),
+            {"role": "user", "content": user_content},
         ],
         "temperature": 0.0,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
-
-        client = from_litellm(acompletion_with_retry)
-        response = await client(response_model=TemplateSelection, **completion_kwargs)
-        selection = response
-    except Exception:
+    selection: Optional[TemplateSelection] = None
+    if settings.litellm_supports_tools:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            selection = await client(response_model=TemplateSelection, **completion_kwargs)
+        except Exception:
+            selection = None
+    if selection is None:
         response = await acompletion_with_retry(**completion_kwargs)
         content = extract_completion_text(response)
         if not content:
             raise RuntimeError("LiteLLM returned an empty template selection.")
         selection = TemplateSelection.model_validate_json(content)
-    valid_ids = {template["id"] for template in templates}
-    if selection.template_id not in valid_ids:
+    if selection.template_id not in _VALID_TEMPLATE_IDS:
         raise ValueError(f"Invalid template_id returned: {selection.template_id}")
+    _SELECTION_CACHE.put(cache_key, selection.template_id)
     return selection.template_id
 
 
@@ -79,19 +128,7 @@ def list_official_templates() -> List[dict[str, str]]:
     full implementation this data would come from a database or
     configuration file.
     """
-    return [
-        {"id": "roommate_conflict", "name": "Roommate conflict"},
-        {"id": "relationship_disagreement", "name": "Relationship disagreement"},
-        {"id": "dating_expectations", "name": "Dating expectations"},
-        {"id": "friendship_conflict", "name": "Friendship conflict"},
-        {"id": "money_with_friends", "name": "Money with friends"},
-        {"id": "family_parental_disagreement", "name": "Family / parental disagreement"},
-        {"id": "workplace_boundary", "name": "Workplace boundary / manager conflict"},
-        {"id": "salary_offer", "name": "Salary offer / compensation negotiation"},
-        {"id": "rent_renewal", "name": "Rent / lease renewal"},
-        {"id": "refund_complaint", "name": "Refund / complaint dispute"},
-        {"id": "other", "name": "Other"},
-    ]
+    return [dict(template) for template in _OFFICIAL_TEMPLATES]
 
 
 async def create_template_draft(
@@ -147,33 +184,113 @@ async def create_template_proposal_for_other(
 ) -> TemplateProposal:
     payload = {
         "topic_text": topic_text,
-        "generated_at": datetime.utcnow().isoformat(),
+        "generated_at": utc_now_iso(),
         "notes": "Auto-generated draft template proposal for an 'other' topic.",
     }
-    draft = await create_template_draft(db, user_id, topic_text, title="Other topic", payload=payload)
-    proposal = await create_template_proposal(db, user_id, payload=payload, draft_id=draft.id)
-    await emit_event(
-        db,
-        EventType.template_proposal_submitted,
-        user_id,
-        session_id=session_id,
-        payload={"proposal_id": proposal.id, "draft_id": draft.id},
+    draft = TemplateDraft(user_id=user_id, topic_text=topic_text, title="Other topic", payload=payload)
+    proposal = TemplateProposal(user_id=user_id, draft=draft, payload=payload)
+    # One flush inserts both rows (the unit of work orders draft before proposal),
+    # then the three events go out as a single bulk insert.
+    db.add_all([draft, proposal])
+    await db.flush()
+    proposal_payload = {"proposal_id": proposal.id, "draft_id": draft.id}
+    await db.execute(
+        insert(Event),
+        [
+            build_event_row(
+                EventType.template_draft_generated,
+                user_id,
+                payload={"draft_id": draft.id, "topic_text": topic_text},
+            ),
+            build_event_row(
+                EventType.template_proposal_submitted, user_id, payload=proposal_payload
+            ),
+            build_event_row(
+                EventType.template_proposal_submitted,
+                user_id,
+                session_id=session_id,
+                payload=proposal_payload,
+            ),
+        ],
     )
     return proposal
 
 
-async def list_template_drafts(db: AsyncSession, user_id: int) -> List[TemplateDraft]:
-    result = await db.execute(select(TemplateDraft).where(TemplateDraft.user_id == user_id))
+def _paginate(stmt, limit: Optional[int], offset: int):
+    if offset:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+async def list_template_drafts(
+    db: AsyncSession,
+    user_id: int,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[TemplateDraft]:
+    stmt = (
+        select(TemplateDraft)
+        .where(TemplateDraft.user_id == user_id)
+        .order_by(TemplateDraft.created_at.desc(), TemplateDraft.id.desc())
+    )
+    result = await db.execute(_paginate(stmt, limit, offset))
     return result.scalars().all()
 
 
-async def list_template_proposals(db: AsyncSession, user_id: int) -> List[TemplateProposal]:
-    result = await db.execute(select(TemplateProposal).where(TemplateProposal.user_id == user_id))
+async def list_template_proposals(
+    db: AsyncSession,
+    user_id: int,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[TemplateProposal]:
+    stmt = (
+        select(TemplateProposal)
+        .where(TemplateProposal.user_id == user_id)
+        .order_by(TemplateProposal.created_at.desc(), TemplateProposal.id.desc())
+    )
+    result = await db.execute(_paginate(stmt, limit, offset))
     return result.scalars().all()
 
 
-async def list_all_template_proposals(db: AsyncSession) -> List[TemplateProposal]:
-    result = await db.execute(select(TemplateProposal))
+async def list_user_template_state(
+    db: AsyncSession,
+    user_id: int,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Tuple[List[TemplateDraft], List[TemplateProposal]]:
+    """Return a user's drafts and proposals for a single API call.
+
+    Both selects run on the request's session (an AsyncSession cannot run
+    statements concurrently), which still saves a request and its auth lookup
+    compared to hitting the two list endpoints separately.
+    """
+    drafts = await list_template_drafts(db, user_id, limit=limit, offset=offset)
+    proposals = await list_template_proposals(db, user_id, limit=limit, offset=offset)
+    return drafts, proposals
+
+
+def _all_proposals_stmt(before_id: Optional[int] = None):
+    # Newest first by primary key, which doubles as the keyset cursor.
+    stmt = select(TemplateProposal).order_by(TemplateProposal.id.desc())
+    if before_id is not None:
+        stmt = stmt.where(TemplateProposal.id < before_id)
+    return stmt
+
+
+async def list_all_template_proposals(
+    db: AsyncSession,
+    limit: int = PROPOSAL_PAGE_SIZE,
+    before_id: Optional[int] = None,
+) -> List[TemplateProposal]:
+    """Return one page of template proposals, newest first.
+
+    Pages are keyed on the primary key: pass the last id of a page as ``before_id``
+    to get the next one, so each page is a bounded index range scan however deep
+    the reviewer goes.
+    """
+    result = await db.execute(_all_proposals_stmt(before_id).limit(limit))
     return result.scalars().all()
 
 
@@ -8,26 +8,89 @@ described in ``docs/legacy/WEB_GROUNDING.md``.
 from __future__ import annotations
 
 import asyncio
+import copy
+import heapq
 import logging
-import json
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-
+import random
+import re
+import string
+from functools import lru_cache, partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, get_args, get_origin
+
+import httpx
+import orjson
 from httpx import AsyncClient
 from pydantic import BaseModel, Field
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from ..config import get_settings
-from .llm_utils import acompletion_with_retry, extract_completion_text
-
-try:
-    from tavily import TavilyClient
-except Exception:  # noqa: BLE001
-    TavilyClient = None
+from .llm_utils import (
+    ResponseCache,
+    acompletion_with_retry,
+    extract_completion_text,
+    instructor_client,
+    litellm_base_kwargs,
+    response_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
-_CACHE: dict[str, tuple[datetime, list[dict[str, Any]]]] = {}
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+SEARCH_CACHE_MAX_ENTRIES = 1024
+# Failed searches are cached as empty results for this long so a flaky endpoint
+# is not retried (with backoff) on every call.
+SEARCH_FAILURE_TTL_SECONDS = 120.0
+# Normalized query -> results; per-entry TTLs come from the settings (see _cache_put).
+_CACHE: ResponseCache[List[Dict[str, Any]]] = ResponseCache(SEARCH_CACHE_MAX_ENTRIES)
+DECISION_CACHE_MAX_ENTRIES = 512
+PLAN_CACHE_MAX_ENTRIES = 512
+# Grounding decisions keyed by model, template and normalized topic.
+_DECISION_CACHE: ResponseCache[Dict[str, Any]] = ResponseCache(DECISION_CACHE_MAX_ENTRIES)
+_PLAN_CACHE: ResponseCache[Dict[str, Any]] = ResponseCache(PLAN_CACHE_MAX_ENTRIES)
+# Searches in flight keyed by normalized query, so concurrent callers share one request.
+_INFLIGHT: dict[str, asyncio.Future] = {}
+# Shared Tavily client so searches reuse pooled keep-alive (HTTP/2) connections. Pools are
+# bound to the event loop that opened them, so the client is rebuilt per loop.
+_HTTP_CLIENT: Optional[tuple[asyncio.AbstractEventLoop, AsyncClient]] = None
+
+
+# Topic phrasing that often warrants grounding (see the trigger examples in
+# WEB_GROUNDING.md), mapped to its reason code. Matches are passed to the agent as
+# hints; the agent still decides. Single words are matched by token lookup; the few
+# multi-word phrases go through a regex only when one of their anchor words is present.
+_TRIGGER_WORDS: Dict[str, str] = {
+    **{
+        word: "CULTURE_NORMS"
+        for word in (
+            "custom", "customs", "customary", "etiquette", "norm", "norms", "culture", "cultural"
+        )
+    },
+    **{
+        word: "POLICY_LAW"
+        for word in (
+            "legal", "illegal", "law", "laws", "policy", "policies", "regulation", "regulations",
+            "rights",
+        )
+    },
+    "latest": "TIME_SENSITIVE",
+    **{str(year): "TIME_SENSITIVE" for year in range(2020, 2100)},
+}
+_TRIGGER_PHRASE_ANCHORS = frozenset({"notice", "market", "going"})
+_TRIGGER_PHRASE_RE = re.compile(
+    r"\b(?:(?P<POLICY_LAW>notice period)"
+    r"|(?P<TIME_SENSITIVE>typical market|market rates?|going rates?))\b"
+)
+_PUNCTUATION_TO_SPACE = str.maketrans({char: " " for char in string.punctuation})
+
+# Snippets are cut to this length before synthesis; the pack only needs the gist.
+SYNTHESIS_SNIPPET_CHARS = 400
 
 
 class GroundingDecision(BaseModel):
@@ -45,6 +108,14 @@ class QueryPlan(BaseModel):
     stop_conditions: List[str] = Field(default_factory=list)
 
 
+class DecisionAndPlan(GroundingDecision):
+    """NeedSearch decision with the query plan fields folded in, for one round trip."""
+
+    queries: List[str] = Field(default_factory=list)
+    must_have_evidence: List[str] = Field(default_factory=list)
+    stop_conditions: List[str] = Field(default_factory=list)
+
+
 class GroundingPack(BaseModel):
     key_points: List[dict] = Field(default_factory=list)
     norms_and_expectations: List[dict] = Field(default_factory=list)
@@ -53,14 +124,55 @@ class GroundingPack(BaseModel):
     what_to_ask_user: List[dict] = Field(default_factory=list)
 
 
-NEED_SEARCH_SYSTEM_PROMPT = """You are the Web Grounding NeedSearch agent.
-Decide if web search is required to answer the user's topic or question.
-Follow these rules:
-- Prefer not to search unless common knowledge, policy/legal, or time-sensitive facts are required.
-- Unknown must remain unknown; do not invent facts.
-Output JSON only that matches the schema:
-{"need_search": true|false, "reason_codes": [...], "max_queries": 0-3, "max_sources_per_query": 0-5, "search_depth": "basic"|"advanced", "topic": "general|news|finance"}.
-"""
+@lru_cache(maxsize=None)
+def _agent_fields(model: type[BaseModel]) -> Optional[tuple[tuple[str, type, Any, Any], ...]]:
+    """Field name, JSON type, list item type and FieldInfo for each field of ``model``.
+
+    ``None`` means the model has constrained fields (``ge`` and friends) that only
+    pydantic enforces, so its answers always take the validating path.
+    """
+    fields = []
+    for name, field in model.model_fields.items():
+        if field.metadata:
+            return None
+        expected = get_origin(field.annotation) or field.annotation
+        args = get_args(field.annotation)
+        item = (get_origin(args[0]) or args[0]) if expected is list and args else None
+        fields.append((name, expected, item, field))
+    return tuple(fields)
+
+
+def _loads_agent_json(content: str, model: type[BaseModel]) -> Dict[str, Any]:
+    """Decode an agent's JSON answer into a plain dict shaped like ``model``.
+
+    Well-formed answers for unconstrained models (an object whose fields, and list
+    items, have exactly the declared JSON types) skip pydantic: missing optional
+    fields take their defaults and unknown keys are dropped. Anything else goes
+    through full validation, which raises as before.
+    """
+    fields = _agent_fields(model)
+    try:
+        data = orjson.loads(content) if fields is not None else None
+    except orjson.JSONDecodeError:
+        data = None
+    if isinstance(data, dict):
+        shaped: Dict[str, Any] = {}
+        for name, expected, item, field in fields:
+            if name in data:
+                value = data[name]
+                # Exact types: orjson yields plain builtins, and bool must not pass as int.
+                if type(value) is not expected:
+                    break
+                if item is not None and any(type(entry) is not item for entry in value):
+                    break
+                shaped[name] = value
+            elif field.is_required():
+                break
+            else:
+                shaped[name] = field.get_default(call_default_factory=True)
+        else:
+            return shaped
+    return model.model_validate_json(content).model_dump()
 
 
 QUERY_PLAN_SYSTEM_PROMPT = """You are the Web Grounding QueryPlanner agent.
@@ -70,6 +182,20 @@ Output JSON only that matches the schema:
 """
 
 
+DECIDE_AND_PLAN_SYSTEM_PROMPT = """You are the Web Grounding NeedSearch agent, also acting as the QueryPlanner.
+Decide if web search is required to answer the user's topic or question and, if so,
+produce up to 3 high-signal queries in the same answer.
+Follow these rules:
+- Prefer not to search unless common knowledge, policy/legal, or time-sensitive facts are required.
+- trigger_hints, when present, lists reason codes suggested by words in the topic. Treat them as hints only: an internal or company policy, or a passing mention of a year, does not need the web.
+- Unknown must remain unknown; do not invent facts.
+- When user_requested is true the user asked for a search explicitly: set need_search to true and plan queries.
+- When need_search is false, leave queries, must_have_evidence and stop_conditions empty.
+Output JSON only that matches the schema:
+{"need_search": true|false, "reason_codes": [...], "max_queries": 0-3, "max_sources_per_query": 0-5, "search_depth": "basic"|"advanced", "topic": "general|news|finance", "queries": ["..."], "must_have_evidence": ["..."], "stop_conditions": ["..."]}.
+"""
+
+
 SYNTHESIZE_SYSTEM_PROMPT = """You are the Web Grounding EvidenceSynthesizer agent.
 You must synthesize a Grounding Pack from the provided search results.
 Rules:
@@ -87,76 +213,115 @@ Output JSON only that matches the schema:
 """
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(min=1, max=6),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
-)
-def _tavily_search_sync(client: Any, query: str, settings: Any) -> dict:
-    return client.search(
-        query=query,
-        search_depth=settings.tavily_search_depth,
-        max_results=settings.tavily_max_results,
-        include_answer=False,
-        include_raw_content=False,
-    )
+TAVILY_MAX_RETRY_WAIT_SECONDS = 10.0
+_TAVILY_BACKOFF = wait_random_exponential(multiplier=1, max=TAVILY_MAX_RETRY_WAIT_SECONDS)
+
+
+def _is_transient_tavily_error(exc: BaseException) -> bool:
+    """Only network failures, rate limiting and 5xx are worth retrying; other 4xx are final."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _tavily_retry_wait(retry_state: RetryCallState) -> float:
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+        try:
+            retry_after = float(exc.response.headers.get("Retry-After", ""))
+        except ValueError:
+            pass
+        else:
+            return min(max(retry_after, 0.0), TAVILY_MAX_RETRY_WAIT_SECONDS)
+    return _TAVILY_BACKOFF(retry_state)
 
 
 @retry(
     stop=stop_after_attempt(3),
-    wait=wait_exponential(min=1, max=6),
-    retry=retry_if_exception_type(Exception),
+    wait=_tavily_retry_wait,
+    retry=retry_if_exception(_is_transient_tavily_error),
     reraise=True,
 )
 async def _tavily_search_httpx(client: AsyncClient, query: str, settings: Any) -> dict:
-    resp = await client.get(
-        "https://api.tavily.com/search",
-        params={
-            "api_key": settings.tavily_api_key,
-            "query": query,
-            "depth": settings.tavily_search_depth,
-            "max_results": settings.tavily_max_results,
-            "include_answer": "false",
-            "include_raw_content": "false",
+    body = {
+        "query": query,
+        "search_depth": settings.tavily_search_depth,
+        "max_results": settings.tavily_max_results,
+        "include_answer": False,
+        "include_raw_content": False,
+    }
+    resp = await client.post(
+        TAVILY_SEARCH_URL,
+        content=orjson.dumps(body),
+        headers={
+            "Authorization": f"Bearer {settings.tavily_api_key}",
+            "Content-Type": "application/json",
         },
         timeout=15,
     )
     resp.raise_for_status()
-    return resp.json()
+    return orjson.loads(resp.content)
+
+
+def _get_http_client() -> AsyncClient:
+    global _HTTP_CLIENT
+    loop = asyncio.get_running_loop()
+    if _HTTP_CLIENT is None or _HTTP_CLIENT[0] is not loop or _HTTP_CLIENT[1].is_closed:
+        # HTTP/2 multiplexes concurrent queries over one connection, so a few suffice.
+        client = AsyncClient(
+            http2=True,
+            timeout=15,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+        )
+        _HTTP_CLIENT = (loop, client)
+    return _HTTP_CLIENT[1]
+
+
+async def close_http_client() -> None:
+    """Close the shared Tavily HTTP client (called on application shutdown)."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        _, client = _HTTP_CLIENT
+        _HTTP_CLIENT = None
+        await client.aclose()
+
+
+@lru_cache(maxsize=512)
+def _trigger_reason_codes(topic: str) -> tuple[str, ...]:
+    """Return reason codes for trigger phrases in ``topic``, in order of first match."""
+    words = topic.casefold().translate(_PUNCTUATION_TO_SPACE).split()
+    codes: Dict[str, None] = {}
+    for word in words:
+        code = _TRIGGER_WORDS.get(word)
+        if code is not None:
+            codes[code] = None
+    if not _TRIGGER_PHRASE_ANCHORS.isdisjoint(words):
+        for match in _TRIGGER_PHRASE_RE.finditer(" ".join(words)):
+            codes[match.lastgroup] = None
+    return tuple(codes)
+
+
+def _decision_cache_key(namespace: str, model: Optional[str], context: Dict[str, Any]) -> str:
+    # Only the inputs that shape the decision: topics differing in case or spacing share one.
+    topic = _normalize_query(str(context.get("topic_text") or ""))
+    return response_cache_key(namespace, [model, context.get("template_id"), topic])
+
+
+def _decision_payload(context: Dict[str, Any]) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"context": context}
+    hints = _trigger_reason_codes(str(context.get("topic_text") or ""))
+    if hints:
+        payload["trigger_hints"] = list(hints)
+    return payload
 
 
 async def need_search(context: Dict[str, Any]) -> Dict[str, Any]:
-    """Decide whether a web grounding search is required (LLM-based)."""
-    settings = get_settings()
-    if not settings.litellm_model:
-        raise RuntimeError("LiteLLM model is not configured; cannot decide web grounding.")
-    payload = {"context": context}
-    completion_kwargs = {
-        "model": settings.litellm_model,
-        "messages": [
-            {"role": "system", "content": NEED_SEARCH_SYSTEM_PROMPT},
-            {"role": "user", "content": json.dumps(payload)},
-        ],
-        "temperature": 0.0,
-    }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
+    """Decide whether a web grounding search is required (LLM-based).
 
-        client = from_litellm(acompletion_with_retry)
-        response = await client(response_model=GroundingDecision, **completion_kwargs)
-        decision = response.model_dump()
-    except Exception:
-        response = await acompletion_with_retry(**completion_kwargs)
-        content = extract_completion_text(response)
-        if not content:
-            raise RuntimeError("LiteLLM returned an empty grounding decision.")
-        decision = GroundingDecision.model_validate_json(content).model_dump()
-    decision["search_depth"] = settings.tavily_search_depth
+    Thin wrapper returning the decision half of :func:`decide_and_plan`.
+    """
+    decision, _ = await decide_and_plan(context)
     return decision
 
 
@@ -168,30 +333,130 @@ async def plan_queries(context: Dict[str, Any], decision: Dict[str, Any]) -> Dic
     if not settings.litellm_model:
         raise RuntimeError("LiteLLM model is not configured; cannot plan web grounding queries.")
     payload = {"context": context, "decision": decision}
+    cache_key = response_cache_key("plan_queries", [settings.litellm_model, payload])
+    cached_plan = _PLAN_CACHE.get(cache_key)
+    if cached_plan is not None:
+        return copy.deepcopy(cached_plan)
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": QUERY_PLAN_SYSTEM_PROMPT},
-            {"role": "user", "content": json.dumps(payload)},
+            {"role": "user", "content": orjson.dumps(payload).decode("utf-8")},
         ],
         "temperature": 0.0,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
-
-        client = from_litellm(acompletion_with_retry)
-        response = await client(response_model=QueryPlan, **completion_kwargs)
-        return response.model_dump()
-    except Exception:
+    plan: Optional[Dict[str, Any]] = None
+    if settings.litellm_supports_tools:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            response = await client(response_model=QueryPlan, **completion_kwargs)
+            plan = response.model_dump()
+        except Exception:
+            plan = None
+    if plan is None:
         response = await acompletion_with_retry(**completion_kwargs)
         content = extract_completion_text(response)
         if not content:
             raise RuntimeError("LiteLLM returned an empty query plan.")
-        return QueryPlan.model_validate_json(content).model_dump()
+        plan = _loads_agent_json(content, QueryPlan)
+    _PLAN_CACHE.put(cache_key, copy.deepcopy(plan))
+    return plan
+
+
+async def decide_and_plan(
+    context: Dict[str, Any], *, user_requested: bool = False
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Decide on web grounding and plan its queries with a single LLM call.
+
+    Returns ``(decision, plan)``. ``plan`` is None when no queries were planned;
+    callers that still search should fall back to :func:`plan_queries`. Trigger
+    phrases in the topic are passed to the agent as hints, and ``user_requested``
+    asks it to plan queries even when it would not search on its own, so forced
+    searches also get their plan from this one call.
+    """
+    settings = get_settings()
+    if not settings.litellm_model:
+        raise RuntimeError("LiteLLM model is not configured; cannot decide web grounding.")
+    payload = _decision_payload(context)
+    namespace = "decide_and_plan"
+    if user_requested:
+        payload["user_requested"] = True
+        namespace = "decide_and_plan_requested"
+    cache_key = _decision_cache_key(namespace, settings.litellm_model, context)
+    cached = _DECISION_CACHE.get(cache_key)
+    combined: Optional[Dict[str, Any]] = None
+    if cached is not None:
+        combined = copy.deepcopy(cached)
+    else:
+        completion_kwargs = {
+            **litellm_base_kwargs(),
+            "messages": [
+                {"role": "system", "content": DECIDE_AND_PLAN_SYSTEM_PROMPT},
+                {"role": "user", "content": orjson.dumps(payload).decode("utf-8")},
+            ],
+            "temperature": 0.0,
+        }
+        if settings.litellm_supports_tools:
+            try:
+                client = instructor_client(acompletion_with_retry)
+                response = await client(response_model=DecisionAndPlan, **completion_kwargs)
+                combined = response.model_dump()
+            except Exception:
+                combined = None
+        if combined is None:
+            response = await acompletion_with_retry(**completion_kwargs)
+            content = extract_completion_text(response)
+            if not content:
+                raise RuntimeError("LiteLLM returned an empty grounding decision.")
+            combined = _loads_agent_json(content, DecisionAndPlan)
+        _DECISION_CACHE.put(cache_key, copy.deepcopy(combined))
+    plan = {field: combined.pop(field) for field in QueryPlan.model_fields}
+    combined["search_depth"] = settings.tavily_search_depth
+    if not plan["queries"] or not (combined["need_search"] or user_requested):
+        return combined, None
+    return combined, plan
+
+
+def _cache_put(key: str, packed: List[Dict[str, Any]], ttl_seconds: float) -> None:
+    # Jitter spreads expiries so queries cached together are not all refetched at once.
+    _CACHE.put(key, packed, ttl_seconds * random.uniform(0.8, 1.2))
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.casefold().split())
+
+
+async def _coalesced(
+    key: str, fetch: Callable[[], Awaitable[List[Dict[str, Any]]]], ttl_seconds: float
+) -> List[Dict[str, Any]]:
+    """Run ``fetch`` once per key across concurrent callers and cache the result.
+
+    Failures are cached as an empty result for ``SEARCH_FAILURE_TTL_SECONDS`` at most.
+    """
+    loop = asyncio.get_running_loop()
+    pending = _INFLIGHT.get(key)
+    if pending is not None and pending.get_loop() is loop:
+        return await asyncio.shield(pending)
+    future: asyncio.Future = loop.create_future()
+    # Mark failures as retrieved so a search nobody else awaited does not log twice.
+    future.add_done_callback(lambda done: done.cancelled() or done.exception())
+    _INFLIGHT[key] = future
+    try:
+        packed = await fetch()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:  # noqa: BLE001
+        _cache_put(key, [], min(ttl_seconds, SEARCH_FAILURE_TTL_SECONDS))
+        future.set_exception(exc)
+        raise
+    else:
+        _cache_put(key, packed, ttl_seconds)
+        future.set_result(packed)
+        return packed
+    finally:
+        if _INFLIGHT.get(key) is future:
+            del _INFLIGHT[key]
 
 
 async def run_search(queries: List[str]) -> List[Dict[str, Any]]:
@@ -205,68 +470,110 @@ async def run_search(queries: List[str]) -> List[Dict[str, Any]]:
     settings = get_settings()
     if not queries or not settings.tavily_api_key:
         return []
-    results: List[Dict[str, Any]] = []
-    ttl = timedelta(hours=settings.tavily_cache_ttl_hours)
-    tavily_client = TavilyClient(api_key=settings.tavily_api_key) if TavilyClient else None
-    async with AsyncClient() as http_client:
-        for query in queries:
-            cached = _CACHE.get(query)
-            if cached:
-                cached_at, cached_results = cached
-                if datetime.utcnow() - cached_at <= ttl:
-                    results.extend(cached_results)
-                    continue
-                _CACHE.pop(query, None)
-            try:
-                if tavily_client:
-                    data = await asyncio.to_thread(
-                        _tavily_search_sync, tavily_client, query, settings
-                    )
-                else:
-                    data = await _tavily_search_httpx(http_client, query, settings)
-                packed = [
-                    {
-                        "url": item.get("url"),
-                        "title": item.get("title"),
-                        "snippet": item.get("content", ""),
-                    }
-                    for item in data.get("results", [])
-                ]
-                _CACHE[query] = (datetime.utcnow(), packed)
-                results.extend(packed)
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("Tavily search failed: %s", exc)
+    ttl_seconds = settings.tavily_cache_ttl_hours * 3600.0
+    # Queries that only differ in case or spacing share one search and cache entry.
+    unique: Dict[str, str] = {}
+    for query in queries:
+        unique.setdefault(_normalize_query(query), query.strip())
+    # Cache pass first; only misses go to Tavily, and those run concurrently.
+    fetched: Dict[str, List[Dict[str, Any]]] = {}
+    to_fetch: List[str] = []
+    for key in unique:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            fetched[key] = cached
+            continue
+        to_fetch.append(key)
+    if to_fetch:
+        semaphore = asyncio.Semaphore(max(1, settings.tavily_max_concurrency))
+        http_client = _get_http_client()
+
+        async def fetch_one(query: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                data = await _tavily_search_httpx(http_client, query, settings)
+            return [
+                {
+                    "url": item.get("url"),
+                    "title": item.get("title"),
+                    "snippet": item.get("content", ""),
+                }
+                for item in data.get("results", [])
+            ]
+
+        outcomes = await asyncio.gather(
+            *(_coalesced(key, partial(fetch_one, unique[key]), ttl_seconds) for key in to_fetch),
+            return_exceptions=True,
+        )
+        for key, outcome in zip(to_fetch, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning("Tavily search failed: %s", outcome)
                 continue
+            fetched[key] = outcome
+    results: List[Dict[str, Any]] = []
+    for key in unique:
+        results.extend(fetched.get(key, ()))
     return results
 
 
+def _words(text: str) -> List[str]:
+    return text.casefold().translate(_PUNCTUATION_TO_SPACE).split()
+
+
+def _select_for_synthesis(
+    results: List[Dict[str, Any]], topic: str, limit: int
+) -> List[Dict[str, Any]]:
+    """Dedupe results by URL and keep the ``limit`` that share most words with ``topic``.
+
+    Ties keep search order. Snippets are truncated to ``SYNTHESIS_SNIPPET_CHARS``.
+    """
+    topic_words = set(_words(topic))
+    seen_urls: set[str] = set()
+    ranked: List[tuple[int, int, Dict[str, Any]]] = []
+    for index, item in enumerate(results):
+        url = item.get("url")
+        if url:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+        snippet = (item.get("snippet") or "")[:SYNTHESIS_SNIPPET_CHARS]
+        overlap = len(topic_words.intersection(_words(f"{item.get('title') or ''} {snippet}")))
+        ranked.append((-overlap, index, {**item, "snippet": snippet}))
+    return [item for _, _, item in heapq.nsmallest(max(0, limit), ranked)]
+
+
 async def synthesize(results: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform search results into a structured grounding pack (LLM-based)."""
+    """Transform search results into a structured grounding pack (LLM-based).
+
+    Only the top ``tavily_synthesis_max_results`` results, ranked by word overlap
+    with ``context["topic_text"]``, are sent to the model.
+    """
     settings = get_settings()
     if not settings.litellm_model:
         raise RuntimeError("LiteLLM model is not configured; cannot synthesize grounding.")
-    payload = {"context": context, "results": results}
+    selected = _select_for_synthesis(
+        results, str(context.get("topic_text") or ""), settings.tavily_synthesis_max_results
+    )
+    encoded = orjson.dumps({"context": context, "results": selected})
     completion_kwargs = {
-        "model": settings.litellm_model,
+        **litellm_base_kwargs(),
         "messages": [
             {"role": "system", "content": SYNTHESIZE_SYSTEM_PROMPT},
-            {"role": "user", "content": json.dumps(payload)},
+            {"role": "user", "content": encoded.decode("utf-8")},
         ],
         "temperature": 0.0,
     }
-    if settings.litellm_api_key:
-        completion_kwargs["api_key"] = settings.litellm_api_key
-    if settings.litellm_base_url:
-        completion_kwargs["base_url"] = settings.litellm_base_url
-    try:
-        from instructor import from_litellm
-
-        client = from_litellm(acompletion_with_retry)
-        response = await client(response_model=GroundingPack, **completion_kwargs)
-        return response.model_dump()
-    except Exception:
+    pack: Optional[Dict[str, Any]] = None
+    if settings.litellm_supports_tools:
+        try:
+            client = instructor_client(acompletion_with_retry)
+            response = await client(response_model=GroundingPack, **completion_kwargs)
+            pack = response.model_dump()
+        except Exception:
+            pack = None
+    if pack is None:
         response = await acompletion_with_retry(**completion_kwargs)
         content = extract_completion_text(response)
         if not content:
             raise RuntimeError("LiteLLM returned an empty grounding pack.")
-        return GroundingPack.model_validate_json(content).model_dump()
+        pack = _loads_agent_json(content, GroundingPack)
+    return pack
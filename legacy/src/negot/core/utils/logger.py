@@ -11,9 +11,14 @@ import logging
 def configure_logging(level: str = "INFO") -> None:
     """Configure the root logger with a simple format.
 
+    Replaces any handlers already installed on the root logger, so calling it
+    again (or after a library configured logging) takes effect. Unknown level
+    names fall back to INFO.
+
     :param level: Logging level (e.g., 'DEBUG', 'INFO').
     """
     logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
+        level=logging.getLevelNamesMapping().get(level.upper(), logging.INFO),
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        force=True,
     )
\ No newline at end of file
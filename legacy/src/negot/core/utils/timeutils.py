@@ -0,0 +1,21 @@
+"""
+Timestamp helpers.
+
+Artifacts, traces and snapshot payloads store naive UTC ISO-8601 strings.
+``utc_now_iso`` builds them from ``time.time_ns`` and reuses the formatted
+date/time prefix for calls within the same second.
+"""
+import time
+
+_second_prefix: tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as ``YYYY-MM-DDTHH:MM:SS.ffffff`` (no offset)."""
+    global _second_prefix
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _second_prefix
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _second_prefix = (seconds, prefix)
+    return f"{prefix}.{micros:06d}"
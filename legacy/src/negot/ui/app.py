@@ -3,17 +3,53 @@ Streamlit UI for the Negotiation Companion (v0.1).
 """
 from __future__ import annotations
 
+import gzip
 import html
-import json
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 import httpx
+import orjson
+import pandas as pd
 import streamlit as st
 from streamlit import components
 
 
 API_BASE_URL = "http://localhost:8000"
 AUTO_START_ROLEPLAY_MESSAGE = "Let's begin the roleplay."
+# Streamed replies are re-rendered after this many new tokens or this much time.
+STREAM_RENDER_EVERY_TOKENS = 8
+STREAM_RENDER_INTERVAL_SECONDS = 0.05
+# The chat panel renders the most recent messages and pages older ones on request.
+CHAT_HISTORY_PAGE_SIZE = 40
+# Knowledge-graph pickers list at most this many filter matches.
+KG_PICKER_MAX_OPTIONS = 50
+# The event timeline pages through events this many at a time.
+EVENTS_PAGE_SIZE = 200
+# Admin review fetches template proposals this many per page.
+ADMIN_PROPOSALS_PAGE_SIZE = 10
+# Orchestration prompt messages longer than this are truncated until expanded.
+PROMPT_MESSAGE_PREVIEW_CHARS = 4000
+# Large JSON payloads in the side panels are previewed to this depth and list/dict size.
+JSON_PREVIEW_MAX_DEPTH = 2
+JSON_PREVIEW_MAX_ITEMS = 50
+# JSON request bodies at least this large are sent gzip-compressed.
+GZIP_REQUEST_MIN_BYTES = 2048
+# Cross-rerun GET cache lifetime; the prefetch skips entries with less than the headroom left.
+API_GET_CACHE_TTL_SECONDS = 2.0
+API_GET_CACHE_HEADROOM_SECONDS = 0.5
+
+_TIER_OPTIONS = ("standard", "premium")
+_TIER_INDEX = {value: idx for idx, value in enumerate(_TIER_OPTIONS)}
+_STYLE_OPTIONS = ("polite", "neutral", "tough", "busy", "defensive")
+_STYLE_INDEX = {value: idx for idx, value in enumerate(_STYLE_OPTIONS)}
+_CHANNEL_OPTIONS = ("EMAIL", "DM", "IN_PERSON_NOTES")
+_CHANNEL_INDEX = {value: idx for idx, value in enumerate(_CHANNEL_OPTIONS)}
+
+# st.fragment graduated from st.experimental_fragment in Streamlit 1.37.
+_fragment = getattr(st, "fragment", None) or st.experimental_fragment
 
 
 def _inject_canvas_styles() -> None:
@@ -116,13 +152,71 @@ def _inject_canvas_styles() -> None:
     )
 
 
+def _render_heading_block(heading: str, captions: Iterable[Optional[str]]) -> None:
+    """Emit a bold heading and its caption lines as one Markdown element instead of several."""
+    lines = [f"**{html.escape(heading)}**"]
+    lines.extend(f"<small>{_escape_html(caption)}</small>" for caption in captions if caption)
+    st.markdown("  \n".join(lines), unsafe_allow_html=True)
+
+
 def _headers(user_id: str) -> Dict[str, str]:
     return {"X-User-Id": user_id}
 
 
+@st.cache_resource
+def _http_client() -> httpx.Client:
+    # One pooled client per Streamlit server process so reruns reuse keep-alive connections.
+    # HTTP/2 is negotiated over TLS, letting the roleplay stream and panel GETs share a
+    # connection; plain-http API URLs stay on HTTP/1.1. Reads stay unbounded for SSE.
+    # Idle connections are kept well past httpx's 5s default because reruns are paced by
+    # the user, not by the script.
+    return httpx.Client(
+        base_url=API_BASE_URL,
+        http2=True,
+        timeout=httpx.Timeout(None, connect=5.0),
+        limits=httpx.Limits(
+            max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0
+        ),
+    )
+
+
+def _json_request(user_id: str, payload: Optional[dict]) -> Tuple[bytes, Dict[str, str]]:
+    """Encode a JSON body and its headers, compressing it once it is worth the CPU."""
+    body = orjson.dumps(payload or {}, option=orjson.OPT_NON_STR_KEYS)
+    headers = {**_headers(user_id), "Content-Type": "application/json"}
+    if len(body) >= GZIP_REQUEST_MIN_BYTES:
+        body = gzip.compress(body, compresslevel=5)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
+
+
+def _json_body(resp: httpx.Response) -> Any:
+    """Decode a JSON response with orjson; events and KG listings can run to megabytes."""
+    return orjson.loads(resp.content)
+
+
+def _reset_request_cache() -> None:
+    """Start a fresh per-run GET cache; called at the top of the app and of each fragment."""
+    st.session_state["_req_cache"] = {}
+
+
+def _request_cache_key(
+    path: str, user_id: str, params: Optional[dict] = None
+) -> Tuple[str, str, Optional[Tuple[Tuple[str, Any], ...]]]:
+    return path, user_id, tuple(sorted(params.items())) if params else None
+
+
 def _api_get(path: str, user_id: str, params: Optional[dict] = None) -> httpx.Response:
-    with httpx.Client(timeout=None) as client:
-        return client.get(f"{API_BASE_URL}{path}", headers=_headers(user_id), params=params)
+    # Panels rendered in the same run often read the same resource; serve repeats from
+    # the per-run cache instead of going back to the API.
+    cache = st.session_state.get("_req_cache")
+    key = _request_cache_key(path, user_id, params)
+    if cache is not None and key in cache:
+        return cache[key]
+    resp = _http_client().get(path, headers=_headers(user_id), params=params)
+    if cache is not None and resp.status_code == 200:
+        cache[key] = resp
+    return resp
 
 
 def _api_post(
@@ -131,39 +225,229 @@ def _api_post(
     payload: Optional[dict] = None,
     params: Optional[dict] = None,
 ) -> httpx.Response:
-    with httpx.Client(timeout=None) as client:
-        return client.post(
-            f"{API_BASE_URL}{path}", headers=_headers(user_id), json=payload or {}, params=params
-        )
+    st.session_state.pop("_req_cache", None)
+    _clear_api_get_cache()
+    body, headers = _json_request(user_id, payload)
+    return _http_client().post(path, headers=headers, content=body, params=params)
 
 
 def _api_patch(path: str, user_id: str, payload: Optional[dict] = None) -> httpx.Response:
-    with httpx.Client(timeout=None) as client:
-        return client.patch(f"{API_BASE_URL}{path}", headers=_headers(user_id), json=payload or {})
+    st.session_state.pop("_req_cache", None)
+    _clear_api_get_cache()
+    body, headers = _json_request(user_id, payload)
+    return _http_client().patch(path, headers=headers, content=body)
 
 
 def _api_delete(path: str, user_id: str) -> httpx.Response:
-    with httpx.Client(timeout=None) as client:
-        return client.delete(f"{API_BASE_URL}{path}", headers=_headers(user_id))
+    st.session_state.pop("_req_cache", None)
+    _clear_api_get_cache()
+    return _http_client().delete(path, headers=_headers(user_id))
+
+
+@st.cache_resource
+def _fetch_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="negot-ui-fetch")
+
+
+def _api_get_many(paths: Dict[str, str], user_id: str) -> Dict[str, httpx.Response]:
+    """GET several paths concurrently over the shared client, keyed like ``paths``."""
+    # Session state is only reachable from the script thread, so the per-run cache is
+    # consulted and filled here while the workers just issue the requests.
+    cache = st.session_state.get("_req_cache")
+    results: Dict[str, httpx.Response] = {}
+    pending: Dict[str, str] = {}
+    for name, path in paths.items():
+        key = _request_cache_key(path, user_id)
+        if cache is not None and key in cache:
+            results[name] = cache[key]
+        else:
+            pending[name] = path
+    client = _http_client()
+    headers = _headers(user_id)
+    futures = {
+        name: _fetch_executor().submit(client.get, path, headers=headers)
+        for name, path in pending.items()
+    }
+    for name, future in futures.items():
+        resp = future.result()
+        if cache is not None and resp.status_code == 200:
+            cache[_request_cache_key(pending[name], user_id)] = resp
+        results[name] = resp
+    return {name: results[name] for name in paths}
+
+
+@st.cache_resource
+def _api_get_cached_fills() -> Dict[Tuple[str, str], float]:
+    """``(path, user_id)`` -> monotonic time ``_api_get_cached`` last went to the API."""
+    return {}
+
+
+@st.cache_data(ttl=API_GET_CACHE_TTL_SECONDS, show_spinner=False)
+def _api_get_cached(path: str, user_id: str) -> Tuple[int, str, Any]:
+    """GET ``path`` as ``(status_code, body_text, json_or_None)``, reused across reruns.
+
+    Panels re-read the same listings on every widget interaction; the short TTL keeps them
+    fresh while writes through ``_api_post``/``_api_patch``/``_api_delete`` clear it.
+    """
+    resp = _api_get(path, user_id)
+    _api_get_cached_fills()[(path, user_id)] = time.monotonic()
+    if resp.status_code != 200:
+        return resp.status_code, resp.text, None
+    return resp.status_code, resp.text, _json_body(resp)
+
+
+def _api_get_cached_is_fresh(path: str, user_id: str) -> bool:
+    """Whether ``_api_get_cached`` can still serve ``path`` without a request."""
+    fills = _api_get_cached_fills()
+    filled_at = fills.get((path, user_id))
+    if filled_at is None:
+        return False
+    # Leave headroom so the entry does not expire between a prefetch and the panel's read.
+    if time.monotonic() - filled_at < API_GET_CACHE_TTL_SECONDS - API_GET_CACHE_HEADROOM_SECONDS:
+        return True
+    fills.pop((path, user_id), None)
+    return False
+
+
+def _clear_api_get_cache() -> None:
+    _api_get_cached.clear()
+    _api_get_cached_fills().clear()
+
+
+def _fetch(path: str, user_id: str, error_msg: str) -> Optional[Any]:
+    """Return the decoded body of a cached GET, or show ``error_msg`` and return ``None``."""
+    status, _, data = _api_get_cached(path, user_id)
+    if status != 200:
+        st.error(error_msg)
+        return None
+    return data
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _as_df(records_json: Union[str, bytes]) -> pd.DataFrame:
+    # Keyed on the raw JSON so an unchanged listing skips the column type inference and
+    # the cache key is a flat string hash rather than a walk over nested records.
+    return pd.DataFrame(orjson.loads(records_json))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_sessions(user_id: str) -> List[Dict[str, Any]]:
+    resp = _api_get("/sessions", user_id)
+    resp.raise_for_status()
+    return _json_body(resp)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_entities(user_id: str) -> List[Dict[str, Any]]:
+    resp = _api_get("/entities", user_id)
+    resp.raise_for_status()
+    return _json_body(resp)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_entity_labels(user_id: str) -> Tuple[List[str], Dict[str, int], Dict[int, str]]:
+    """Return ``(labels, label_to_id, id_to_label)`` for the entity pickers."""
+    label_to_id = {
+        f"{ent['name']} ({ent['type']})": ent["id"] for ent in _get_entities(user_id)
+    }
+    id_to_label = {eid: label for label, eid in label_to_id.items()}
+    return list(label_to_id), label_to_id, id_to_label
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _get_strategy(user_id: str, strategy_id: str) -> Dict[str, Any]:
+    # Strategy definitions come from the server's static pack, so every input edit in the
+    # strategy panel can reuse the same fetch.
+    resp = _api_get(f"/strategies/{strategy_id}", user_id)
+    resp.raise_for_status()
+    return _json_body(resp)
+
+
+def _list_entities(user_id: str) -> List[Dict[str, Any]]:
+    try:
+        return _get_entities(user_id)
+    except httpx.HTTPStatusError:
+        return []
+
+
+def _entity_labels(user_id: str) -> Tuple[List[str], Dict[str, int], Dict[int, str]]:
+    try:
+        return _get_entity_labels(user_id)
+    except httpx.HTTPStatusError:
+        return [], {}, {}
+
+
+def _invalidate_entities() -> None:
+    _get_entities.clear()
+    _get_entity_labels.clear()
+
+
+def _fetch_panel_bundle(
+    user_id: str, session_id: int, include_selection: bool
+) -> Dict[str, httpx.Response]:
+    paths = {
+        "session": f"/sessions/{session_id}",
+        "events": f"/sessions/{session_id}/events",
+    }
+    if include_selection:
+        paths["selection"] = f"/sessions/{session_id}/strategy/selection"
+    return _api_get_many(paths, user_id)
+
+
+def _parse_sse(chunks: Iterable[bytes]) -> Iterator[Tuple[str, str]]:
+    """Incrementally parse SSE bytes into ``(event, data)`` pairs.
+
+    Fields are matched on raw bytes and only the data of a complete event is decoded,
+    so multi-byte characters split across chunks are safe. Multi-line ``data:`` fields
+    are joined with newlines.
+    """
+    buffer = bytearray()
+    event = b""
+    data_parts: List[bytes] = []
+    for chunk in chunks:
+        buffer += chunk
+        cursor = 0
+        while True:
+            end = buffer.find(b"\n", cursor)
+            if end < 0:
+                break
+            # Trim a CRLF terminator before copying so each line is sliced out once.
+            stop = end - 1 if end > cursor and buffer[end - 1] == 0x0D else end
+            line = bytes(buffer[cursor:stop])
+            cursor = end + 1
+            # One slice classifies the line; data lines dominate token streams, so go first.
+            head = line[:6]
+            if head[:5] == b"data:":
+                # The value is a single slice past the field name and its optional space.
+                data_parts.append(line[6:] if head[5:] == b" " else line[5:])
+            elif not head:
+                if data_parts:
+                    yield event.decode("utf-8") or "message", b"\n".join(data_parts).decode("utf-8")
+                event = b""
+                data_parts = []
+            elif head == b"event:":
+                event = line[6:].strip()
+        del buffer[:cursor]
+    if data_parts:
+        yield event.decode("utf-8") or "message", b"\n".join(data_parts).decode("utf-8")
+
+
+def _decode_token(data: str) -> str:
+    """Decode a streamed token, which the API sends as a JSON string."""
+    # Without escapes a JSON string is its own content between the quotes.
+    if len(data) >= 2 and data[0] == '"' and data[-1] == '"' and "\\" not in data:
+        return data[1:-1]
+    try:
+        token = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return data
+    return token if isinstance(token, str) else data
 
 
 def _iter_sse_events(response: httpx.Response) -> Iterable[Tuple[str, str]]:
-    event = None
-    for raw_line in response.iter_lines():
-        if raw_line is None:
-            continue
-        line = raw_line.decode("utf-8") if isinstance(raw_line, bytes) else raw_line
-        if line == "":
-            event = None
-            continue
-        if line.startswith(":"):
-            continue
-        if line.startswith("event:"):
-            event = line.split(":", 1)[1].strip()
-            continue
-        if line.startswith("data:"):
-            data = line.split(":", 1)[1].strip()
-            yield (event or "message"), data
+    # iter_bytes() without a chunk size hands over data as it arrives; a fixed size
+    # would hold tokens back until the chunk filled.
+    return _parse_sse(response.iter_bytes())
 
 
 def _ensure_user_state() -> None:
@@ -179,6 +463,8 @@ def _ensure_user_state() -> None:
         st.session_state.session_id = None
     if "messages" not in st.session_state:
         st.session_state.messages = []
+    if "chat_history_limit" not in st.session_state:
+        st.session_state.chat_history_limit = CHAT_HISTORY_PAGE_SIZE
     if "new_session_step" not in st.session_state:
         st.session_state.new_session_step = 1
     if "new_session" not in st.session_state:
@@ -214,10 +500,20 @@ def _ensure_user_state() -> None:
         st.session_state.strategy_execution = None
 
 
+@st.cache_data(show_spinner=False)
+def _get_user_profile(user_id: str) -> Dict[str, Any]:
+    # Profiles only change through this UI, which clears the cache on each update.
+    resp = _api_get("/users/me", user_id)
+    resp.raise_for_status()
+    return _json_body(resp)
+
+
 def _load_user_profile() -> None:
-    resp = _api_get("/users/me", st.session_state.user_id)
-    if resp.status_code == 200:
-        data = resp.json()
+    try:
+        data = _get_user_profile(st.session_state.user_id)
+    except httpx.HTTPStatusError:
+        data = None
+    if data is not None:
         st.session_state.user_tier = data.get("tier", st.session_state.user_tier)
         st.session_state.consent_telemetry = data.get(
             "consent_telemetry", st.session_state.consent_telemetry
@@ -230,7 +526,8 @@ def _load_user_profile() -> None:
 def _update_tier(tier: str) -> None:
     resp = _api_patch("/users/me/tier", st.session_state.user_id, {"tier": tier})
     if resp.status_code == 200:
-        st.session_state.user_tier = resp.json().get("tier", tier)
+        _get_user_profile.clear()
+        st.session_state.user_tier = _json_body(resp).get("tier", tier)
 
 
 def _update_consents(consent_telemetry: bool, consent_raw_text: bool) -> None:
@@ -240,7 +537,8 @@ def _update_consents(consent_telemetry: bool, consent_raw_text: bool) -> None:
         {"consent_telemetry": consent_telemetry, "consent_raw_text": consent_raw_text},
     )
     if resp.status_code == 200:
-        data = resp.json()
+        _get_user_profile.clear()
+        data = _json_body(resp)
         st.session_state.consent_telemetry = data.get(
             "consent_telemetry", consent_telemetry
         )
@@ -265,43 +563,23 @@ def _reset_new_session() -> None:
 
 
 def _attribute_rows(state_key: str, initial: Optional[dict] = None) -> Dict[str, str]:
-    if state_key not in st.session_state:
-        rows = [
-            {"key": key, "value": str(value)}
-            for key, value in (initial or {}).items()
-        ]
-        if not rows:
-            rows = [{"key": "", "value": ""}]
-        st.session_state[state_key] = rows
-    rows = st.session_state[state_key]
-    updated_rows: List[Dict[str, str]] = []
-    for idx, row in enumerate(rows):
-        col_key, col_val, col_del = st.columns([3, 3, 1])
-        key_val = col_key.text_input(
-            f"Key {idx + 1}",
-            value=row.get("key", ""),
-            key=f"{state_key}_key_{idx}",
-            label_visibility="collapsed",
-            placeholder="key",
-        )
-        val_val = col_val.text_input(
-            f"Value {idx + 1}",
-            value=row.get("value", ""),
-            key=f"{state_key}_val_{idx}",
-            label_visibility="collapsed",
-            placeholder="value",
-        )
-        remove = col_del.button("Remove", key=f"{state_key}_remove_{idx}")
-        if not remove:
-            updated_rows.append({"key": key_val, "value": val_val})
-    if st.button("Add attribute", key=f"{state_key}_add"):
-        updated_rows.append({"key": "", "value": ""})
-    st.session_state[state_key] = updated_rows
+    rows = [{"key": key, "value": str(value)} for key, value in (initial or {}).items()]
+    edited = st.data_editor(
+        rows or [{"key": "", "value": ""}],
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        key=state_key,
+        column_config={
+            "key": st.column_config.TextColumn("Key"),
+            "value": st.column_config.TextColumn("Value"),
+        },
+    )
     attrs: Dict[str, str] = {}
-    for row in updated_rows:
-        key = row.get("key", "").strip()
+    for row in edited:
+        key = (row.get("key") or "").strip()
         if key:
-            attrs[key] = row.get("value", "")
+            attrs[key] = row.get("value") or ""
     return attrs
 
 
@@ -327,12 +605,19 @@ def _build_intake_summary(
     return "Intake summary:\n" + "\n".join(lines)
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_session_json(user_id: str, session_id: int) -> Dict[str, Any]:
+    resp = _api_get(f"/sessions/{session_id}", user_id)
+    resp.raise_for_status()
+    return _json_body(resp)
+
+
 def _load_session_history(session_id: int) -> List[Dict[str, Any]]:
-    resp = _api_get(f"/sessions/{session_id}", st.session_state.user_id)
-    if resp.status_code != 200:
+    try:
+        data = _fetch_session_json(st.session_state.user_id, session_id)
+    except httpx.HTTPStatusError:
         st.error("Failed to load session history.")
         return []
-    data = resp.json()
     messages = []
     for msg in data.get("messages", []):
         role = msg.get("role")
@@ -349,11 +634,16 @@ def _load_session_history(session_id: int) -> List[Dict[str, Any]]:
 def _set_active_session(session_id: int) -> None:
     st.session_state.session_id = session_id
     st.session_state.messages = _load_session_history(session_id)
+    st.session_state.chat_history_limit = CHAT_HISTORY_PAGE_SIZE
     st.session_state.session_recap = None
     st.session_state.strategy_selection = None
     st.session_state.strategy_execution = None
 
 
+def _show_earlier_messages() -> None:
+    st.session_state.chat_history_limit += CHAT_HISTORY_PAGE_SIZE
+
+
 def _stream_roleplay_message(
     session_id: int,
     content: str,
@@ -363,44 +653,56 @@ def _stream_roleplay_message(
     response_text = ""
     payload: Dict[str, Any] = {}
     error_detail: Optional[str] = None
-    with httpx.Client(timeout=None) as client:
-        with client.stream(
-            "POST",
-            f"{API_BASE_URL}/sessions/{session_id}/messages",
-            params={"stream": "true"},
-            json={
-                "content": content,
-                "channel": "roleplay",
-                "enable_web_grounding": enable_web_grounding,
-                "web_grounding_trigger": "auto",
-            },
-            headers=_headers(st.session_state.user_id),
-        ) as resp:
-            if resp.status_code != 200:
-                raise RuntimeError(f"API error {resp.status_code}: {resp.text}")
-            content_type = resp.headers.get("content-type", "")
-            if "text/event-stream" in content_type:
-                for event, data in _iter_sse_events(resp):
-                    if event == "token":
-                        try:
-                            token = json.loads(data)
-                        except json.JSONDecodeError:
-                            token = data
-                        response_text += token
-                        placeholder.markdown(response_text)
-                    elif event == "error":
-                        try:
-                            error_payload = json.loads(data)
-                        except json.JSONDecodeError:
-                            error_payload = {"detail": data}
-                        error_detail = error_payload.get("detail", "Streaming error")
-                        break
-                    elif event == "done":
-                        payload = json.loads(data)
-            else:
-                payload = resp.json()
-                response_text = payload.get("counterparty_message", "") or ""
+    parts: List[str] = []
+    rendered = 0
+    last_render = time.monotonic()
+    with _http_client().stream(
+        "POST",
+        f"/sessions/{session_id}/messages",
+        params={"stream": "true"},
+        json={
+            "content": content,
+            "channel": "roleplay",
+            "enable_web_grounding": enable_web_grounding,
+            "web_grounding_trigger": "auto",
+        },
+        headers=_headers(st.session_state.user_id),
+    ) as resp:
+        if resp.status_code != 200:
+            resp.read()
+            raise RuntimeError(f"API error {resp.status_code}: {resp.text}")
+        content_type = resp.headers.get("content-type", "")
+        if "text/event-stream" in content_type:
+            for event, data in _iter_sse_events(resp):
+                if event == "token":
+                    parts.append(_decode_token(data))
+                    now = time.monotonic()
+                    if (
+                        len(parts) - rendered >= STREAM_RENDER_EVERY_TOKENS
+                        or now - last_render >= STREAM_RENDER_INTERVAL_SECONDS
+                    ):
+                        placeholder.markdown("".join(parts))
+                        rendered = len(parts)
+                        last_render = now
+                elif event == "error":
+                    try:
+                        error_payload = orjson.loads(data)
+                    except orjson.JSONDecodeError:
+                        error_payload = {"detail": data}
+                    error_detail = error_payload.get("detail", "Streaming error")
+                    break
+                elif event == "done":
+                    payload = orjson.loads(data)
+            response_text = "".join(parts)
+            if rendered < len(parts):
                 placeholder.markdown(response_text)
+        else:
+            payload = orjson.loads(resp.read())
+            response_text = payload.get("counterparty_message", "") or ""
+            placeholder.markdown(response_text)
+    # The turn wrote messages, facts and events; drop GETs cached earlier in this run.
+    st.session_state.pop("_req_cache", None)
+    _clear_api_get_cache()
     if error_detail:
         payload["error"] = error_detail
     return response_text, payload
@@ -416,8 +718,8 @@ def _render_user_controls() -> None:
         _load_user_profile()
     tier = st.selectbox(
         "Tier",
-        options=["standard", "premium"],
-        index=["standard", "premium"].index(st.session_state.user_tier),
+        options=_TIER_OPTIONS,
+        index=_TIER_INDEX.get(st.session_state.user_tier, 0),
         key="user_tier_select",
     )
     if tier != st.session_state.user_tier:
@@ -434,15 +736,20 @@ def _render_user_controls() -> None:
         or consent_raw_text != st.session_state.consent_raw_text
     ):
         _update_consents(consent_telemetry, consent_raw_text)
+    if st.button("Refresh profile", key="refresh_profile"):
+        _get_user_profile.clear()
+        st.rerun()
 
 
+@_fragment
 def _render_sessions_panel() -> None:
+    _reset_request_cache()
     st.markdown("### Sessions")
-    resp = _api_get("/sessions", st.session_state.user_id)
-    if resp.status_code != 200:
+    try:
+        sessions = _get_sessions(st.session_state.user_id)
+    except httpx.HTTPStatusError:
         st.error("Failed to load sessions.")
         return
-    sessions = resp.json()
     if not sessions:
         st.info("No sessions yet.")
         return
@@ -459,6 +766,8 @@ def _render_sessions_panel() -> None:
         label = "Open (active)" if is_active else "Open"
         if st.button(label, key=f"open_session_{session['id']}"):
             _set_active_session(session["id"])
+            # Switching sessions changes every other panel, not just this fragment.
+            st.rerun()
 
 
 def _render_new_session_panel() -> None:
@@ -472,18 +781,14 @@ def _render_new_session_panel() -> None:
         )
         style = st.selectbox(
             "Counterparty style",
-            options=["polite", "neutral", "tough", "busy", "defensive"],
-            index=["polite", "neutral", "tough", "busy", "defensive"].index(
-                st.session_state.new_session["counterparty_style"]
-            ),
+            options=_STYLE_OPTIONS,
+            index=_STYLE_INDEX.get(st.session_state.new_session["counterparty_style"], 1),
             key="new_session_style_select",
         )
         channel = st.selectbox(
             "Channel",
-            options=["EMAIL", "DM", "IN_PERSON_NOTES"],
-            index=["EMAIL", "DM", "IN_PERSON_NOTES"].index(
-                st.session_state.new_session.get("channel", "DM")
-            ),
+            options=_CHANNEL_OPTIONS,
+            index=_CHANNEL_INDEX.get(st.session_state.new_session.get("channel", "DM"), 1),
             key="new_session_channel_select",
         )
         st.session_state.new_session["topic_text"] = topic
@@ -498,13 +803,11 @@ def _render_new_session_panel() -> None:
                 st.session_state.new_session_step = 2
     elif step == 2:
         st.markdown("**Step 2: Entities**")
-        entities_resp = _api_get("/entities", st.session_state.user_id)
-        entities = entities_resp.json() if entities_resp.status_code == 200 else []
-        entity_map = {f"{ent['name']} ({ent['type']})": ent["id"] for ent in entities}
+        labels, label_to_id, id_to_label = _entity_labels(st.session_state.user_id)
         pending = [
             label
             for label in st.session_state.new_session_entity_select_pending
-            if label in entity_map
+            if label in label_to_id
         ]
         if pending:
             current = st.session_state.get("new_session_entity_select", [])
@@ -515,16 +818,16 @@ def _render_new_session_panel() -> None:
             st.session_state.new_session_entity_select_pending = []
         selected_labels = st.multiselect(
             "Attach existing entities",
-            options=list(entity_map.keys()),
+            options=labels,
             default=[
-                label
-                for label, eid in entity_map.items()
-                if eid in st.session_state.new_session["entity_ids"]
+                id_to_label[eid]
+                for eid in st.session_state.new_session["entity_ids"]
+                if eid in id_to_label
             ],
             key="new_session_entity_select",
         )
         st.session_state.new_session["entity_ids"] = [
-            entity_map[label] for label in selected_labels
+            label_to_id[label] for label in selected_labels
         ]
         with st.expander("Create new entity", expanded=False):
             ent_type = st.text_input("Type", value="person", key="new_session_entity_type")
@@ -541,7 +844,8 @@ def _render_new_session_panel() -> None:
                         {"type": ent_type, "name": ent_name, "attributes": ent_attrs},
                     )
                     if resp.status_code == 201:
-                        entity = resp.json()
+                        _invalidate_entities()
+                        entity = _json_body(resp)
                         entity_id = entity.get("id")
                         if entity_id is not None:
                             current_ids = st.session_state.new_session["entity_ids"]
@@ -574,7 +878,8 @@ def _render_new_session_panel() -> None:
             if st.button("Create session", type="primary", key="new_session_create_session"):
                 resp = _api_post("/sessions", st.session_state.user_id, payload)
                 if resp.status_code == 200:
-                    data = resp.json()
+                    _get_sessions.clear()
+                    data = _json_body(resp)
                     session_id = data.get("session_id")
                     st.session_state.intake_queue = data.get("intake_questions", [])
                     st.session_state.intake_answers = {}
@@ -604,10 +909,8 @@ def _render_session_controls(session_data: Dict[str, Any]) -> None:
     with col1:
         style = st.selectbox(
             "Counterparty style",
-            options=["polite", "neutral", "tough", "busy", "defensive"],
-            index=["polite", "neutral", "tough", "busy", "defensive"].index(
-                session_data.get("counterparty_style") or "neutral"
-            ),
+            options=_STYLE_OPTIONS,
+            index=_STYLE_INDEX.get(session_data.get("counterparty_style") or "neutral", 1),
             key=f"session_style_select_{session_id}",
         )
         if st.button("Apply style"):
@@ -616,25 +919,22 @@ def _render_session_controls(session_data: Dict[str, Any]) -> None:
                 st.session_state.user_id,
                 {"counterparty_style": style},
             )
+            _get_sessions.clear()
     with col2:
         st.checkbox(
             "Allow web grounding",
             value=st.session_state.allow_web_grounding,
             key="allow_web_grounding",
         )
-    entities_resp = _api_get("/entities", st.session_state.user_id)
-    entities = entities_resp.json() if entities_resp.status_code == 200 else []
-    entity_map = {f"{ent['name']} ({ent['type']})": ent["id"] for ent in entities}
+    labels, label_to_id, id_to_label = _entity_labels(st.session_state.user_id)
     attached_ids = [ent["id"] for ent in session_data.get("attached_entities", [])]
-    attached_labels = [
-        label for label, eid in entity_map.items() if eid in attached_ids
-    ]
+    attached_labels = [id_to_label[eid] for eid in attached_ids if eid in id_to_label]
     selection = st.multiselect(
         "Entity tray",
-        options=list(entity_map.keys()),
+        options=labels,
         default=attached_labels,
     )
-    selected_ids = [entity_map[label] for label in selection]
+    selected_ids = [label_to_id[label] for label in selection]
     if st.button("Update attachments"):
         attach_ids = [eid for eid in selected_ids if eid not in attached_ids]
         detach_ids = [eid for eid in attached_ids if eid not in selected_ids]
@@ -650,15 +950,18 @@ def _render_session_controls(session_data: Dict[str, Any]) -> None:
                 st.session_state.user_id,
                 {"entity_ids": detach_ids},
             )
+        if attach_ids or detach_ids:
+            _get_sessions.clear()
 
 
-def _render_session_event_log(session_id: int) -> None:
+def _render_session_event_log(session_id: int, resp: Optional[httpx.Response] = None) -> None:
     with st.expander("Orchestration log", expanded=False):
-        resp = _api_get(f"/sessions/{session_id}/events", st.session_state.user_id)
+        if resp is None:
+            resp = _api_get(f"/sessions/{session_id}/events", st.session_state.user_id)
         if resp.status_code != 200:
             st.error("Failed to load event log.")
             return
-        events = resp.json()
+        events = _json_body(resp)
         if not events:
             st.caption("No events yet.")
             return
@@ -671,31 +974,39 @@ def _render_session_event_log(session_id: int) -> None:
                 st.json(payload)
 
 
+@_fragment
 def _render_chat_panel() -> None:
+    _reset_request_cache()
     st.markdown("### Chat")
     session_id = st.session_state.session_id
     if not session_id:
         st.info("Select or create a session to start chatting.")
         return
-    session_resp = _api_get(f"/sessions/{session_id}", st.session_state.user_id)
+    # Everything this panel reads up front is fetched in one concurrent batch.
+    bundle = _fetch_panel_bundle(
+        st.session_state.user_id,
+        session_id,
+        include_selection=not st.session_state.strategy_selection,
+    )
+    session_resp = bundle["session"]
     if session_resp.status_code != 200:
         st.error("Failed to load session.")
         return
-    session_data = session_resp.json()
+    session_data = _json_body(session_resp)
     title = session_data.get("title") or "Session"
-    st.markdown(f"**Session {session_id}: {title}**")
-    if session_data.get("topic_text"):
-        st.caption(session_data.get("topic_text"))
-    st.caption(
-        f"Template: {session_data.get('template_id')} | Style: {session_data.get('counterparty_style') or 'neutral'}"
+    _render_heading_block(
+        f"Session {session_id}: {title}",
+        [
+            session_data.get("topic_text"),
+            f"Template: {session_data.get('template_id')} | "
+            f"Style: {session_data.get('counterparty_style') or 'neutral'}",
+        ],
     )
     selection_data = st.session_state.strategy_selection
-    if not selection_data:
-        selection_resp = _api_get(
-            f"/sessions/{session_id}/strategy/selection", st.session_state.user_id
-        )
+    selection_resp = bundle.get("selection")
+    if not selection_data and selection_resp is not None:
         if selection_resp.status_code == 200:
-            record = selection_resp.json()
+            record = _json_body(selection_resp)
             selection_data = record.get("selection_payload") or {}
             selection_data["selected_strategy_id"] = record.get("selected_strategy_id")
             st.session_state.strategy_selection = selection_data
@@ -709,14 +1020,18 @@ def _render_chat_panel() -> None:
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Reload history"):
+            _fetch_session_json.clear()
             st.session_state.messages = _load_session_history(session_id)
     with col2:
         if st.button("End session"):
             resp = _api_post(f"/sessions/{session_id}/end", st.session_state.user_id)
             if resp.status_code == 200:
-                recap = resp.json()
+                _get_sessions.clear()
+                _fetch_session_json.clear()
+                recap = _json_body(resp)
                 st.session_state.session_recap = recap.get("recap")
-                st.success("Session ended.")
+                # Rerun the whole app so the sidebar list picks up the ended status.
+                st.rerun()
             else:
                 st.error(resp.text)
     if session_data.get("ended_at"):
@@ -745,15 +1060,17 @@ def _render_chat_panel() -> None:
             response = st.chat_input("Answer intake question")
             if response:
                 answers[next_question] = response
-                st.session_state.intake_answers = answers
-                st.session_state.intake_transcript.extend(
-                    [
+                # Collect the state changes and apply them in one update before the rerun.
+                updates: Dict[str, Any] = {
+                    "intake_answers": answers,
+                    "intake_transcript": st.session_state.intake_transcript
+                    + [
                         {"role": "assistant", "content": next_question},
                         {"role": "user", "content": response},
-                    ]
-                )
+                    ],
+                }
                 if len(answers) >= len(intake_questions):
-                    st.session_state.intake_summary = _build_intake_summary(
+                    summary = _build_intake_summary(
                         session_data.get("topic_text", ""),
                         session_data.get("template_id"),
                         intake_questions,
@@ -762,7 +1079,7 @@ def _render_chat_panel() -> None:
                     intake_payload = {
                         "questions": intake_questions,
                         "answers": answers,
-                        "summary": st.session_state.intake_summary,
+                        "summary": summary,
                     }
                     intake_resp = _api_post(
                         f"/sessions/{session_id}/intake",
@@ -770,14 +1087,17 @@ def _render_chat_panel() -> None:
                         intake_payload,
                     )
                     if intake_resp.status_code == 200:
-                        intake_data = intake_resp.json()
-                        st.session_state.strategy_selection = intake_data.get(
-                            "strategy_selection"
-                        )
+                        _get_sessions.clear()
+                        intake_data = _json_body(intake_resp)
+                        updates["strategy_selection"] = intake_data.get("strategy_selection")
                     else:
                         st.error(intake_resp.text)
-                    st.session_state.intake_queue = []
-                    st.session_state.intake_autostart_pending = True
+                    updates.update(
+                        intake_summary=summary,
+                        intake_queue=[],
+                        intake_autostart_pending=True,
+                    )
+                st.session_state.update(updates)
                 st.rerun()
         return
     if (
@@ -787,7 +1107,15 @@ def _render_chat_panel() -> None:
         for message in st.session_state.intake_transcript:
             with st.chat_message(message["role"]):
                 st.markdown(message["content"])
-    for message in st.session_state.messages:
+    messages = st.session_state.messages
+    hidden = max(len(messages) - st.session_state.chat_history_limit, 0)
+    if hidden:
+        st.button(
+            f"Load earlier messages ({hidden} hidden)",
+            key="chat_load_earlier",
+            on_click=_show_earlier_messages,
+        )
+    for message in messages[hidden:]:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
             if message.get("coach_panel"):
@@ -808,9 +1136,9 @@ def _render_chat_panel() -> None:
     if prompt:
         if st.session_state.intake_autostart_pending:
             st.session_state.intake_autostart_pending = False
-        outbound = prompt
         if st.session_state.intake_summary:
-            outbound = f"{st.session_state.intake_summary}\n\nUser message: {prompt}"
+            # The summary already reached the case snapshot via /intake; the first
+            # roleplay turn carries only what the user typed.
             st.session_state.intake_summary = None
             st.session_state.intake_session_id = None
             st.session_state.intake_transcript = []
@@ -821,7 +1149,7 @@ def _render_chat_panel() -> None:
             placeholder = st.empty()
             response_text, payload = _stream_roleplay_message(
                 session_id,
-                outbound,
+                prompt,
                 placeholder,
                 st.session_state.allow_web_grounding,
             )
@@ -835,6 +1163,10 @@ def _render_chat_panel() -> None:
                     st.json(payload["grounding_pack"])
             if payload.get("strategy_selection"):
                 st.session_state.strategy_selection = payload["strategy_selection"]
+        # The local transcript is already current; drop the cached copy so reopening
+        # this session later fetches the new turns, and the panels see the new facts.
+        _fetch_session_json.clear()
+        _clear_api_get_cache()
         st.session_state.messages.append(
             {
                 "role": "assistant",
@@ -843,7 +1175,45 @@ def _render_chat_panel() -> None:
                 "grounding_pack": payload.get("grounding_pack"),
             }
         )
-    _render_session_event_log(session_id)
+    # A message sent during this rerun adds events, so only reuse the batch otherwise.
+    _render_session_event_log(session_id, None if prompt else bundle["events"])
+
+
+def _truncate_json(obj: Any, max_depth: int, max_items: int, depth: int = 0) -> Any:
+    """Cut ``obj`` down to ``max_depth`` levels and ``max_items`` entries per container."""
+    if isinstance(obj, dict):
+        if depth >= max_depth:
+            return f"…({len(obj)} keys)"
+        items = list(obj.items())
+        trimmed = {
+            key: _truncate_json(value, max_depth, max_items, depth + 1)
+            for key, value in items[:max_items]
+        }
+        if len(items) > max_items:
+            trimmed["…"] = f"({len(items) - max_items} more)"
+        return trimmed
+    if isinstance(obj, list):
+        if depth >= max_depth:
+            return f"…({len(obj)} items)"
+        trimmed_list = [
+            _truncate_json(value, max_depth, max_items, depth + 1) for value in obj[:max_items]
+        ]
+        if len(obj) > max_items:
+            trimmed_list.append(f"…({len(obj) - max_items} more)")
+        return trimmed_list
+    return obj
+
+
+def _render_json_compact(
+    obj: Any,
+    max_depth: Optional[int] = JSON_PREVIEW_MAX_DEPTH,
+    max_items: int = JSON_PREVIEW_MAX_ITEMS,
+) -> None:
+    """Render a collapsed, size-bounded ``st.json`` unless the user opted into full JSON."""
+    if max_depth is None or st.session_state.get("json_expand_all"):
+        st.json(obj, expanded=True)
+        return
+    st.json(_truncate_json(obj, max_depth, max_items), expanded=False)
 
 
 def _escape_html(text: str) -> str:
@@ -1039,24 +1409,44 @@ def _render_memory_review_panel() -> None:
     if not session_id:
         st.info("Select a session to review facts.")
         return
-    resp = _api_get(f"/sessions/{session_id}/facts", st.session_state.user_id)
-    if resp.status_code != 200:
-        st.error("Failed to load session facts.")
+    facts = _fetch(
+        f"/sessions/{session_id}/facts", st.session_state.user_id, "Failed to load session facts."
+    )
+    if facts is None:
         return
-    facts = resp.json()
     if not facts:
         st.info("No extracted facts to review.")
         return
-    decisions = []
-    for fact in facts:
-        st.markdown(f"**{fact['key']}** = {fact['value']}")
-        st.caption(f"Source: {fact.get('source_ref')}")
-        decision = st.selectbox(
-            f"Decision for fact {fact['id']}",
-            options=["save_global", "save_session_only", "discard"],
-            key=f"fact_decision_{fact['id']}",
-        )
-        decisions.append({"fact_id": fact["id"], "decision": decision})
+    rows = [
+        {
+            "fact_id": fact["id"],
+            "key": fact["key"],
+            "value": fact["value"],
+            "source": fact.get("source_ref"),
+            "decision": "save_global",
+        }
+        for fact in facts
+    ]
+    # One editor for every fact; edits are row-indexed, so a changed fact list gets a new key.
+    edited = st.data_editor(
+        rows,
+        hide_index=True,
+        use_container_width=True,
+        disabled=["fact_id", "key", "value", "source"],
+        key=f"memory_review_{session_id}_{len(facts)}_{facts[-1]['id']}",
+        column_config={
+            "fact_id": st.column_config.NumberColumn("Fact"),
+            "key": st.column_config.TextColumn("Key"),
+            "value": st.column_config.TextColumn("Value"),
+            "source": st.column_config.TextColumn("Source"),
+            "decision": st.column_config.SelectboxColumn(
+                "Decision",
+                options=["save_global", "save_session_only", "discard"],
+                required=True,
+            ),
+        },
+    )
+    decisions = [{"fact_id": row["fact_id"], "decision": row["decision"]} for row in edited]
     if st.button("Submit decisions", type="primary"):
         resp = _api_post(
             f"/sessions/{session_id}/memory-review",
@@ -1075,28 +1465,32 @@ def _render_session_kg_snapshot(session_data: Dict[str, Any]) -> None:
     if not attached_entities:
         st.info("No attached entities for this session.")
         return
-    attached_ids = [ent.get("id") for ent in attached_entities]
+    attached_ids = sorted({ent.get("id") for ent in attached_entities})
     st.markdown("**Attached Entities**")
-    st.json(attached_entities)
-    facts_resp = _api_get("/facts", st.session_state.user_id)
-    if facts_resp.status_code == 200:
-        all_facts = facts_resp.json()
-        scoped = [
-            fact for fact in all_facts if fact.get("subject_entity_id") in attached_ids
-        ]
+    _render_json_compact(attached_entities)
+    # The API filters by entity, so only the attached subset is transferred and parsed.
+    scoped = _api_get_cached(
+        "/facts?" + urlencode([("subject_entity_id", eid) for eid in attached_ids]),
+        st.session_state.user_id,
+    )[2]
+    if scoped is not None:
         st.markdown("**Facts for Attached Entities**")
-        st.json(scoped)
-    rel_resp = _api_get("/relationships", st.session_state.user_id)
-    if rel_resp.status_code == 200:
-        relationships = rel_resp.json()
-        scoped_rel = [
-            rel
-            for rel in relationships
-            if rel.get("src_entity_id") in attached_ids
-            or rel.get("dst_entity_id") in attached_ids
-        ]
+        _render_json_compact(scoped)
+    scoped_rel = _api_get_cached(
+        "/relationships?" + urlencode([("entity_id", eid) for eid in attached_ids]),
+        st.session_state.user_id,
+    )[2]
+    if scoped_rel is not None:
         st.markdown("**Relationships (attached)**")
-        st.json(scoped_rel)
+        _render_json_compact(scoped_rel)
+
+
+def _latest_prompt_event_path(session_id: int) -> str:
+    # The API returns just the newest prompt-context event instead of the whole log.
+    return (
+        f"/sessions/{session_id}/events"
+        "?event_type=ORCHESTRATION_CONTEXT_BUILT&limit=1&order=desc"
+    )
 
 
 def _render_orchestration_panel() -> None:
@@ -1105,16 +1499,12 @@ def _render_orchestration_panel() -> None:
     if not session_id:
         st.info("Select a session to see orchestration context.")
         return
-    events_resp = _api_get(f"/sessions/{session_id}/events", st.session_state.user_id)
-    if events_resp.status_code != 200:
-        st.error("Failed to load events.")
+    events = _fetch(
+        _latest_prompt_event_path(session_id), st.session_state.user_id, "Failed to load events."
+    )
+    if events is None:
         return
-    events = events_resp.json()
-    prompt_event = None
-    for event in reversed(events):
-        if event.get("event_type") == "ORCHESTRATION_CONTEXT_BUILT":
-            prompt_event = event
-            break
+    prompt_event = events[0] if events else None
     if not prompt_event:
         st.info("No prompt context recorded yet.")
         return
@@ -1127,13 +1517,21 @@ def _render_orchestration_panel() -> None:
     if not messages:
         st.info("Prompt messages not available.")
     else:
-        for msg in messages:
+        for index, msg in enumerate(messages):
             role = msg.get("role", "unknown")
             content = msg.get("content", "")
             st.markdown(f"**{role}**")
-            st.write(content)
+            # Prompt text goes out as a plain code block: no Markdown parse, bounded size.
+            if len(content) <= PROMPT_MESSAGE_PREVIEW_CHARS:
+                st.code(content, language=None)
+            elif st.toggle(
+                f"Show all {len(content)} characters", key=f"prompt_msg_full_{index}"
+            ):
+                st.code(content, language=None)
+            else:
+                st.code(content[:PROMPT_MESSAGE_PREVIEW_CHARS] + "…", language=None)
     with st.expander("Raw prompt payload", expanded=False):
-        st.json(payload)
+        _render_json_compact(payload)
 
 
 def _render_strategy_panel(show_header: bool = True) -> None:
@@ -1147,7 +1545,7 @@ def _render_strategy_panel(show_header: bool = True) -> None:
     if not selection:
         resp = _api_get(f"/sessions/{session_id}/strategy/selection", st.session_state.user_id)
         if resp.status_code == 200:
-            record = resp.json()
+            record = _json_body(resp)
             selection = record.get("selection_payload") or {}
             selection["selected_strategy_id"] = record.get("selected_strategy_id")
             st.session_state.strategy_selection = selection
@@ -1164,16 +1562,15 @@ def _render_strategy_panel(show_header: bool = True) -> None:
         st.info("Strategy selection is incomplete.")
         return
     st.caption(f"Selected strategy: {selected_id}")
-    strat_resp = _api_get(f"/strategies/{selected_id}", st.session_state.user_id)
-    if strat_resp.status_code != 200:
+    try:
+        strategy = _get_strategy(st.session_state.user_id, selected_id)
+    except httpx.HTTPStatusError:
         st.error("Failed to load strategy details.")
         return
-    strategy = strat_resp.json()
-    st.markdown(f"**{strategy.get('name')}**")
-    if strategy.get("summary"):
-        st.caption(strategy.get("summary"))
-    if strategy.get("goal"):
-        st.caption(f"Goal: {strategy.get('goal')}")
+    goal = strategy.get("goal")
+    _render_heading_block(
+        str(strategy.get("name")), [strategy.get("summary"), f"Goal: {goal}" if goal else None]
+    )
     if ranked:
         with st.expander("Ranking details", expanded=False):
             st.json(ranked)
@@ -1217,7 +1614,7 @@ def _render_strategy_panel(show_header: bool = True) -> None:
             {"strategy_id": selected_id, "inputs": inputs_payload},
         )
         if resp.status_code == 200:
-            st.session_state.strategy_execution = resp.json()
+            st.session_state.strategy_execution = _json_body(resp)
         else:
             st.error(resp.text)
     if st.session_state.strategy_execution:
@@ -1225,58 +1622,106 @@ def _render_strategy_panel(show_header: bool = True) -> None:
             st.json(st.session_state.strategy_execution)
 
 
+def _entity_option_label(ent: Dict[str, Any]) -> str:
+    return f"{ent['name']} ({ent['id']})"
+
+
+def _fact_option_label(fact: Dict[str, Any]) -> str:
+    return f"{fact['key']} ({fact['id']})"
+
+
+def _relationship_option_label(rel: Dict[str, Any]) -> str:
+    return f"{rel['rel_type']} ({rel['id']})"
+
+
+def _edge_option_label(edge: Dict[str, Any]) -> str:
+    return f"{edge['id']} ({edge['status']})"
+
+
+def _filtered_options(
+    items: List[Dict[str, Any]], label: Callable[[Dict[str, Any]], str], filter_key: str
+) -> List[Dict[str, Any]]:
+    """Return up to ``KG_PICKER_MAX_OPTIONS`` items whose label matches a filter box.
+
+    The items themselves become the selectbox options, with ``label`` as its
+    ``format_func``, so labels are only built while filtering.
+    """
+    query = st.text_input("Filter", key=filter_key, placeholder="Type to narrow the list")
+    needle = query.strip().lower()
+    options: List[Dict[str, Any]] = []
+    for item in items:
+        if needle and needle not in label(item).lower():
+            continue
+        options.append(item)
+        if len(options) >= KG_PICKER_MAX_OPTIONS:
+            st.caption(f"Showing the first {KG_PICKER_MAX_OPTIONS} matches; refine the filter.")
+            break
+    if not options:
+        st.info("No matches.")
+    return options
+
+
+@_fragment
+def _render_entity_editor(entity: Dict[str, Any]) -> None:
+    # A fragment, so typing a name or editing attribute cells reruns just this editor
+    # instead of the whole app with every other panel's reads.
+    new_name = st.text_input(
+        "New name",
+        value=entity["name"],
+        key=f"ent_edit_name_{entity['id']}",
+    )
+    st.markdown("Attributes")
+    attrs = _attribute_rows(
+        f"ent_edit_attrs_{entity['id']}",
+        initial=entity.get("attributes") or {},
+    )
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button(
+            "Update entity", key=f"ent_update_{entity['id']}"
+        ):
+            resp = _api_patch(
+                f"/entities/{entity['id']}",
+                st.session_state.user_id,
+                {"name": new_name, "attributes": attrs},
+            )
+            if resp.status_code == 200:
+                _invalidate_entities()
+                st.success("Entity updated.")
+            else:
+                st.error(resp.text)
+    with col2:
+        if st.button(
+            "Delete entity", key=f"ent_delete_{entity['id']}"
+        ):
+            resp = _api_delete(
+                f"/entities/{entity['id']}", st.session_state.user_id
+            )
+            if resp.status_code == 204:
+                _invalidate_entities()
+                st.warning("Entity deleted.")
+            else:
+                st.error(resp.text)
+
+
 def _render_kg_manager_panel() -> None:
     st.markdown("### Knowledge Graph")
     tab_entities, tab_facts, tab_relationships, tab_edges = st.tabs(
         ["Entities", "Facts", "Relationships", "Knowledge Edges"]
     )
     with tab_entities:
-        resp = _api_get("/entities", st.session_state.user_id)
-        entities = resp.json() if resp.status_code == 200 else []
+        entities = _list_entities(st.session_state.user_id)
         if entities:
-            st.dataframe(entities, use_container_width=True)
-            options = {f"{ent['name']} ({ent['id']})": ent for ent in entities}
-            selected_label = st.selectbox(
+            st.dataframe(_as_df(orjson.dumps(entities)), use_container_width=True)
+            options = _filtered_options(entities, _entity_option_label, "kg_ent_filter")
+        if entities and options:
+            selected_entity = st.selectbox(
                 "Select entity to edit",
-                options=list(options.keys()),
+                options=options,
+                format_func=_entity_option_label,
                 key="kg_entity_select",
             )
-            selected_entity = options[selected_label]
-            new_name = st.text_input(
-                "New name",
-                value=selected_entity["name"],
-                key=f"ent_edit_name_{selected_entity['id']}",
-            )
-            st.markdown("Attributes")
-            attrs = _attribute_rows(
-                f"ent_edit_attrs_{selected_entity['id']}",
-                initial=selected_entity.get("attributes") or {},
-            )
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button(
-                    "Update entity", key=f"ent_update_{selected_entity['id']}"
-                ):
-                    resp = _api_patch(
-                        f"/entities/{selected_entity['id']}",
-                        st.session_state.user_id,
-                        {"name": new_name, "attributes": attrs},
-                    )
-                    if resp.status_code == 200:
-                        st.success("Entity updated.")
-                    else:
-                        st.error(resp.text)
-            with col2:
-                if st.button(
-                    "Delete entity", key=f"ent_delete_{selected_entity['id']}"
-                ):
-                    resp = _api_delete(
-                        f"/entities/{selected_entity['id']}", st.session_state.user_id
-                    )
-                    if resp.status_code == 204:
-                        st.warning("Entity deleted.")
-                    else:
-                        st.error(resp.text)
+            _render_entity_editor(selected_entity)
         with st.expander("Create entity", expanded=False):
             ent_type = st.text_input("Type", key="kg_ent_type")
             ent_name = st.text_input("Name", key="kg_ent_name")
@@ -1292,23 +1737,23 @@ def _render_kg_manager_panel() -> None:
                         {"type": ent_type, "name": ent_name, "attributes": ent_attrs},
                     )
                     if resp.status_code == 201:
+                        _invalidate_entities()
                         st.success("Entity created.")
                     else:
                         st.error(resp.text)
     with tab_facts:
-        resp = _api_get("/facts", st.session_state.user_id)
-        facts = resp.json() if resp.status_code == 200 else []
+        _, facts_json, facts = _api_get_cached("/facts", st.session_state.user_id)
+        facts = facts or []
         if facts:
-            st.dataframe(facts, use_container_width=True)
-            fact_options = {
-                f"{fact['key']} ({fact['id']})": fact for fact in facts
-            }
-            selected_label = st.selectbox(
+            st.dataframe(_as_df(facts_json), use_container_width=True)
+            fact_options = _filtered_options(facts, _fact_option_label, "kg_fact_filter")
+        if facts and fact_options:
+            selected_fact = st.selectbox(
                 "Select fact to edit",
-                options=list(fact_options.keys()),
+                options=fact_options,
+                format_func=_fact_option_label,
                 key="kg_fact_select",
             )
-            selected_fact = fact_options[selected_label]
             new_key = st.text_input(
                 "New key", value=selected_fact["key"], key="fact_edit_key"
             )
@@ -1367,19 +1812,22 @@ def _render_kg_manager_panel() -> None:
                 else:
                     st.error(resp.text)
     with tab_relationships:
-        resp = _api_get("/relationships", st.session_state.user_id)
-        relationships = resp.json() if resp.status_code == 200 else []
+        _, relationships_json, relationships = _api_get_cached(
+            "/relationships", st.session_state.user_id
+        )
+        relationships = relationships or []
         if relationships:
-            st.dataframe(relationships, use_container_width=True)
-            rel_options = {
-                f"{rel['rel_type']} ({rel['id']})": rel for rel in relationships
-            }
-            selected_label = st.selectbox(
+            st.dataframe(_as_df(relationships_json), use_container_width=True)
+            rel_options = _filtered_options(
+                relationships, _relationship_option_label, "kg_rel_filter"
+            )
+        if relationships and rel_options:
+            selected_rel = st.selectbox(
                 "Select relationship to delete",
-                options=list(rel_options.keys()),
+                options=rel_options,
+                format_func=_relationship_option_label,
                 key="kg_relationship_select",
             )
-            selected_rel = rel_options[selected_label]
             if st.button("Delete relationship", key="rel_delete"):
                 resp = _api_delete(
                     f"/relationships/{selected_rel['id']}", st.session_state.user_id
@@ -1411,10 +1859,10 @@ def _render_kg_manager_panel() -> None:
                 else:
                     st.error(resp.text)
     with tab_edges:
-        resp = _api_get("/knowledge-edges", st.session_state.user_id)
-        edges = resp.json() if resp.status_code == 200 else []
+        _, edges_json, edges = _api_get_cached("/knowledge-edges", st.session_state.user_id)
+        edges = edges or []
         if edges:
-            st.dataframe(edges, use_container_width=True)
+            st.dataframe(_as_df(edges_json), use_container_width=True)
         if st.session_state.user_tier != "premium":
             st.info("Premium tier required to edit knowledge edges.")
         with st.expander("Create knowledge edge", expanded=False):
@@ -1447,13 +1895,14 @@ def _render_kg_manager_panel() -> None:
                 else:
                     st.error(resp.text)
         if edges and st.session_state.user_tier == "premium":
-            edge_options = {f"{edge['id']} ({edge['status']})": edge for edge in edges}
-            selected_label = st.selectbox(
+            edge_options = _filtered_options(edges, _edge_option_label, "kg_edge_filter")
+        if edges and st.session_state.user_tier == "premium" and edge_options:
+            selected_edge = st.selectbox(
                 "Select knowledge edge to delete",
-                options=list(edge_options.keys()),
+                options=edge_options,
+                format_func=_edge_option_label,
                 key="kg_edge_select",
             )
-            selected_edge = edge_options[selected_label]
             if st.button("Delete knowledge edge", key="edge_delete"):
                 resp = _api_delete(
                     f"/knowledge-edges/{selected_edge['id']}", st.session_state.user_id
@@ -1466,14 +1915,25 @@ def _render_kg_manager_panel() -> None:
 
 def _render_templates_panel() -> None:
     st.markdown("### Templates")
-    drafts_resp = _api_get("/templates/drafts", st.session_state.user_id)
-    if drafts_resp.status_code == 200:
+    state = _api_get_cached("/templates/state", st.session_state.user_id)[2]
+    if state is not None:
         st.markdown("**Drafts**")
-        st.json(drafts_resp.json())
-    proposals_resp = _api_get("/templates/proposals", st.session_state.user_id)
-    if proposals_resp.status_code == 200:
+        _render_json_compact(state.get("drafts", []))
         st.markdown("**Proposals**")
-        st.json(proposals_resp.json())
+        _render_json_compact(state.get("proposals", []))
+
+
+def _events_cursors(session_id: int) -> List[int]:
+    # Keyset paging: the stack holds the after_id cursor of each page opened so far.
+    return st.session_state.setdefault(f"events_cursors_{session_id}", [])
+
+
+def _events_page_path(session_id: int) -> str:
+    cursors = _events_cursors(session_id)
+    path = f"/sessions/{session_id}/events?limit={EVENTS_PAGE_SIZE}"
+    if cursors:
+        path += f"&after_id={cursors[-1]}"
+    return path
 
 
 def _render_events_panel() -> None:
@@ -1482,32 +1942,66 @@ def _render_events_panel() -> None:
     if not session_id:
         st.info("Select a session to view events.")
         return
-    events_resp = _api_get(f"/sessions/{session_id}/events", st.session_state.user_id)
-    if events_resp.status_code != 200:
+    cursors = _events_cursors(session_id)
+    status, events_json, events = _api_get_cached(
+        _events_page_path(session_id), st.session_state.user_id
+    )
+    if status != 200:
         st.error("Failed to load events.")
         return
-    events = events_resp.json()
-    if not events:
+    if not events and not cursors:
         st.info("No events yet.")
         return
-    st.dataframe(events, use_container_width=True)
+    st.caption(f"Page {len(cursors) + 1} ({len(events)} events)")
+    st.dataframe(_as_df(events_json), height=400, use_container_width=True)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button(
+            "Previous page", key="events_prev", disabled=not cursors, on_click=cursors.pop
+        )
+    with col2:
+        st.button(
+            "Next page",
+            key="events_next",
+            disabled=len(events) < EVENTS_PAGE_SIZE,
+            on_click=cursors.append,
+            args=(events[-1]["id"] if events else 0,),
+        )
+
+
+def _admin_proposals_cursors() -> List[int]:
+    # Keyset paging: the stack holds the before_id cursor of each page opened so far.
+    return st.session_state.setdefault("admin_proposals_cursors", [])
+
+
+def _admin_proposals_page_path() -> str:
+    cursors = _admin_proposals_cursors()
+    path = f"/admin/template-proposals?limit={ADMIN_PROPOSALS_PAGE_SIZE}"
+    if cursors:
+        path += f"&before_id={cursors[-1]}"
+    return path
 
 
 def _render_admin_panel() -> None:
     st.markdown("### Admin Review")
-    resp = _api_get("/admin/template-proposals", st.session_state.user_id)
-    if resp.status_code != 200:
-        st.error("Failed to load template proposals.")
+    cursors = _admin_proposals_cursors()
+    proposals = _fetch(
+        _admin_proposals_page_path(),
+        st.session_state.user_id,
+        "Failed to load template proposals.",
+    )
+    if proposals is None:
         return
-    proposals = resp.json()
-    if not proposals:
+    if not proposals and not cursors:
         st.info("No template proposals.")
         return
+    st.caption(f"Page {len(cursors) + 1} ({len(proposals)} proposals)")
     for proposal in proposals:
         st.markdown(
             f"**Proposal {proposal['id']}** (status: {proposal['status']})"
         )
-        st.json(proposal.get("payload"))
+        with st.expander(f"Payload {proposal['id']}", expanded=False):
+            _render_json_compact(proposal.get("payload"))
         notes = st.text_area(
             "Reviewer notes", key=f"proposal_notes_{proposal['id']}"
         )
@@ -1534,11 +2028,78 @@ def _render_admin_panel() -> None:
                     st.warning("Rejected.")
                 else:
                     st.error(resp.text)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button(
+            "Previous page",
+            key="admin_proposals_prev",
+            disabled=not cursors,
+            on_click=cursors.pop,
+        )
+    with col2:
+        st.button(
+            "Next page",
+            key="admin_proposals_next",
+            disabled=len(proposals) < ADMIN_PROPOSALS_PAGE_SIZE,
+            on_click=cursors.append,
+            args=(proposals[-1]["id"] if proposals else 0,),
+        )
+
+
+def _prefetch_right_column() -> None:
+    """Fetch what the visible right-column panels will read in one concurrent batch.
+
+    Paths that ``_api_get_cached`` can still serve are skipped. The rest land in the
+    per-run GET cache, so each panel's own read is served from memory instead of paying
+    one round trip after another.
+    """
+    session_id = st.session_state.session_id
+    paths: Dict[str, str] = {}
+    if session_id:
+        paths["session_facts"] = f"/sessions/{session_id}/facts"
+        paths["prompt_event"] = _latest_prompt_event_path(session_id)
+        if st.session_state.get("show_session_kg"):
+            paths["session"] = f"/sessions/{session_id}"
+        if st.session_state.get("show_events"):
+            paths["events_page"] = _events_page_path(session_id)
+    if st.session_state.get("show_kg"):
+        paths.update(
+            facts="/facts", relationships="/relationships", edges="/knowledge-edges"
+        )
+    if st.session_state.get("show_templates"):
+        paths["templates"] = "/templates/state"
+    if st.session_state.get("show_admin"):
+        paths["admin"] = _admin_proposals_page_path()
+    user_id = st.session_state.user_id
+    stale = {
+        name: path for name, path in paths.items() if not _api_get_cached_is_fresh(path, user_id)
+    }
+    if len(stale) > 1:
+        _api_get_many(stale, user_id)
+
+
+def _render_lazy_panel(label: str, key: str, render: Callable[[], None]) -> None:
+    """Run ``render`` only while its toggle is on, so hidden panels make no API calls."""
+    # Unlike a collapsed st.expander, whose body still executes, a toggle gates the work.
+    if st.toggle(label, key=key):
+        with st.container(border=True):
+            render()
+
+
+def _render_session_kg_panel() -> None:
+    session_data = _fetch(
+        f"/sessions/{st.session_state.session_id}",
+        st.session_state.user_id,
+        "Failed to load session.",
+    )
+    if session_data is not None:
+        _render_session_kg_snapshot(session_data)
 
 
 def main() -> None:
     st.set_page_config(page_title="Negotiation Companion", layout="wide")
     st.title("Negotiation Companion")
+    _reset_request_cache()
     _ensure_user_state()
     _load_user_profile()
     _inject_canvas_styles()
@@ -1566,26 +2127,22 @@ def main() -> None:
     with center_col:
         _render_chat_panel()
     with right_col:
+        st.checkbox(
+            "Expand all JSON",
+            key="json_expand_all",
+            help="Render full payloads instead of a collapsed two-level preview.",
+        )
+        _prefetch_right_column()
         with st.expander("Memory Review", expanded=True):
             _render_memory_review_panel()
         with st.expander("Orchestration", expanded=True):
             _render_orchestration_panel()
-        session_id = st.session_state.session_id
-        if session_id:
-            session_resp = _api_get(
-                f"/sessions/{session_id}", st.session_state.user_id
-            )
-            if session_resp.status_code == 200:
-                with st.expander("Session KG Snapshot", expanded=False):
-                    _render_session_kg_snapshot(session_resp.json())
-        with st.expander("Knowledge Graph Manager", expanded=False):
-            _render_kg_manager_panel()
-        with st.expander("Templates", expanded=False):
-            _render_templates_panel()
-        with st.expander("Event Timeline", expanded=False):
-            _render_events_panel()
-        with st.expander("Admin Review", expanded=False):
-            _render_admin_panel()
+        if st.session_state.session_id:
+            _render_lazy_panel("Session KG Snapshot", "show_session_kg", _render_session_kg_panel)
+        _render_lazy_panel("Knowledge Graph Manager", "show_kg", _render_kg_manager_panel)
+        _render_lazy_panel("Templates", "show_templates", _render_templates_panel)
+        _render_lazy_panel("Event Timeline", "show_events", _render_events_panel)
+        _render_lazy_panel("Admin Review", "show_admin", _render_admin_panel)
 
 
 if __name__ == "__main__":
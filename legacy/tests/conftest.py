@@ -0,0 +1,21 @@
+"""
+Shared pytest configuration.
+
+LiteLLM is replaced by a bare module before any ``negot`` import so the test
+session does not pay for its import graph (or its model-cost-map download).
+Tests never reach the provider: they patch ``acompletion_with_retry`` in each
+service module, and the stub fails loudly if a call slips through.
+"""
+import sys
+import types
+
+
+async def _unpatched_acompletion(**kwargs):  # type: ignore[no-untyped-def]
+    raise AssertionError("LLM call reached LiteLLM; patch acompletion_with_retry in the caller.")
+
+
+if "litellm" not in sys.modules:
+    _litellm = types.ModuleType("litellm")
+    _litellm.acompletion = _unpatched_acompletion  # type: ignore[attr-defined]
+    _litellm.BadRequestError = type("BadRequestError", (Exception,), {})  # type: ignore[attr-defined]
+    sys.modules["litellm"] = _litellm
@@ -6,205 +6,280 @@ database and verify that sessions can be created, messages can be
 exchanged and memory review operates as expected. The tests use
 pytest‑asyncio to run asynchronous test functions.
 """
-import asyncio
 import json
-import os
+from contextlib import aclosing
+from typing import AsyncIterator, Iterator, Optional
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
 from negot.api.main import create_app
 from negot.core.config import get_settings
-from negot.core.db import init_db_schema, get_db_session
+from negot.core.db import Base, get_engine, init_db_schema
 
 
-@pytest.fixture(autouse=True)
-def set_test_db_env(monkeypatch: pytest.MonkeyPatch) -> None:
+# The app, its schema and the engine are shared by every test in the module, so the tests
+# also share one event loop.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def set_test_db_env() -> Iterator[None]:
     """Configure the DATABASE_URL to use an in-memory SQLite DB for tests."""
-    monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
-    monkeypatch.setenv("NEGOT_ENV", "test")
-    monkeypatch.setenv("LITELLM_MODEL", "test-model")
-    monkeypatch.setenv("LITELLM_API_KEY", "")
-    # Recreate settings cache so new env takes effect
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+        monkeypatch.setenv("NEGOT_ENV", "test")
+        monkeypatch.setenv("LITELLM_MODEL", "test-model")
+        monkeypatch.setenv("LITELLM_API_KEY", "")
+        # Parse the test settings once; every get_settings() call in the session reuses them.
+        get_settings.cache_clear()
+        assert get_settings().database_url.startswith("sqlite")
+        yield
     get_settings.cache_clear()
 
 
-@pytest.fixture(autouse=True)
-def mock_llm(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def _fake_acompletion_with_retry(**kwargs):  # type: ignore[no-untyped-def]
-        if kwargs.get("stream"):
-            async def _stream():
-                yield {"choices": [{"delta": {"content": "Hello"}}]}
-                yield {"choices": [{"delta": {"content": " there"}}]}
-            return _stream()
-        messages = kwargs.get("messages") or []
-        system = messages[0]["content"] if messages else ""
-        if "Intake Question Agent" in system:
-            content = json.dumps({"questions": ["Who are you negotiating with?"]})
-        elif "Template Router agent" in system:
-            content = json.dumps({"template_id": "salary_offer", "confidence": 0.9, "rationale": "Matches salary topic."})
-        elif "Web Grounding NeedSearch agent" in system:
-            content = json.dumps(
-                {
-                    "need_search": False,
-                    "reason_codes": [],
-                    "max_queries": 0,
-                    "max_sources_per_query": 0,
-                    "search_depth": "basic",
-                    "topic": "general",
-                }
-            )
-        elif "Web Grounding QueryPlanner agent" in system:
-            content = json.dumps({"queries": [], "must_have_evidence": [], "stop_conditions": []})
-        elif "Web Grounding EvidenceSynthesizer agent" in system:
-            content = json.dumps(
-                {
-                    "key_points": [],
-                    "norms_and_expectations": [],
-                    "constraints_and_rules": [],
-                    "disputed_or_uncertain": [],
-                    "what_to_ask_user": [],
-                }
-            )
-        elif "Entity Proposer agent" in system:
-            content = json.dumps({"entity_ids": [], "rationale": "No existing entities."})
-        elif "Visibility Agent" in system:
-            content = json.dumps({"visible_fact_ids": [], "rationale": "No visible facts yet."})
-        elif "Premium Coaching agent" in system:
-            content = json.dumps(
-                {
-                    "suggestions": [{"reply": "A", "text": "Ask a clarifying question.", "intent": "clarify"}],
-                    "strategy": {"anchoring": "Start high.", "concessions": "Small steps.", "questions": "Learn goals.", "red_lines": "Know limits."},
-                    "critique": "Clear message.",
-                    "scenario_branches": [{"label": "Agree", "next_step": "Confirm details."}],
-                    "after_action_report": "Reflect on outcomes.",
-                }
-            )
-        elif "Session Recap agent" in system:
-            content = json.dumps({"recap": "You discussed the negotiation.", "after_action_report": "Review your approach."})
-        elif "Extract atomic facts" in system:
-            content = json.dumps({"facts": []})
-        else:
-            content = "Sure, let's talk."
-        return {"choices": [{"message": {"content": content}}]}
-
-    monkeypatch.setattr(
-        "negot.core.services.orchestrator.acompletion_with_retry",
-        _fake_acompletion_with_retry,
-    )
-    monkeypatch.setattr(
-        "negot.core.services.question_planner.acompletion_with_retry",
-        _fake_acompletion_with_retry,
-    )
-    monkeypatch.setattr(
-        "negot.core.services.templates.acompletion_with_retry",
-        _fake_acompletion_with_retry,
-    )
-    monkeypatch.setattr(
-        "negot.core.services.web_grounding.acompletion_with_retry",
-        _fake_acompletion_with_retry,
-    )
-    monkeypatch.setattr(
-        "negot.core.services.kg.acompletion_with_retry",
-        _fake_acompletion_with_retry,
-    )
-    monkeypatch.setattr(
-        "negot.core.services.sessions.acompletion_with_retry",
-        _fake_acompletion_with_retry,
+# Canned replies keyed by a marker in each agent's system prompt, serialised once at import.
+_LLM_RESPONSES: list[tuple[str, str]] = [
+    ("Intake Question Agent", json.dumps({"questions": ["Who are you negotiating with?"]})),
+    (
+        "Template Router agent",
+        json.dumps(
+            {
+                "template_id": "salary_offer",
+                "confidence": 0.9,
+                "rationale": "Matches salary topic.",
+            }
+        ),
+    ),
+    (
+        "Web Grounding NeedSearch agent",
+        json.dumps(
+            {
+                "need_search": False,
+                "reason_codes": [],
+                "max_queries": 0,
+                "max_sources_per_query": 0,
+                "search_depth": "basic",
+                "topic": "general",
+            }
+        ),
+    ),
+    (
+        "Web Grounding QueryPlanner agent",
+        json.dumps({"queries": [], "must_have_evidence": [], "stop_conditions": []}),
+    ),
+    (
+        "Web Grounding EvidenceSynthesizer agent",
+        json.dumps(
+            {
+                "key_points": [],
+                "norms_and_expectations": [],
+                "constraints_and_rules": [],
+                "disputed_or_uncertain": [],
+                "what_to_ask_user": [],
+            }
+        ),
+    ),
+    (
+        "Entity Proposer agent",
+        json.dumps({"entity_ids": [], "rationale": "No existing entities."}),
+    ),
+    (
+        "Visibility Agent",
+        json.dumps({"visible_fact_ids": [], "rationale": "No visible facts yet."}),
+    ),
+    (
+        "Premium Coaching agent",
+        json.dumps(
+            {
+                "suggestions": [
+                    {"reply": "A", "text": "Ask a clarifying question.", "intent": "clarify"}
+                ],
+                "strategy": {
+                    "anchoring": "Start high.",
+                    "concessions": "Small steps.",
+                    "questions": "Learn goals.",
+                    "red_lines": "Know limits.",
+                },
+                "critique": "Clear message.",
+                "scenario_branches": [{"label": "Agree", "next_step": "Confirm details."}],
+                "after_action_report": "Reflect on outcomes.",
+            }
+        ),
+    ),
+    (
+        "Session Recap agent",
+        json.dumps(
+            {
+                "recap": "You discussed the negotiation.",
+                "after_action_report": "Review your approach.",
+            }
+        ),
+    ),
+    ("Extract atomic facts", json.dumps({"facts": []})),
+]
+_DEFAULT_LLM_RESPONSE = "Sure, let's talk."
+_STREAM_CHUNKS = (
+    {"choices": [{"delta": {"content": "Hello"}}]},
+    {"choices": [{"delta": {"content": " there"}}]},
+)
+
+
+async def _fake_acompletion_with_retry(**kwargs):  # type: ignore[no-untyped-def]
+    if kwargs.get("stream"):
+        async def _stream():
+            for chunk in _STREAM_CHUNKS:
+                yield chunk
+        return _stream()
+    messages = kwargs.get("messages") or []
+    system = messages[0]["content"] if messages else ""
+    content = next(
+        (reply for marker, reply in _LLM_RESPONSES if marker in system), _DEFAULT_LLM_RESPONSE
     )
-    monkeypatch.setattr(
-        "negot.core.services.entity_proposer.acompletion_with_retry",
-        _fake_acompletion_with_retry,
+    return {"choices": [{"message": {"content": content}}]}
+
+
+# Every service module that imports acompletion_with_retry from llm_utils by name.
+_LLM_CALLERS = tuple(
+    f"negot.core.services.{name}"
+    for name in (
+        "case_snapshots",
+        "entity_proposer",
+        "kg",
+        "orchestrator",
+        "question_planner",
+        "route_generator",
+        "sessions",
+        "strategy_executor",
+        "strategy_selector",
+        "templates",
+        "web_grounding",
     )
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_llm() -> Iterator[None]:
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for module in _LLM_CALLERS:
+            monkeypatch.setattr(f"{module}.acompletion_with_retry", _fake_acompletion_with_retry)
+        yield
+
+
+# Request headers and bodies are built once and sent as-is by every call.
+_USER_1_HEADERS = {"X-User-Id": "1", "Content-Type": "application/json"}
+_SALARY_SESSION_BODY = json.dumps({"topic_text": "I want to negotiate my salary"}).encode()
+_COMPENSATION_MESSAGE_BODY = json.dumps(
+    {"content": "I'd like to discuss my compensation."}
+).encode()
+_NO_DECISIONS_BODY = json.dumps({"decisions": []}).encode()
 
 
 async def _post_message_stream(
     client: AsyncClient,
     session_id: int,
-    payload: dict,
-    user_id: str,
-) -> list[tuple[str, str]]:
-    events: list[tuple[str, str]] = []
-    buffer = ""
+    body: bytes,
+    headers: dict[str, str],
+) -> AsyncIterator[tuple[str, str]]:
+    """Yield ``(event, data)`` pairs as soon as each SSE frame arrives."""
+    pending = bytearray()
     async with client.stream(
         "POST",
         f"/sessions/{session_id}/messages",
-        json=payload,
-        headers={"X-User-Id": user_id},
+        content=body,
+        headers=headers,
     ) as res:
         assert res.status_code == 200
-        async for chunk in res.aiter_text():
-            buffer += chunk
-    for block in buffer.split("\n\n"):
-        if not block.strip():
-            continue
-        event = ""
-        data = ""
-        for line in block.splitlines():
-            if line.startswith("event:"):
-                event = line[len("event:"):].strip()
-            elif line.startswith("data:"):
-                data = line[len("data:"):].strip()
-        if event:
-            events.append((event, data))
-    return events
-
-
-@pytest.fixture()
+        # SSE framing is ASCII, so frames are cut from raw bytes and only payloads decoded.
+        async for chunk in res.aiter_bytes():
+            pending.extend(chunk)
+            end = pending.find(b"\n\n")
+            while end != -1:
+                frame = _parse_sse_frame(bytes(pending[:end]))
+                del pending[: end + 2]
+                if frame:
+                    yield frame
+                end = pending.find(b"\n\n")
+    frame = _parse_sse_frame(bytes(pending))
+    if frame:
+        yield frame
+
+
+def _parse_sse_frame(block: bytes) -> Optional[tuple[str, str]]:
+    event = ""
+    data = ""
+    for line in block.splitlines():
+        if line.startswith(b"event:"):
+            event = line[len(b"event:"):].strip().decode("ascii")
+        elif line.startswith(b"data:"):
+            data = line[len(b"data:"):].strip().decode("utf-8")
+    return (event, data) if event else None
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def app() -> FastAPI:
-    """Create and initialise the FastAPI app for testing."""
+    """Create and initialise the FastAPI app once for the whole test session."""
     application = create_app()
     # Initialise DB schema
     await init_db_schema()
     return application
 
 
-@pytest.mark.asyncio
-async def test_create_session_and_message_flow(app: FastAPI) -> None:
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        # Create a session with a salary negotiation topic
-        res = await client.post("/sessions", json={"topic_text": "I want to negotiate my salary"}, headers={"X-User-Id": "1"})
-        assert res.status_code == 200
-        data = res.json()
-        assert "session_id" in data
-        session_id = data["session_id"]
-        # Post a message
-        events = await _post_message_stream(
-            client,
-            session_id,
-            {"content": "I'd like to discuss my compensation."},
-            "1",
-        )
-        done_payload = next(data for event, data in events if event == "done")
-        msg_data = json.loads(done_payload)
-        assert msg_data.get("counterparty_message") is not None
-        # End the session
-        res3 = await client.post(f"/sessions/{session_id}/end", headers={"X-User-Id": "1"})
-        assert res3.status_code == 200
-        recap = res3.json()
-        assert "recap" in recap
-
-
-@pytest.mark.asyncio
-async def test_memory_review(app: FastAPI) -> None:
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def clean_tables(app: FastAPI) -> None:
+    """Empty every table before each test; the schema itself is created once per session."""
+    async with get_engine().begin() as conn:
+        # SQLite leaves foreign keys unenforced here, so deletion order does not matter.
+        for table in Base.metadata.tables.values():
+            await conn.execute(table.delete())
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    """One pooled client over the ASGI app, shared by every test."""
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        res = await client.post("/sessions", json={"topic_text": "test"}, headers={"X-User-Id": "2"})
-        session_id = res.json()["session_id"]
-        # Post a message that yields no facts
-        await _post_message_stream(
-            client,
-            session_id,
-            {"content": "Hello"},
-            "2",
-        )
-        # End session
-        await client.post(f"/sessions/{session_id}/end", headers={"X-User-Id": "2"})
-        # Memory review with no facts
-        res2 = await client.post(
-            f"/sessions/{session_id}/memory-review",
-            json={"decisions": []},
-            headers={"X-User-Id": "2"},
-        )
-        assert res2.status_code == 200
-        assert res2.json()["updated_facts"] == []
+        yield client
+
+
+async def _create_session(client: AsyncClient, body: bytes, headers: dict[str, str]) -> int:
+    res = await client.post("/sessions", content=body, headers=headers)
+    assert res.status_code == 200
+    data = res.json()
+    assert "session_id" in data
+    return data["session_id"]
+
+
+async def _post_message_until_done(
+    client: AsyncClient, session_id: int, body: bytes, headers: dict[str, str]
+) -> dict:
+    """Post a message and return the ``done`` payload, leaving the stream once it arrives."""
+    async with aclosing(_post_message_stream(client, session_id, body, headers)) as events:
+        async for event, payload in events:
+            if event == "done":
+                return json.loads(payload)
+    raise AssertionError("Message stream ended without a done event.")
+
+
+async def test_create_session_and_message_flow(client: AsyncClient) -> None:
+    # Create a session with a salary negotiation topic
+    session_id = await _create_session(client, _SALARY_SESSION_BODY, _USER_1_HEADERS)
+    # Post a message
+    msg_data = await _post_message_until_done(
+        client, session_id, _COMPENSATION_MESSAGE_BODY, _USER_1_HEADERS
+    )
+    assert msg_data.get("counterparty_message") is not None
+    # End the session
+    res3 = await client.post(f"/sessions/{session_id}/end", headers=_USER_1_HEADERS)
+    assert res3.status_code == 200
+    recap = res3.json()
+    assert "recap" in recap
+    # Memory review runs on the ended session; the message yielded no facts to decide on
+    res4 = await client.post(
+        f"/sessions/{session_id}/memory-review",
+        content=_NO_DECISIONS_BODY,
+        headers=_USER_1_HEADERS,
+    )
+    assert res4.status_code == 200
+    assert res4.json()["updated_facts"] == []
@@ -0,0 +1,69 @@
+"""
+Tests for the Tavily search client in the web grounding service.
+
+Tavily is replaced by an ``httpx.MockTransport`` so the tests can check the
+shape of the outgoing request without reaching the network.
+"""
+import json
+from typing import Iterator
+
+import httpx
+import pytest
+
+from negot.core.config import get_settings
+from negot.core.services import web_grounding
+
+
+@pytest.fixture
+def tavily_settings(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Configure a Tavily key and start from an empty search cache."""
+    monkeypatch.setenv("TAVILY_API_KEY", "tvly-test-key")
+    monkeypatch.setenv("TAVILY_SEARCH_DEPTH", "advanced")
+    get_settings.cache_clear()
+    web_grounding._CACHE.clear()
+    yield
+    web_grounding._CACHE.clear()
+    get_settings.cache_clear()
+
+
+async def test_run_search_posts_json_with_bearer_auth(
+    tavily_settings: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"url": "https://example.com", "title": "Example", "content": "Snippet."}
+                ]
+            },
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(web_grounding, "_get_http_client", lambda: client)
+    try:
+        results = await web_grounding.run_search(["Salary bands 2025"])
+    finally:
+        await client.aclose()
+
+    assert results == [{"url": "https://example.com", "title": "Example", "snippet": "Snippet."}]
+    assert len(requests) == 1
+    request = requests[0]
+    assert request.method == "POST"
+    assert str(request.url) == web_grounding.TAVILY_SEARCH_URL
+    assert not request.url.query
+    assert request.headers["Authorization"] == "Bearer tvly-test-key"
+    assert request.headers["Content-Type"] == "application/json"
+    body = json.loads(request.content)
+    settings = get_settings()
+    assert body == {
+        "query": "Salary bands 2025",
+        "search_depth": "advanced",
+        "max_results": settings.tavily_max_results,
+        "include_answer": False,
+        "include_raw_content": False,
+    }
+    assert "api_key" not in body